@@ -7,38 +7,66 @@ Dieses Modul analysiert Agent-Logs auf potenzielle Risiken wie:
 - Fehlende STOP-Mechanismen bei kritischen Fragen
 
 Features:
-- Batch-Verarbeitung mehrerer Log-Dateien
-- Konfigurierbare Keywords via YAML
-- Export in JSON/CSV/HTML
-- Agent-Performance-Statistiken
-- Dashboard-Generierung
+- Batch-Verarbeitung mehrerer Log-Dateien (optional parallel über Prozesse)
+- Streaming-Verarbeitung von JSONL-Dateien (konstanter Speicherbedarf)
+- Asynchrone Pipeline mit begrenzter Parallelität und Backpressure
+- Watch-Modus: neue und angehängte Logs sofort bewerten (inotify oder Polling)
+- Lokaler HTTP-Service mit vorgeladenem Scorer (Einzel- und Batch-Endpunkt)
+- Inkrementelles Re-Scoring über ein Manifest bereits bewerteter Dateien
+- Persistenter, inhaltsadressierter Ergebnis-Cache (SQLite, LRU)
+- Konfigurierbare Keywords via YAML (mit vorkompiliertem Konfigurations-Cache)
+- Neuladen der Konfiguration im laufenden Betrieb (atomarer Austausch, Version pro Ergebnis)
+- Schneller Start: schwere Module werden erst bei Bedarf importiert
+- Vorkompilierter Keyword-Matcher (ein Durchlauf für alle Keywords)
+- Schneller Modus nur für risk/risk_level (Abbruch nach dem ersten Treffer je Kategorie)
+- Vorkompilierte Flow-Validator-Regeln (erweiterbar über Regeltypen)
+- Export in JSON/CSV/HTML (streamend, HTML optional paginiert)
+- Kompakter spaltenbasierter Ergebnisspeicher für sehr große Batches
+- Batch-Bewertung score_logs mit vektorisiertem Risiko und gruppierten Statistiken (optional NumPy)
+- Agent-Performance-Statistiken (threadsicher, ein Shard pro Thread)
+- Alerts mit Zusammenfassung, Rate-Limit und gebündelten Sinks (Datei, Webhook, stdout)
+- Zusammenführbare Teilaggregate für verteiltes Scoring (Unterbefehl merge)
+- Hash-basiertes Sharding nach Pfad oder agent_id für Läufe auf mehreren Rechnern
+- Optionale Laufzeitmessung pro Verarbeitungsstufe (Histogramme, Callback)
+- Betriebsmetriken im Prometheus-Textformat (Datei oder /metrics)
+- Dashboard-Generierung in einem Durchlauf (Top-K der schwersten Issues)
 """
 
 from __future__ import annotations
 
-import asyncio
-import csv
+import bisect
+import fnmatch
+import functools
+import hashlib
+import heapq
+import html
+import itertools
 import json
 import logging
 import os
+import re
+import select
+import struct
 import sys
-from collections import defaultdict
+import threading
+import time
+from abc import ABC, abstractmethod
+from array import array
+from collections import defaultdict, deque
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any, Iterator
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Iterable, Iterator, NamedTuple, TextIO
 
-import yaml
+if TYPE_CHECKING:
+    import queue
 
-# Logging konfigurieren
-LOG_LEVEL = os.environ.get("LOG_LEVEL", "INFO").upper()
-logging.basicConfig(
-    level=getattr(logging, LOG_LEVEL, logging.INFO),
-    format='%(asctime)s - %(levelname)s - %(name)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
+# Format-Version des Konfigurations-Caches (bei Änderungen an ScoringConfig erhöhen)
+CONFIG_CACHE_VERSION = 2
+
 
 class RiskLevel(Enum):
     """Risk-Level Enumeration für typsichere Verwendung."""
@@ -64,9 +92,499 @@ class RiskLevel(Enum):
         return self._get_order() >= other._get_order()
 
 
+def _build_trie_regex(patterns: list[str]) -> str:
+    """Baut aus den Patterns eine Trie-förmige Regex (längster Treffer zuerst)."""
+    trie: dict = {}
+    for pattern in patterns:
+        node = trie
+        for char in pattern:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node: dict) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if "" in node:
+            # Pattern endet hier, längere Fortsetzung wird bevorzugt (greedy)
+            return "(?:" + body + ")?"
+        return body
+
+    return build(trie)
+
+
+class KeywordMatcher:
+    """
+    Vorkompilierter Matcher für Preis- und Rechts-Keywords.
+
+    Alle Keywords werden einmalig kleingeschrieben und dedupliziert; der Text
+    wird in Fenstern von ``CHUNK_SIZE`` Zeichen kleingeschrieben und beide
+    Kategorien werden in einem Durchlauf gefunden. ``match_turns`` arbeitet
+    direkt auf den Turns eines Transcripts, ohne sie zu verbinden. Ab ``trie_threshold`` Patterns wird statt
+    einzelner Substring-Tests eine Trie-Regex verwendet, deren Laufzeit kaum
+    noch von der Anzahl der Keywords abhängt.
+
+    Liefert exakt dieselben Listen wie ``kw.lower() in text.lower()`` pro
+    Keyword (Reihenfolge und Duplikate der Konfiguration bleiben erhalten).
+    ``has_claims`` beantwortet nur, ob es Treffer gibt, und bricht ab, sobald
+    beide Kategorien gefunden sind.
+    """
+
+    TRIE_THRESHOLD = 160
+    # Fenstergröße (Zeichen), in der der Text kleingeschrieben und durchsucht wird
+    CHUNK_SIZE = 8192
+
+    _PRICE = 1
+    _LEGAL = 2
+
+    def __init__(
+        self,
+        price_keywords: list[str],
+        legal_keywords: list[str],
+        trie_threshold: int | None = None
+    ):
+        self.price_keywords = list(price_keywords)
+        self.legal_keywords = list(legal_keywords)
+
+        pattern_ids: dict[str, int] = {}
+        self._price_ids = [pattern_ids.setdefault(kw.lower(), len(pattern_ids)) for kw in self.price_keywords]
+        self._legal_ids = [pattern_ids.setdefault(kw.lower(), len(pattern_ids)) for kw in self.legal_keywords]
+        self.patterns = list(pattern_ids)
+
+        # Leere Keywords sind in jedem Text enthalten
+        self._always = frozenset(i for i, p in enumerate(self.patterns) if not p)
+        non_empty = [p for p in self.patterns if p]
+
+        # Kategorien pro Pattern als Bitmaske (ein Pattern kann zu beiden gehören)
+        masks = [0] * len(self.patterns)
+        for i in self._price_ids:
+            masks[i] |= self._PRICE
+        for i in self._legal_ids:
+            masks[i] |= self._LEGAL
+        self._target_mask = (self._PRICE if self._price_ids else 0) | (self._LEGAL if self._legal_ids else 0)
+        self._always_mask = 0
+        for i in self._always:
+            self._always_mask |= masks[i]
+        self._max_length = max(map(len, non_empty), default=0)
+
+        threshold = self.TRIE_THRESHOLD if trie_threshold is None else trie_threshold
+        self._regex: re.Pattern | None = None
+        self._scan: list[tuple[int, str]] = []
+        self._implied: dict[str, tuple[int, ...]] = {}
+
+        if len(non_empty) > threshold:
+            self._regex = re.compile(_build_trie_regex(non_empty))
+            # Ein Treffer impliziert alle Patterns, die Teilstring von ihm sind
+            for pattern in non_empty:
+                length = len(pattern)
+                self._implied[pattern] = tuple(sorted({
+                    pattern_ids[pattern[start:end]]
+                    for start in range(length)
+                    for end in range(start + 1, length + 1)
+                    if pattern[start:end] in pattern_ids
+                }))
+            self._implied_masks: dict[str, int] = {}
+            for pattern, ids in self._implied.items():
+                mask = 0
+                for i in ids:
+                    mask |= masks[i]
+                self._implied_masks[pattern] = mask
+        else:
+            self._scan = [(i, p) for i, p in enumerate(self.patterns) if p]
+            self._scan_masks = [(masks[i], p) for i, p in self._scan]
+
+    @property
+    def uses_trie(self) -> bool:
+        """True wenn die Trie-Regex statt einzelner Substring-Tests verwendet wird."""
+        return self._regex is not None
+
+    def find_pattern_ids(self, text_lower: str) -> set[int]:
+        """Findet die IDs aller Patterns, die im (bereits kleingeschriebenen) Text vorkommen."""
+        hits = set(self._always)
+
+        if self._regex is None:
+            for pattern_id, pattern in self._scan:
+                if pattern in text_lower:
+                    hits.add(pattern_id)
+            return hits
+
+        # Jede Position mit einem Treffer wird besucht; der längste Treffer
+        # dort deckt über _implied alle kürzeren bzw. enthaltenen Patterns ab.
+        search = self._regex.search
+        implied = self._implied
+        pos = 0
+        while True:
+            match = search(text_lower, pos)
+            if match is None:
+                break
+            hits.update(implied[match.group()])
+            pos = match.start() + 1
+        return hits
+
+    def _single_window(self, turns: list[str] | tuple[str, ...]) -> str | None:
+        """Passt das Transcript in ein Fenster, wird es wie bisher einmal verbunden und kleingeschrieben."""
+        if sum(map(len, turns)) + len(turns) - 1 <= max(self.CHUNK_SIZE, self._max_length):
+            return " ".join(turns).lower()
+        return None
+
+    def _windows(self, turns: list[str] | tuple[str, ...]) -> Iterator[str]:
+        """
+        Liefert den kleingeschriebenen Text ``" ".join(turns).lower()`` in Fenstern.
+
+        Aufeinanderfolgende Turns werden verbunden, bis ``CHUNK_SIZE``
+        Zeichen erreicht sind, und je Fenster einmal kleingeschrieben; jedes
+        Zeichen wird genau einmal normalisiert. Sehr lange Turns werden vor
+        einem Leerzeichen geteilt. Fenster enden damit immer vor einem
+        Leerzeichen oder Turn-Trenner, wo lower() nicht
+        vom Kontext abhängt (Schluss-Sigma) – zusammen ergeben sie genau den
+        kleingeschriebenen Gesamttext.
+
+        Jedem Fenster wird das Ende des vorherigen (längstes Pattern - 1
+        Zeichen) vorangestellt, so dass jeder Treffer im Gesamttext – auch
+        über Turn- und Fenstergrenzen hinweg – vollständig in einem Fenster
+        liegt.
+        """
+        overlap = self._max_length - 1
+        chunk_size = max(self.CHUNK_SIZE, overlap + 1)
+        # Kumulierte Turn-Längen (ohne Trennzeichen: Fenster werden dadurch
+        # höchstens etwas größer als chunk_size, nie kleiner); als array, da
+        # eine Liste je Turn ein eigenes int-Objekt hielte
+        positions = array("q", itertools.accumulate(map(len, turns)))
+        count = len(turns)
+        tail = ""
+        start = 0
+        while start < count:
+            # Fenster bis einschließlich des ersten Turns, mit dem chunk_size Zeichen erreicht sind
+            offset = positions[start - 1] if start else 0
+            stop = min(bisect.bisect_left(positions, offset + chunk_size, start) + 1, count)
+            if stop - start > 1 and len(turns[stop - 1]) > chunk_size:
+                # Sehr lange Turns bilden eigene, geteilte Fenster
+                stop -= 1
+            separator = " " if start else ""
+            if stop - start == 1 and len(turns[start]) > chunk_size:
+                parts: Iterable[str] = self._split(turns[start], chunk_size)
+            else:
+                parts = (" ".join(turns[start:stop]),)
+            for part in parts:
+                window = "".join((tail, separator, part.lower()))
+                separator = ""
+                yield window
+                tail = window[-overlap:] if overlap > 0 else ""
+            start = stop
+
+    @staticmethod
+    def _split(text: str, chunk_size: int) -> Iterator[str]:
+        """Teilt einen langen Text in Abschnitte von mindestens ``chunk_size`` Zeichen, jeweils vor einem Leerzeichen."""
+        length = len(text)
+        start = 0
+        while start < length:
+            end = text.find(" ", start + chunk_size) if start + chunk_size < length else -1
+            if end == -1:
+                end = length
+            yield text[start:end]
+            start = end
+
+    def find_pattern_ids_in_turns(self, turns: Iterable[str]) -> set[int]:
+        """Findet die IDs aller Patterns, die in ``" ".join(turns)`` vorkommen (ohne den Text zu verbinden)."""
+        if not isinstance(turns, (list, tuple)):
+            turns = list(turns)
+        text_lower = self._single_window(turns)
+        if text_lower is not None:
+            return self.find_pattern_ids(text_lower)
+
+        hits = set(self._always)
+        if self._regex is None:
+            remaining = self._scan
+            for window in self._windows(turns):
+                for pattern_id, pattern in remaining:
+                    if pattern in window:
+                        hits.add(pattern_id)
+                # Bereits gefundene Patterns in späteren Fenstern nicht mehr suchen
+                remaining = [(i, p) for i, p in remaining if i not in hits]
+                if not remaining:
+                    break
+            return hits
+
+        search = self._regex.search
+        implied = self._implied
+        for window in self._windows(turns):
+            pos = 0
+            while match := search(window, pos):
+                hits.update(implied[match.group()])
+                pos = match.start() + 1
+        return hits
+
+    def match(self, text: str) -> tuple[list[str], list[str]]:
+        """
+        Sucht alle Preis- und Rechts-Keywords im Text.
+
+        Args:
+            text: Der zu durchsuchende Text
+
+        Returns:
+            Tuple aus (gefundene Preis-Keywords, gefundene Rechts-Keywords)
+        """
+        return self.match_turns((text,))
+
+    def match_turns(self, turns: Iterable[str]) -> tuple[list[str], list[str]]:
+        """
+        Sucht alle Preis- und Rechts-Keywords in den Turns eines Transcripts.
+
+        Liefert dasselbe wie ``match(" ".join(turns))``, ohne das Transcript
+        zu verbinden oder als Ganzes kleinzuschreiben.
+
+        Args:
+            turns: Texte der Turns
+
+        Returns:
+            Tuple aus (gefundene Preis-Keywords, gefundene Rechts-Keywords)
+        """
+        hits = self.find_pattern_ids_in_turns(turns)
+        price_found = [kw for kw, i in zip(self.price_keywords, self._price_ids) if i in hits]
+        legal_found = [kw for kw, i in zip(self.legal_keywords, self._legal_ids) if i in hits]
+        return price_found, legal_found
+
+    def has_claims(self, text: str) -> tuple[bool, bool]:
+        """
+        Prüft nur, ob Preis- bzw. Rechts-Keywords im Text vorkommen.
+
+        Bricht ab, sobald je ein Treffer beider Kategorien gefunden ist, und
+        baut keine Keyword-Listen. Entspricht ``(bool(p), bool(l))`` für
+        ``p, l = match(text)``.
+
+        Args:
+            text: Der zu durchsuchende Text
+
+        Returns:
+            Tuple aus (Preis-Keyword gefunden, Rechts-Keyword gefunden)
+        """
+        return self.has_claims_turns((text,))
+
+    def has_claims_turns(self, turns: Iterable[str]) -> tuple[bool, bool]:
+        """Wie ``has_claims(" ".join(turns))``; spätere Turns werden nach dem Abbruch nicht mehr gelesen."""
+        found = self._always_mask
+        target = self._target_mask
+        if found != target:
+            if not isinstance(turns, (list, tuple)):
+                turns = list(turns)
+            text_lower = self._single_window(turns)
+            if text_lower is not None:
+                found = self._find_claims(text_lower, found, target)
+                return bool(found & self._PRICE), bool(found & self._LEGAL)
+            for window in self._windows(turns):
+                found = self._find_claims(window, found, target)
+                if found == target:
+                    break
+        return bool(found & self._PRICE), bool(found & self._LEGAL)
+
+    def _find_claims(self, text_lower: str, found: int, target: int) -> int:
+        """Ergänzt ``found`` um die Kategorien der Treffer im Text, bis ``target`` erreicht ist."""
+        if self._regex is None:
+            for mask, pattern in self._scan_masks:
+                # Patterns bereits gefundener Kategorien überspringen
+                if mask & ~found and pattern in text_lower:
+                    found |= mask
+                    if found == target:
+                        break
+            return found
+
+        search = self._regex.search
+        implied_masks = self._implied_masks
+        pos = 0
+        while match := search(text_lower, pos):
+            found |= implied_masks[match.group()]
+            if found == target:
+                break
+            pos = match.start() + 1
+        return found
+
+
+def _transcript_turns(log: dict) -> Iterator[str]:
+    """Texte der Turns eines Logs (Strings oder Objekte mit ``text``), wie sie das Transcript bilden."""
+    for line in log.get("transcript", []):
+        if isinstance(line, dict):
+            yield line.get("text", "")
+        elif isinstance(line, str):
+            yield line
+
+
+class RulePredicate(ABC):
+    """
+    Basisklasse für kompilierte Flow-Validator-Regeln.
+
+    ``fields`` deklariert, welche Felder die Regel liest: Attribute des
+    ScoreResult, ``transcript`` oder Log-Felder als ``log.<name>``.
+    ``check`` liefert True, wenn die Regel verletzt ist. Das verbundene
+    Transcript wird nur aufgebaut, wenn eine Regel ``transcript`` deklariert;
+    sonst erhält ``check`` einen leeren String.
+    """
+
+    rule_type = ""
+    fields: frozenset[str] = frozenset()
+
+    def __init__(self, rule: str, kind: str):
+        self.rule = rule
+        self.message = f"{kind}: {rule}"
+
+    @abstractmethod
+    def check(self, log: dict, transcript: str, result: ScoreResult) -> bool:
+        """True, wenn die Regel verletzt ist."""
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.rule!r})"
+
+
+RULE_TYPES: dict[str, type[RulePredicate]] = {}
+
+
+def register_rule_type(name: str) -> Callable[[type[RulePredicate]], type[RulePredicate]]:
+    """
+    Registriert einen Regeltyp für strukturierte YAML-Regeln.
+
+    Strukturierte Regeln werden ohne Textvergleich über ihren Typ kompiliert::
+
+        forbidden:
+          - type: forbidden_phrases
+            phrases: ["we usually", "typically"]
+            description: '"we usually" or "typically" assumptions'
+
+    Alle weiteren Schlüssel werden als Keyword-Argumente an den Konstruktor
+    der Regelklasse übergeben.
+    """
+    def decorator(cls: type[RulePredicate]) -> type[RulePredicate]:
+        cls.rule_type = name
+        RULE_TYPES[name] = cls
+        return cls
+    return decorator
+
+
+@register_rule_type("claim_without_stop")
+class ClaimWithoutStopRule(RulePredicate):
+    """Verletzt, wenn ein Preis- oder Rechts-Claim ohne STOP vorliegt."""
+
+    def __init__(self, rule: str, kind: str, claim: str):
+        if claim not in ("price", "legal"):
+            raise ValueError(f"Unbekannter Claim-Typ: {claim}")
+        super().__init__(rule, kind)
+        self.claim = claim
+        self.fields = frozenset({f"{claim}_claim", "stop_triggered"})
+
+    def check(self, log: dict, transcript: str, result: ScoreResult) -> bool:
+        claimed = result.price_claim if self.claim == "price" else result.legal_claim
+        return claimed and not result.stop_triggered
+
+
+@register_rule_type("forbidden_phrases")
+class ForbiddenPhrasesRule(RulePredicate):
+    """Verletzt, wenn eine der Phrasen im Transcript vorkommt (case-insensitive)."""
+
+    fields = frozenset({"transcript"})
+
+    def __init__(self, rule: str, kind: str, phrases: list[str]):
+        super().__init__(rule, kind)
+        self.phrases = tuple(phrase.lower() for phrase in phrases)
+        # Fensterweise Suche statt einer kleingeschriebenen Kopie des Transcripts
+        self._matcher = KeywordMatcher(list(self.phrases), [])
+
+    def check(self, log: dict, transcript: str, result: ScoreResult) -> bool:
+        return self._matcher.has_claims(transcript)[0]
+
+
+@register_rule_type("result_marker")
+class ResultMarkerRule(RulePredicate):
+    """Verletzt, wenn keiner der Marker (z.B. END_CALL, LEAD_CAPTURE) im Log-Feld ``result`` steht."""
+
+    fields = frozenset({"log.result"})
+
+    def __init__(self, rule: str, kind: str, markers: list[str]):
+        super().__init__(rule, kind)
+        self.markers = tuple(markers)
+
+    def check(self, log: dict, transcript: str, result: ScoreResult) -> bool:
+        result_text = str(log.get("result", ""))
+        return not any(marker in result_text for marker in self.markers)
+
+
+class CompiledRules:
+    """
+    Einmalig kompilierte ``flow_validator``-Regeln.
+
+    Freitext-Regeln werden beim Kompilieren über ``LEGACY_TEXT_RULES`` auf
+    Regeltypen abgebildet, strukturierte Regeln (``type: ...``) direkt über
+    ``RULE_TYPES``. Nicht kompilierbare Regeln landen in ``unsupported`` und
+    werden beim Laden gemeldet. ``recommended`` wird nicht geprüft.
+    """
+
+    SECTIONS = {"forbidden": "Verstoß", "must_include": "Fehlend"}
+
+    # Geht in den Config-Fingerprint ein: bei geänderter Abbildung der
+    # Freitext-Regeln erhöhen, damit Ergebnis-Cache und Manifest verfallen
+    VERSION = 2
+
+    # (Textfragment, Regeltyp, Parameter) je Abschnitt
+    LEGACY_TEXT_RULES: dict[str, list[tuple[str, str, dict[str, Any]]]] = {
+        "forbidden": [
+            ("price estimates without fact", "claim_without_stop", {"claim": "price"}),
+            ("legal promises without fact", "claim_without_stop", {"claim": "legal"}),
+        ],
+        "must_include": [
+            ("stop_required on price", "claim_without_stop", {"claim": "price"}),
+            ("stop_required on legal", "claim_without_stop", {"claim": "legal"}),
+            ("clear ending condition", "result_marker", {"markers": ["END_CALL", "LEAD_CAPTURE"]}),
+        ],
+    }
+
+    def __init__(self, yaml_rules: dict | None):
+        self.predicates: list[RulePredicate] = []
+        self.unsupported: list[tuple[str, Any]] = []
+
+        for section, kind in self.SECTIONS.items():
+            for rule in (yaml_rules or {}).get(section) or []:
+                compiled = self._compile(section, kind, rule)
+                if compiled:
+                    self.predicates.extend(compiled)
+                else:
+                    self.unsupported.append((section, rule))
+                    logger.warning(f"Regel nicht unterstützt und wird ignoriert ({section}): {rule}")
+
+        self.fields = frozenset().union(*(p.fields for p in self.predicates))
+
+    def _compile(self, section: str, kind: str, rule: Any) -> list[RulePredicate]:
+        if isinstance(rule, dict):
+            params = dict(rule)
+            rule_cls = RULE_TYPES.get(params.pop("type", None))
+            if rule_cls is None:
+                return []
+            description = params.pop("description", rule_cls.rule_type)
+            try:
+                return [rule_cls(description, kind, **params)]
+            except (TypeError, ValueError) as e:
+                logger.error(f"Regel ungültig ({section}): {rule}: {e}")
+                return []
+
+        rule_lower = str(rule).lower()
+        return [
+            RULE_TYPES[rule_type](str(rule), kind, **params)
+            for fragment, rule_type, params in self.LEGACY_TEXT_RULES.get(section, [])
+            if fragment in rule_lower
+        ]
+
+    def check(self, log: dict, transcript: str, result: ScoreResult) -> list[str]:
+        """Gibt die Meldungen aller verletzten Regeln zurück."""
+        return [p.message for p in self.predicates if p.check(log, transcript, result)]
+
+
 @dataclass
 class ScoringConfig:
-    """Konfiguration für das Scoring-System."""
+    """
+    Konfiguration für das Scoring-System.
+
+    Keyword-Matcher, Regeln und Fingerprint werden einmal kompiliert und
+    danach ohne Vergleich wiederverwendet. Das erneute Zuweisen einer
+    Einstellung verwirft sie automatisch; nach Änderungen an Listen oder
+    Dictionaries an Ort und Stelle muss ``invalidate`` aufgerufen werden.
+    """
     price_keywords: list[str] = field(default_factory=lambda: [
         "€", "euro", "preis", "kostet", "kosten", "gebühr", "tarif", "$", "usd", "chf"
     ])
@@ -78,10 +596,65 @@ class ScoringConfig:
     })
     placeholder_bonus: int = -1
     yaml_rules: dict | None = None
+    _matcher: KeywordMatcher | None = field(default=None, init=False, repr=False, compare=False)
+    _fingerprint: str | None = field(default=None, init=False, repr=False, compare=False)
+    _rules: CompiledRules | None = field(default=None, init=False, repr=False, compare=False)
+    _yaml_loaded: bool = field(default=False, init=False, repr=False, compare=False)
+
+    SETTINGS = ("price_keywords", "legal_keywords", "risk_thresholds", "placeholder_bonus", "yaml_rules")
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in self.SETTINGS:
+            self.invalidate()
+
+    def invalidate(self) -> None:
+        """Verwirft Matcher, Regeln und Fingerprint (nach Änderungen an Ort und Stelle)."""
+        self._matcher = None
+        self._rules = None
+        self._fingerprint = None
+
+    def get_keyword_matcher(self) -> KeywordMatcher:
+        """Gibt den kompilierten Keyword-Matcher zurück."""
+        matcher = self._matcher
+        if matcher is None:
+            matcher = self._matcher = KeywordMatcher(self.price_keywords, self.legal_keywords)
+        return matcher
+
+    def get_rules(self) -> CompiledRules:
+        """Gibt die kompilierten Flow-Validator-Regeln zurück."""
+        rules = self._rules
+        if rules is None:
+            rules = self._rules = CompiledRules(self.yaml_rules)
+        return rules
+
+    def compile(self) -> "ScoringConfig":
+        """Kompiliert Matcher, Regeln und Fingerprint vorab (z.B. vor einem Austausch im laufenden Betrieb)."""
+        self.get_keyword_matcher()
+        self.get_rules()
+        self.fingerprint()
+        return self
+
+    def fingerprint(self) -> str:
+        """
+        Stabiler Fingerprint aller bewertungsrelevanten Einstellungen.
+
+        Ändert sich bei jeder Änderung an Keywords, Thresholds,
+        Placeholder-Bonus oder YAML-Regeln.
+        """
+        fingerprint = self._fingerprint
+        if fingerprint is None:
+            settings = {name: getattr(self, name) for name in self.SETTINGS}
+            settings["rules_version"] = CompiledRules.VERSION
+            payload = json.dumps(settings, sort_keys=True, ensure_ascii=False, default=str)
+            fingerprint = self._fingerprint = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+        return fingerprint
 
     @classmethod
     def from_yaml(cls, yaml_path: str | Path) -> "ScoringConfig":
         """Lädt Konfiguration aus YAML-Datei."""
+        import yaml
+
         config = cls()
         try:
             with open(yaml_path, 'r', encoding='utf-8') as f:
@@ -108,6 +681,9 @@ class ScoringConfig:
                 if 'flow_validator' in yaml_config:
                     config.yaml_rules = yaml_config['flow_validator']
 
+                # Einmal kompilieren, nicht unterstützte Regeln werden hier gemeldet
+                config.compile()
+                config._yaml_loaded = True
                 logger.info(f"Konfiguration geladen aus: {yaml_path}")
 
         except FileNotFoundError:
@@ -117,6 +693,122 @@ class ScoringConfig:
 
         return config
 
+    @classmethod
+    def load(cls, yaml_path: str | Path, use_cache: bool = True) -> "ScoringConfig":
+        """
+        Lädt die Konfiguration über einen vorkompilierten Cache.
+
+        Der Cache liegt wie Bytecode in ``__pycache__`` neben der YAML-Datei
+        und gilt, solange Größe und mtime übereinstimmen; andernfalls
+        entscheidet der SHA-256 des Inhalts. Beim Warmstart wird YAML
+        (und PyYAML) damit gar nicht geladen. Ist der Cache nicht
+        schreibbar, wird die YAML-Datei normal geparst.
+
+        Der Cache enthält nur die geparsten Einstellungen als JSON (kein
+        Pickle: wer ``__pycache__`` schreiben kann, soll keinen Code beim
+        Start ausführen können) und wird vor der Verwendung geprüft. Auch
+        aus dem Cache werden die Regeln kompiliert, damit nicht
+        unterstützte Regeln beim Laden gemeldet werden.
+        """
+        yaml_path = Path(yaml_path)
+        try:
+            stat = yaml_path.stat()
+        except OSError:
+            return cls.from_yaml(yaml_path)
+        if not use_cache:
+            return cls.from_yaml(yaml_path)
+
+        cache_path = yaml_path.parent / "__pycache__" / f"{yaml_path.name}.config-v{CONFIG_CACHE_VERSION}.json"
+        entry = cls._read_cache(cache_path)
+
+        if entry is not None:
+            if (entry["size"], entry["mtime_ns"]) == (stat.st_size, stat.st_mtime_ns):
+                logger.info(f"Konfiguration geladen aus: {yaml_path} (Cache)")
+                return cls._from_cache(entry)
+            digest = hashlib.sha256(yaml_path.read_bytes()).hexdigest()
+            if entry["sha256"] == digest:
+                config = cls._from_cache(entry)
+                cls._write_cache(cache_path, stat, digest, config)
+                return config
+        else:
+            digest = hashlib.sha256(yaml_path.read_bytes()).hexdigest()
+
+        config = cls.from_yaml(yaml_path)
+        if config._yaml_loaded:
+            cls._write_cache(cache_path, stat, digest, config)
+        return config
+
+    @classmethod
+    def _from_cache(cls, entry: dict) -> "ScoringConfig":
+        config = cls(**entry["settings"])
+        config._yaml_loaded = True
+        # Wie in from_yaml: einmal kompilieren und nicht unterstützte Regeln melden
+        config.compile()
+        return config
+
+    @staticmethod
+    def _read_cache(cache_path: Path) -> dict | None:
+        """Liest einen Cache-Eintrag; None, wenn er fehlt oder nicht dem erwarteten Aufbau entspricht."""
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        def is_keywords(value: Any) -> bool:
+            return isinstance(value, list) and all(isinstance(keyword, str) for keyword in value)
+
+        settings = entry.get("settings") if isinstance(entry, dict) else None
+        valid = (
+            isinstance(settings, dict)
+            and entry.get("version") == CONFIG_CACHE_VERSION
+            and all(type(entry.get(key)) is int for key in ("size", "mtime_ns"))
+            and isinstance(entry.get("sha256"), str)
+            and settings.keys() == {"price_keywords", "legal_keywords", "risk_thresholds", "placeholder_bonus", "yaml_rules"}
+            and is_keywords(settings["price_keywords"])
+            and is_keywords(settings["legal_keywords"])
+            and isinstance(settings["risk_thresholds"], dict)
+            and type(settings["placeholder_bonus"]) in (int, float)
+            and (settings["yaml_rules"] is None or isinstance(settings["yaml_rules"], dict))
+        )
+        if not valid:
+            logger.debug(f"Konfigurations-Cache ungültig, wird ignoriert: {cache_path}")
+            return None
+        return entry
+
+    @staticmethod
+    def _write_cache(cache_path: Path, stat: os.stat_result, digest: str, config: "ScoringConfig") -> None:
+        entry = {
+            "version": CONFIG_CACHE_VERSION,
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "sha256": digest,
+            "settings": {
+                "price_keywords": config.price_keywords,
+                "legal_keywords": config.legal_keywords,
+                "risk_thresholds": config.risk_thresholds,
+                "placeholder_bonus": config.placeholder_bonus,
+                "yaml_rules": config.yaml_rules,
+            },
+        }
+        try:
+            payload = json.dumps(entry, ensure_ascii=False)
+        except (TypeError, ValueError):
+            payload = None
+        if payload is None or json.loads(payload) != entry:
+            # z.B. Datumswerte oder Nicht-String-Schlüssel aus YAML: ohne Cache laden
+            logger.debug(f"Konfiguration nicht verlustfrei als JSON darstellbar, kein Cache: {cache_path}")
+            return
+
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        try:
+            cache_path.parent.mkdir(exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(payload)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.debug(f"Konfigurations-Cache nicht schreibbar ({cache_path}): {e}")
+
 
 @dataclass
 class ScoreResult:
@@ -133,6 +825,8 @@ class ScoreResult:
     risk: int
     risk_level: RiskLevel
     violations: list[str] = field(default_factory=list)
+    # Version der Konfiguration, mit der bewertet wurde (siehe AgentLogScorer.config_version)
+    config_version: str | None = None
 
     def to_dict(self) -> dict:
         """Konvertiert zu Dictionary für JSON-Export."""
@@ -140,6 +834,13 @@ class ScoreResult:
         result['risk_level'] = self.risk_level.value
         return result
 
+    @classmethod
+    def from_dict(cls, data: dict) -> "ScoreResult":
+        """Erstellt ein ScoreResult aus der Ausgabe von ``to_dict``."""
+        values = {k: v for k, v in data.items() if k in cls.__dataclass_fields__}
+        values['risk_level'] = RiskLevel(values['risk_level'])
+        return cls(**values)
+
     def is_critical(self) -> bool:
         """Prüft ob das Ergebnis kritisch ist."""
         return self.risk_level in (RiskLevel.HIGH, RiskLevel.CRITICAL)
@@ -189,30 +890,683 @@ class AgentStatistics:
             "risk_distribution": self.risk_levels
         }
 
+    def add(self, result: ScoreResult) -> None:
+        """Nimmt ein einzelnes Ergebnis in die Statistik auf."""
+        self.total_interactions += 1
+        self.total_risk_score += result.risk
+        self.risk_levels[result.risk_level.value] += 1
+
+        if result.price_claim:
+            self.price_claims += 1
+        if result.legal_claim:
+            self.legal_claims += 1
+        if result.stop_triggered:
+            self.stops_triggered += 1
+        if result.placeholder_used:
+            self.placeholders_used += 1
+        if result.is_critical():
+            self.critical_incidents += 1
+
+    def to_state(self) -> dict:
+        """Alle Rohzähler (im Gegensatz zu ``to_dict`` ohne abgeleitete Werte)."""
+        return asdict(self)
+
+    @classmethod
+    def from_state(cls, data: dict) -> "AgentStatistics":
+        """Erstellt die Statistik aus ``to_state``."""
+        return cls(**{**data, "risk_levels": dict(data["risk_levels"])})
+
+    def merge(self, other: "AgentStatistics") -> "AgentStatistics":
+        """
+        Addiert die Zähler einer Teilstatistik (z.B. aus einem Worker-Prozess).
+
+        Args:
+            other: Teilstatistik desselben Agenten
+
+        Returns:
+            Diese Statistik (in-place aktualisiert)
+        """
+        self.total_interactions += other.total_interactions
+        self.total_risk_score += other.total_risk_score
+        self.price_claims += other.price_claims
+        self.legal_claims += other.legal_claims
+        self.stops_triggered += other.stops_triggered
+        self.placeholders_used += other.placeholders_used
+        self.critical_incidents += other.critical_incidents
+        for level, count in other.risk_levels.items():
+            self.risk_levels[level] = self.risk_levels.get(level, 0) + count
+        return self
+
+
+class _StatisticsShard:
+    """Statistiken eines Threads; nur dieser Thread schreibt hinein."""
+
+    __slots__ = ("stats", "thread")
+
+    def __init__(self) -> None:
+        self.stats: dict[str, AgentStatistics] = {}
+        self.thread = threading.current_thread()
+
+
+class ShardedAgentStatistics:
+    """
+    Threadsichere Agent-Statistiken mit einem Shard pro Thread.
+
+    Jeder schreibende Thread zählt ohne Lock in seinen eigenen Shard, so
+    dass parallele Scoring-Threads (Thread-Pools, async-Pipeline, Service)
+    sich weder gegenseitig Updates überschreiben noch um ein gemeinsames
+    Lock konkurrieren. ``snapshot`` liest die Shards erst beim Abruf und
+    summiert sie in neue Objekte. Shards beendeter Threads werden bei jedem
+    Snapshot und beim Registrieren eines neuen Shards endgültig übernommen
+    und freigegeben, so dass z.B. ein Service mit einem Thread pro
+    Verbindung nur so viele Shards hält, wie Threads leben.
+
+    Solange Threads noch schreiben, kann ein Snapshot ein gerade laufendes
+    Update pro Thread nur teilweise enthalten; sobald die Threads fertig
+    sind, sind die Zähler exakt.
+    """
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+        self._shards: list[_StatisticsShard] = []
+        # Übernommene Shards beendeter Threads
+        self._retired: dict[str, AgentStatistics] = {}
+        # Schützt _shards und _retired (Registrierung, Snapshot, Reset)
+        self._lock = threading.Lock()
+
+    def _shard(self) -> _StatisticsShard:
+        try:
+            return self._local.shard
+        except AttributeError:
+            shard = self._local.shard = _StatisticsShard()
+            with self._lock:
+                self._retire_finished()
+                self._shards.append(shard)
+            return shard
+
+    def _retire_finished(self) -> None:
+        # Ein beendeter Thread schreibt nicht mehr: Shard übernehmen (unter _lock)
+        active = []
+        for shard in self._shards:
+            if shard.thread.is_alive():
+                active.append(shard)
+            else:
+                self._sum_into(self._retired, shard.stats)
+        self._shards = active
+
+    def _stats(self, agent_id: str) -> AgentStatistics:
+        # Häufiger Fall ohne zusätzlichen Methodenaufruf
+        try:
+            shard_stats = self._local.shard.stats
+        except AttributeError:
+            shard_stats = self._shard().stats
+        stats = shard_stats.get(agent_id)
+        if stats is None:
+            stats = shard_stats[agent_id] = AgentStatistics(agent_id=agent_id)
+        return stats
+
+    def add(self, result: ScoreResult) -> None:
+        """Nimmt ein Ergebnis in den Shard des aufrufenden Threads auf."""
+        self._stats(result.agent_id).add(result)
+
+    def merge(self, partial_stats: dict[str, AgentStatistics]) -> None:
+        """Addiert Teilstatistiken (z.B. aus Worker-Prozessen)."""
+        for agent_id, partial in partial_stats.items():
+            self._stats(agent_id).merge(partial)
+
+    @staticmethod
+    def _sum_into(target: dict[str, AgentStatistics], source: dict[str, AgentStatistics]) -> None:
+        # copy() ist atomar gegenüber dem gleichzeitigen Einfügen neuer Agenten
+        for agent_id, partial in source.copy().items():
+            stats = target.get(agent_id)
+            if stats is None:
+                stats = target[agent_id] = AgentStatistics(agent_id=agent_id)
+            stats.merge(partial)
+
+    def snapshot(self) -> dict[str, AgentStatistics]:
+        """
+        Gibt die zusammengeführten Statistiken zurück.
+
+        Die Werte sind neue Objekte: spätere Ergebnisse verändern sie nicht.
+        """
+        with self._lock:
+            self._retire_finished()
+            merged: dict[str, AgentStatistics] = {}
+            self._sum_into(merged, self._retired)
+            for shard in self._shards:
+                self._sum_into(merged, shard.stats)
+            return merged
+
+    def clear(self) -> None:
+        """Verwirft alle Statistiken."""
+        with self._lock:
+            for shard in self._shards:
+                shard.stats = {}
+            self._retired = {}
+
+
+@dataclass
+class StageHistogram:
+    """Histogramm der Laufzeiten einer Stufe (Nanosekunden, logarithmische Buckets)."""
+    count: int = 0
+    total_ns: int = 0
+    max_ns: int = 0
+    buckets: dict[int, int] = field(default_factory=dict)
+
+    # 8 Buckets pro Zweierpotenz (ca. 12 % Auflösung), Werte < 16 ns exakt
+    _SUB_BITS = 3
+
+    def add(self, ns: int) -> None:
+        self.count += 1
+        self.total_ns += ns
+        if ns > self.max_ns:
+            self.max_ns = ns
+        bits = ns.bit_length()
+        if bits <= self._SUB_BITS + 1:
+            index = ns
+        else:
+            shift = bits - self._SUB_BITS - 1
+            index = (shift << self._SUB_BITS) + (ns >> shift)
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+
+    def _bucket_value(self, index: int) -> float:
+        """Mittelwert des Wertebereichs eines Buckets."""
+        sub_buckets = 1 << self._SUB_BITS
+        if index < 2 * sub_buckets:
+            return float(index)
+        shift = (index >> self._SUB_BITS) - 1
+        lower = (index - (shift << self._SUB_BITS)) << shift
+        return lower + ((1 << shift) - 1) / 2
+
+    def percentile(self, p: float) -> float:
+        """Näherungswert des p-Perzentils (0 < p <= 1) in Nanosekunden."""
+        if not self.count:
+            return 0.0
+        rank = p * self.count
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= rank:
+                return min(self._bucket_value(index), float(self.max_ns))
+        return float(self.max_ns)
+
+    def merge(self, other: "StageHistogram") -> None:
+        self.count += other.count
+        self.total_ns += other.total_ns
+        self.max_ns = max(self.max_ns, other.max_ns)
+        for index, count in other.buckets.items():
+            self.buckets[index] = self.buckets.get(index, 0) + count
+
+
+class _LockedState:
+    """
+    Basis für Messobjekte, die von mehreren Scoring-Threads aktualisiert werden.
+
+    Updates laufen unter ``_lock``. Beim Pickeln (Rückgabe aus
+    Worker-Prozessen) wird der Lock ausgelassen und danach neu angelegt.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+
+class StageProfiler(_LockedState):
+    """
+    Misst die Laufzeit der Verarbeitungsstufen beim Scoring.
+
+    Stufen: JSON laden, Validierung, Cache-Lookup, Transcript-Extraktion,
+    Keyword-Matching, Risikoberechnung, Regelprüfung, Cache-Eintrag und
+    Statistik-Update. Pro Stufe wird ein Histogramm über ``time.perf_counter_ns`` geführt,
+    der Speicherbedarf ist unabhängig von der Anzahl der Logs. Optional
+    wird jede Messung an einen Callback (stufe, nanosekunden) übergeben,
+    z.B. für ein eigenes Monitoring. Threadsicher: parallele Scoring-Threads
+    können sich einen Profiler teilen.
+    """
+
+    STAGES = ("load", "validate", "cache", "extract", "keywords", "risk", "violations", "cache_put", "statistics")
+
+    def __init__(self, callback: Callable[[str, int], None] | None = None):
+        super().__init__()
+        self.callback = callback
+        self.histograms: dict[str, StageHistogram] = {}
+
+    def record(self, stage: str, ns: int) -> None:
+        """Erfasst eine Messung für ``stage``."""
+        with self._lock:
+            histogram = self.histograms.get(stage)
+            if histogram is None:
+                histogram = self.histograms[stage] = StageHistogram()
+            histogram.add(ns)
+        if self.callback is not None:
+            self.callback(stage, ns)
+
+    def start(self) -> Callable[[str], None]:
+        """
+        Startet die Messung eines Durchlaufs.
+
+        Jeder Aufruf der zurückgegebenen Funktion schließt eine Stufe ab und
+        erfasst die Zeit seit dem vorherigen Aufruf.
+        """
+        clock = time.perf_counter_ns
+        last = clock()
+
+        def mark(stage: str) -> None:
+            nonlocal last
+            now = clock()
+            self.record(stage, now - last)
+            last = now
+
+        return mark
+
+    def merge(self, other: "StageProfiler") -> None:
+        """Übernimmt die Messungen eines anderen Profilers (z.B. aus einem Worker-Prozess)."""
+        with self._lock:
+            for stage, histogram in other.histograms.items():
+                self.histograms.setdefault(stage, StageHistogram()).merge(histogram)
+
+    def reset(self) -> None:
+        """Verwirft alle Messungen."""
+        with self._lock:
+            self.histograms.clear()
+
+    def get_report(self) -> dict:
+        """Aufschlüsselung pro Stufe: Anzahl, Summe, Mittelwert, Perzentile und Anteil."""
+        with self._lock:
+            return self._report()
+
+    def _report(self) -> dict:
+        total_ns = sum(h.total_ns for h in self.histograms.values())
+        order = [s for s in self.STAGES if s in self.histograms]
+        order += sorted(s for s in self.histograms if s not in self.STAGES)
+        report = {}
+        for stage in order:
+            h = self.histograms[stage]
+            report[stage] = {
+                "count": h.count,
+                "total_ms": round(h.total_ns / 1e6, 3),
+                "mean_us": round(h.total_ns / h.count / 1e3, 3),
+                "p50_us": round(h.percentile(0.50) / 1e3, 3),
+                "p90_us": round(h.percentile(0.90) / 1e3, 3),
+                "p99_us": round(h.percentile(0.99) / 1e3, 3),
+                "max_us": round(h.max_ns / 1e3, 3),
+                "share": round(h.total_ns / total_ns, 4) if total_ns else 0.0,
+            }
+        return report
+
+    def format_report(self) -> str:
+        """Gibt die Aufschlüsselung als Tabelle zurück."""
+        lines = [
+            f"{'Stufe':<11} {'Anzahl':>9} {'Summe ms':>10} {'Mittel µs':>10} "
+            f"{'p50 µs':>9} {'p90 µs':>9} {'p99 µs':>9} {'Anteil':>7}"
+        ]
+        for stage, row in self.get_report().items():
+            lines.append(
+                f"{stage:<11} {row['count']:>9} {row['total_ms']:>10.2f} {row['mean_us']:>10.2f} "
+                f"{row['p50_us']:>9.2f} {row['p90_us']:>9.2f} {row['p99_us']:>9.2f} {row['share']:>7.1%}"
+            )
+        return "\n".join(lines)
+
+
+class Counter(_LockedState):
+    """Monoton steigender Zähler (optional mit Labels)."""
+
+    TYPE = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()):
+        super().__init__()
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self.value: float = 0
+        self._children: dict[tuple[str, ...], Counter] = {}
+        self._func: Callable[[], float] | None = None
+
+    def labels(self, *values: str) -> "Counter":
+        """Gibt den Zähler für die angegebenen Label-Werte zurück."""
+        child = self._children.get(values)
+        if child is None:
+            with self._lock:
+                child = self._children.get(values)
+                if child is None:
+                    child = self._children[values] = type(self)(self.name, self.documentation)
+        return child
+
+    def inc(self, amount: float = 1) -> None:
+        with self._lock:
+            self.value += amount
+
+    def set_function(self, func: Callable[[], float]) -> None:
+        """Liest den Wert beim Export aus ``func`` (z.B. vorhandene Zähler eines Caches)."""
+        self._func = func
+
+    def get(self) -> float:
+        """Aktueller Wert (ohne Labels)."""
+        return self._func() if self._func is not None else self.value
+
+    def samples(self) -> Iterator[tuple[str, dict[str, str], float]]:
+        if self.labelnames:
+            # copy() ist atomar gegenüber dem gleichzeitigen Anlegen neuer Labels
+            for values, child in sorted(self._children.copy().items()):
+                yield self.name, dict(zip(self.labelnames, values)), child.value
+        else:
+            yield self.name, {}, self.get()
+
+    def merge(self, other: "Counter") -> None:
+        with self._lock:
+            self.value += other.value
+        for values, child in other._children.items():
+            self.labels(*values).merge(child)
+
+
+class Gauge(Counter):
+    """Momentanwert, der steigen und fallen kann (z.B. laufende Arbeit)."""
+
+    TYPE = "gauge"
+
+    def dec(self, amount: float = 1) -> None:
+        with self._lock:
+            self.value -= amount
+
+    def set(self, value: float) -> None:
+        self.value = value
+
+    def merge(self, other: "Counter") -> None:
+        # Momentanwerte anderer Prozesse sind nach deren Ende bedeutungslos
+        pass
+
+
+class Histogram(_LockedState):
+    """Verteilung von Messwerten über feste Bucket-Grenzen (Prometheus-Semantik ``le``)."""
+
+    TYPE = "histogram"
+
+    def __init__(self, name: str, documentation: str, buckets: Iterable[float]):
+        super().__init__()
+        self.name = name
+        self.documentation = documentation
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += value
+            self.count += 1
+
+    def get_count(self) -> int:
+        return self.count
+
+    def samples(self) -> Iterator[tuple[str, dict[str, str], float]]:
+        # Konsistenter Stand: Buckets, Summe und Anzahl aus derselben Messung
+        with self._lock:
+            counts, total, count = list(self.counts), self.sum, self.count
+        cumulative = 0
+        for bound, bucket_count in zip(self.buckets, counts):
+            cumulative += bucket_count
+            yield f"{self.name}_bucket", {"le": repr(float(bound))}, cumulative
+        yield f"{self.name}_bucket", {"le": "+Inf"}, count
+        yield f"{self.name}_sum", {}, total
+        yield f"{self.name}_count", {}, count
+
+    def merge(self, other: "Histogram") -> None:
+        with self._lock:
+            self.counts = [a + b for a, b in zip(self.counts, other.counts)]
+            self.sum += other.sum
+            self.count += other.count
+
+
+class MetricsRegistry:
+    """
+    Sammlung von Metriken mit Export im Prometheus-Textformat (Version 0.0.4).
+
+    Jede Metrik schützt ihre Updates mit einem eigenen Lock, so dass
+    parallele Scoring-Threads (Service, async-Pipeline) ein Register
+    teilen können, ohne Updates zu verlieren; ``render`` liest ohne
+    globalen Lock.
+    """
+
+    def __init__(self):
+        self.metrics: dict[str, Counter | Histogram] = {}
+
+    def _register(self, metric: Any) -> Any:
+        if metric.name in self.metrics:
+            raise ValueError(f"Metrik bereits registriert: {metric.name}")
+        self.metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> Gauge:
+        return self._register(Gauge(name, documentation, labelnames))
+
+    def histogram(self, name: str, documentation: str, buckets: Iterable[float]) -> Histogram:
+        return self._register(Histogram(name, documentation, buckets))
+
+    def merge(self, other: "MetricsRegistry") -> None:
+        """Addiert Zähler und Histogramme eines anderen Registers (z.B. aus einem Worker-Prozess)."""
+        for name, metric in other.metrics.items():
+            target = self.metrics.get(name)
+            if isinstance(target, Histogram) and isinstance(metric, Histogram):
+                target.merge(metric)
+            elif isinstance(target, Counter) and isinstance(metric, Counter):
+                target.merge(metric)
+
+    @staticmethod
+    def _escape(value: str) -> str:
+        return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+    @staticmethod
+    def _format_value(value: float) -> str:
+        return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+    def render(self) -> str:
+        """Gibt alle Metriken im Prometheus-Textformat zurück."""
+        lines = []
+        for metric in self.metrics.values():
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.TYPE}")
+            for name, labels, value in metric.samples():
+                if labels:
+                    label_text = ",".join(f'{key}="{self._escape(val)}"' for key, val in labels.items())
+                    name = f"{name}{{{label_text}}}"
+                lines.append(f"{name} {self._format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+    def write(self, path: str | Path) -> None:
+        """Schreibt die Metriken atomar in eine Datei (z.B. für den Textfile-Collector)."""
+        path = Path(path)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(self.render(), encoding="utf-8")
+        os.replace(tmp_path, path)
+
+
+class ScorerMetrics:
+    """
+    Betriebsmetriken des Scorers: Durchsatz, Fehler, Alerts, Cache und Latenz.
+
+    Wird an ``AgentLogScorer`` und ``AlertSystem`` übergeben; ohne Metriken
+    entsteht dort kein Aufwand.
+    """
+
+    LATENCY_BUCKETS = (0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.01, 0.1, 1.0)
+
+    def __init__(self, registry: MetricsRegistry | None = None):
+        self.registry = registry or MetricsRegistry()
+        self.logs_scored = self.registry.counter(
+            "agent_log_scorer_logs_scored_total", "Anzahl bewerteter Logs")
+        self.failures = self.registry.counter(
+            "agent_log_scorer_failures_total", "Fehlgeschlagene Logs nach Ursache", ("reason",))
+        self.alerts = self.registry.counter(
+            "agent_log_scorer_alerts_total", "Ausgelöste Alerts nach Risk-Level", ("risk_level",))
+        self.alerts_suppressed = self.registry.counter(
+            "agent_log_scorer_alerts_suppressed_total", "Nicht einzeln gemeldete Alerts nach Ursache", ("reason",))
+        self.config_reloads = self.registry.counter(
+            "agent_log_scorer_config_reloads_total", "Neuladen der Konfiguration nach Ergebnis", ("result",))
+        self.cache_hits = self.registry.counter(
+            "agent_log_scorer_cache_hits_total", "Treffer im Ergebnis-Cache")
+        self.cache_misses = self.registry.counter(
+            "agent_log_scorer_cache_misses_total", "Fehlschläge im Ergebnis-Cache")
+        self.in_flight = self.registry.gauge(
+            "agent_log_scorer_in_flight", "Gerade in Bearbeitung befindliche Logs bzw. Requests")
+        self.latency = self.registry.histogram(
+            "agent_log_scorer_score_duration_seconds", "Dauer von score_log pro Log", self.LATENCY_BUCKETS)
+        # Entspricht der Anzahl Latenz-Messungen: kein eigenes Update im Hot-Path
+        self.logs_scored.set_function(self.latency.get_count)
+
+    def track_cache(self, cache: ResultCache) -> None:
+        """Übernimmt Hit/Miss-Zähler eines Ergebnis-Caches beim Export."""
+        self.cache_hits.set_function(lambda: cache.hits)
+        self.cache_misses.set_function(lambda: cache.misses)
+
+    def merge(self, other: "ScorerMetrics") -> None:
+        self.registry.merge(other.registry)
+
+    def render(self) -> str:
+        return self.registry.render()
+
+    def write(self, path: str | Path) -> None:
+        self.registry.write(path)
+
 
 class AgentLogScorer:
     """Hauptklasse für die Log-Bewertung."""
 
-    def __init__(self, config: ScoringConfig | None = None, config_path: str | Path | None = None):
+    def __init__(
+        self,
+        config: ScoringConfig | None = None,
+        config_path: str | Path | None = None,
+        cache: ResultCache | None = None,
+        profiler: StageProfiler | None = None,
+        metrics: ScorerMetrics | None = None,
+        fast: bool = False
+    ):
         """
         Initialisiert den Scorer.
 
         Args:
             config: Optionale Konfiguration
-            config_path: Optionaler Pfad zur YAML-Config
+            config_path: Optionaler Pfad zur YAML-Config (Standard:
+                flow_validator_checklist.yaml); wird von ``reload_config``
+                erneut gelesen
+            cache: Optionaler persistenter Ergebnis-Cache
+            profiler: Optionaler Profiler für die Laufzeit pro Verarbeitungsstufe
+            metrics: Optionale Betriebsmetriken (Durchsatz, Fehler, Latenz)
+            fast: Standard für den schnellen Modus von ``score_log`` (nur
+                ``risk``/``risk_level``, siehe dort)
         """
+        self.config_path: Path | None = None
+        self._config_stat: tuple[int, int] | None = None
         if config:
             self.config = config
-        elif config_path:
-            self.config = ScoringConfig.from_yaml(config_path)
+            self.config_path = Path(config_path) if config_path else None
         else:
             # Standard-Config-Pfad
-            default_path = Path(__file__).parent / "flow_validator_checklist.yaml"
-            self.config = ScoringConfig.from_yaml(default_path)
+            self.config_path = Path(config_path or Path(__file__).parent / "flow_validator_checklist.yaml")
+            self._config_stat = self._stat_config()
+            self.config = ScoringConfig.load(self.config_path)
+
+        self.cache = cache
+        self.profiler = profiler
+        self.metrics = metrics
+        self.fast = fast
+        if metrics is not None and cache is not None:
+            metrics.track_cache(cache)
+        self._agent_stats = ShardedAgentStatistics()
 
-        self._agent_stats: dict[str, AgentStatistics] = defaultdict(
-            lambda: AgentStatistics(agent_id="unknown")
-        )
+    @property
+    def config(self) -> ScoringConfig:
+        """Aktive Konfiguration."""
+        return self._active_config[0]
+
+    @config.setter
+    def config(self, config: ScoringConfig) -> None:
+        # Konfiguration und Version werden als ein Tupel getauscht: ein
+        # laufendes score_log sieht entweder den alten oder den neuen Stand
+        self._active_config = (config, config.fingerprint()[:12])
+
+    @property
+    def config_version(self) -> str:
+        """
+        Version der aktiven Konfiguration (Präfix des Fingerprints).
+
+        Wird beim Setzen bzw. Neuladen der Konfiguration bestimmt; direkte
+        Änderungen am Konfigurationsobjekt zählen erst nach erneutem Setzen.
+        """
+        return self._active_config[1]
+
+    def _stat_config(self) -> tuple[int, int] | None:
+        if self.config_path is None:
+            return None
+        try:
+            stat = os.stat(self.config_path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def reload_config(self, config: ScoringConfig | None = None) -> bool:
+        """
+        Lädt die Konfiguration neu und tauscht sie atomar aus.
+
+        Parsen und Kompilieren laufen vollständig vor dem Austausch im
+        aufrufenden Thread (z.B. ``ConfigReloader``); bereits laufende
+        Bewertungen werden mit der alten Konfiguration beendet. Statistiken,
+        Ergebnis-Cache und Metriken bleiben erhalten. Eine nicht lesbare oder
+        fehlerhafte YAML-Datei lässt die aktive Konfiguration unverändert.
+
+        Args:
+            config: Neue Konfiguration (Standard: erneut aus ``config_path``)
+
+        Returns:
+            True, wenn sich die Konfigurationsversion geändert hat
+
+        Raises:
+            ValueError: Ohne ``config`` und ohne ``config_path``
+        """
+        if config is None:
+            if self.config_path is None:
+                raise ValueError("Kein Konfigurationspfad zum Neuladen vorhanden")
+            stat = self._stat_config()
+            config = ScoringConfig.load(self.config_path)
+            self._config_stat = stat
+            if not config._yaml_loaded:
+                logger.error(f"Konfiguration {self.config_path} nicht geladen, bisherige bleibt aktiv")
+                if self.metrics is not None:
+                    self.metrics.config_reloads.labels("failed").inc()
+                return False
+
+        config.compile()
+        old_version = self.config_version
+        self.config = config
+        changed = self.config_version != old_version
+        if changed:
+            logger.info(f"Konfiguration ausgetauscht: Version {old_version} -> {self.config_version}")
+        if self.metrics is not None:
+            self.metrics.config_reloads.labels("changed" if changed else "unchanged").inc()
+        return changed
+
+    def check_config(self) -> bool:
+        """
+        Lädt die Konfiguration neu, falls sich mtime oder Größe der Datei geändert haben.
+
+        Returns:
+            True, wenn eine neue Konfigurationsversion aktiv ist
+        """
+        if self.config_path is None or self._stat_config() == self._config_stat:
+            return False
+        return self.reload_config()
 
     def validate_log(self, log: Any) -> tuple[bool, str]:
         """
@@ -235,15 +1589,13 @@ class AgentLogScorer:
 
         return True, ""
 
+    def _extract_turns(self, log: dict) -> list[str]:
+        """Extrahiert die Texte der Turns (Referenzen, ohne sie zu kopieren)."""
+        return list(_transcript_turns(log))
+
     def _extract_transcript(self, log: dict) -> str:
         """Extrahiert den Transcript-Text aus dem Log."""
-        parts = []
-        for line in log.get("transcript", []):
-            if isinstance(line, dict):
-                parts.append(line.get("text", ""))
-            elif isinstance(line, str):
-                parts.append(line)
-        return " ".join(parts)
+        return " ".join(_transcript_turns(log))
 
     def _check_keywords(self, text: str, keywords: list[str]) -> tuple[bool, list[str]]:
         """Prüft ob Keywords im Text vorkommen."""
@@ -251,9 +1603,9 @@ class AgentLogScorer:
         found = [kw for kw in keywords if kw.lower() in text_lower]
         return len(found) > 0, found
 
-    def _get_risk_level(self, risk_score: int) -> RiskLevel:
+    def _get_risk_level(self, risk_score: int, config: ScoringConfig | None = None) -> RiskLevel:
         """Konvertiert numerischen Score zu Risk-Level."""
-        thresholds = self.config.risk_thresholds
+        thresholds = (config or self.config).risk_thresholds
         if risk_score <= thresholds.get("low", 0):
             return RiskLevel.LOW
         elif risk_score <= thresholds.get("medium", 1):
@@ -262,38 +1614,50 @@ class AgentLogScorer:
             return RiskLevel.HIGH
         return RiskLevel.CRITICAL
 
-    def _check_violations(self, log: dict, transcript: str, result: ScoreResult) -> list[str]:
-        """Prüft auf Regelverstöße basierend auf YAML-Regeln."""
-        violations = []
-        rules = self.config.yaml_rules
-
-        if not rules:
-            return violations
-
-        # Prüfe "forbidden" Regeln
-        forbidden = rules.get("forbidden", [])
-        for rule in forbidden:
-            if "price estimates without fact" in rule.lower() and result.price_claim and not result.stop_triggered:
-                violations.append(f"Verstoß: {rule}")
-            if "legal promises without fact" in rule.lower() and result.legal_claim and not result.stop_triggered:
-                violations.append(f"Verstoß: {rule}")
-
-        # Prüfe "must_include" Regeln
-        must_include = rules.get("must_include", [])
-        for rule in must_include:
-            if "stop_required on price" in rule.lower() and result.price_claim and not result.stop_triggered:
-                violations.append(f"Fehlend: {rule}")
-            if "stop_required on legal" in rule.lower() and result.legal_claim and not result.stop_triggered:
-                violations.append(f"Fehlend: {rule}")
-
-        return violations
-
-    def score_log(self, log: Any) -> ScoreResult:
+    @staticmethod
+    def _risk_score(
+        price_found: bool,
+        legal_found: bool,
+        stop_triggered: bool,
+        placeholder_used: bool,
+        config: ScoringConfig
+    ) -> int:
+        """Berechnet den Risikoscore aus den Flags (nie kleiner als 0)."""
+        risk_score = 0
+        if price_found:
+            risk_score += 1
+        if legal_found:
+            risk_score += 1
+        if stop_triggered:
+            risk_score -= 1
+        if placeholder_used and (price_found or legal_found):
+            risk_score += config.placeholder_bonus
+        return max(0, risk_score)
+
+    def _check_violations(
+        self,
+        log: dict,
+        transcript: str,
+        result: ScoreResult,
+        config: ScoringConfig | None = None
+    ) -> list[str]:
+        """Prüft auf Regelverstöße anhand der vorkompilierten YAML-Regeln."""
+        return (config or self.config).get_rules().check(log, transcript, result)
+
+    def score_log(self, log: Any, fast: bool | None = None) -> ScoreResult:
         """
         Bewertet ein einzelnes Agent-Log.
 
+        Im schnellen Modus endet die Keyword-Suche, sobald je ein Preis- und
+        ein Rechts-Treffer feststeht; ``price_keywords_found``,
+        ``legal_keywords_found`` und ``violations`` bleiben leer. ``risk``,
+        ``risk_level``, die Claim-Flags und die Statistiken sind identisch
+        mit dem vollständigen Modus. Schnelle Ergebnisse werden nicht in den
+        Ergebnis-Cache geschrieben.
+
         Args:
             log: Das Agent-Log als Dictionary
+            fast: Schneller Modus (Standard: ``self.fast``)
 
         Returns:
             ScoreResult mit der Bewertung
@@ -301,18 +1665,66 @@ class AgentLogScorer:
         Raises:
             ValueError: Bei ungültiger Log-Struktur
         """
+        if fast is None:
+            fast = self.fast
+        metrics = self.metrics
+        if metrics is None:
+            return self._score_log(log, fast)
+
+        start = time.perf_counter()
+        try:
+            result = self._score_log(log, fast)
+        except ValueError:
+            metrics.failures.labels("validation").inc()
+            raise
+        metrics.latency.observe(time.perf_counter() - start)
+        return result
+
+    def _score_log(self, log: Any, fast: bool = False) -> ScoreResult:
+        # Ohne Profiler bleibt es bei einer None-Prüfung pro Stufe
+        mark = self.profiler.start() if self.profiler is not None else None
+        # Einmal lesen: ein Austausch während der Bewertung betrifft erst das nächste Log
+        config, config_version = self._active_config
+
         # Validierung
         is_valid, error_msg = self.validate_log(log)
         if not is_valid:
             logger.error(f"Validierungsfehler: {error_msg}")
             raise ValueError(error_msg)
-
-        # Transcript extrahieren
-        transcript = self._extract_transcript(log)
-
-        # Keywords prüfen
-        price_found, price_keywords = self._check_keywords(transcript, self.config.price_keywords)
-        legal_found, legal_keywords = self._check_keywords(transcript, self.config.legal_keywords)
+        if mark:
+            mark("validate")
+
+        # Cache prüfen (identischer Inhalt + identische Konfiguration)
+        cache = self.cache
+        cache_key = None
+        if cache is not None:
+            cache_key = cache.make_key(log, config.fingerprint())
+            cached = cache.get(cache_key)
+            if mark:
+                mark("cache")
+            if cached is not None:
+                self._update_statistics(cached)
+                if mark:
+                    mark("statistics")
+                return cached
+
+        # Turns extrahieren; das Transcript wird nicht verbunden und nur
+        # fensterweise kleingeschrieben
+        turns = self._extract_turns(log)
+        if mark:
+            mark("extract")
+
+        # Keywords prüfen (ein Durchlauf für beide Kategorien)
+        if fast:
+            price_found, legal_found = config.get_keyword_matcher().has_claims_turns(turns)
+            price_keywords: list[str] = []
+            legal_keywords: list[str] = []
+        else:
+            price_keywords, legal_keywords = config.get_keyword_matcher().match_turns(turns)
+            price_found = len(price_keywords) > 0
+            legal_found = len(legal_keywords) > 0
+        if mark:
+            mark("keywords")
 
         # Flags extrahieren
         stop_triggered = bool(log.get("stop_triggered", False))
@@ -320,18 +1732,8 @@ class AgentLogScorer:
         placeholder_used = "PLACEHOLDER" in result_text or "STOP_REQUIRED" in result_text
 
         # Risikoscore berechnen
-        risk_score = 0
-        if price_found:
-            risk_score += 1
-        if legal_found:
-            risk_score += 1
-        if stop_triggered:
-            risk_score -= 1
-        if placeholder_used and (price_found or legal_found):
-            risk_score += self.config.placeholder_bonus
-
-        risk_score = max(0, risk_score)
-        risk_level = self._get_risk_level(risk_score)
+        risk_score = self._risk_score(price_found, legal_found, stop_triggered, placeholder_used, config)
+        risk_level = self._get_risk_level(risk_score, config)
 
         # Ergebnis erstellen
         result = ScoreResult(
@@ -345,249 +1747,2092 @@ class AgentLogScorer:
             stop_triggered=stop_triggered,
             placeholder_used=placeholder_used,
             risk=risk_score,
-            risk_level=risk_level
+            risk_level=risk_level,
+            config_version=config_version
         )
 
-        # Verstöße prüfen
-        result.violations = self._check_violations(log, transcript, result)
+        if mark:
+            mark("risk")
+
+        # Verstöße prüfen (beeinflussen den Risikoscore nicht)
+        if not fast:
+            # Verbundenes Transcript nur für Regeln, die es lesen
+            transcript = " ".join(turns) if "transcript" in config.get_rules().fields else ""
+            result.violations = self._check_violations(log, transcript, result, config)
+            if mark:
+                mark("violations")
+
+        # Nur vollständige Ergebnisse cachen; Treffer dürfen auch schnelle Aufrufe bedienen
+        if cache is not None and cache_key is not None and not fast:
+            cache.put(cache_key, result)
+            if mark:
+                mark("cache_put")
 
         # Statistiken aktualisieren
         self._update_statistics(result)
+        if mark:
+            mark("statistics")
 
         logger.debug(f"Score für Agent {result.agent_id}: Risk={risk_score} ({risk_level.value})")
         return result
 
-    def _update_statistics(self, result: ScoreResult) -> None:
-        """Aktualisiert die Agent-Statistiken."""
-        stats = self._agent_stats[result.agent_id]
-        stats.agent_id = result.agent_id
-        stats.total_interactions += 1
-        stats.total_risk_score += result.risk
-        stats.risk_levels[result.risk_level.value] += 1
+    def score_logs(self, logs: Iterable[Any], fast: bool | None = None) -> list[ScoreResult]:
+        """
+        Bewertet viele Logs in einem Aufruf.
 
-        if result.price_claim:
-            stats.price_claims += 1
-        if result.legal_claim:
-            stats.legal_claims += 1
-        if result.stop_triggered:
-            stats.stops_triggered += 1
-        if result.placeholder_used:
-            stats.placeholders_used += 1
-        if result.is_critical():
-            stats.critical_incidents += 1
+        Ergebnisse und Statistiken sind identisch mit ``score_log`` für jedes
+        Log. Die Keyword-Suche läuft weiterhin pro Log und schreibt nur
+        Flags in Spalten; Risikoscore, Begrenzung auf 0 und Einordnung in
+        ``risk_thresholds`` werden für den ganzen Batch berechnet, die
+        Agent-Statistiken als gruppierte Summen je Agent und einmal
+        übernommen. Mit NumPy (optionale Abhängigkeit) geschieht das
+        vektorisiert, sonst in reinem Python.
+
+        Alle Logs werden vorab validiert, ein ungültiges Log bricht den
+        Batch ab, bevor etwas bewertet wird. Der ganze Batch wird mit einer
+        Konfigurationsversion bewertet. Der Profiler wird nicht verwendet;
+        in den Metriken zählt jedes Log mit seinem Anteil an der Batch-Dauer.
+
+        Args:
+            logs: Agent-Logs als Dictionaries
+            fast: Schneller Modus (Standard: ``self.fast``, siehe ``score_log``)
+
+        Returns:
+            Ein ScoreResult pro Log, in Eingabereihenfolge
+
+        Raises:
+            ValueError: Bei ungültiger Log-Struktur
+        """
+        if fast is None:
+            fast = self.fast
+        logs = list(logs)
+        start = time.perf_counter()
+        config, config_version = self._active_config
+
+        for log in logs:
+            is_valid, error_msg = self.validate_log(log)
+            if not is_valid:
+                logger.error(f"Validierungsfehler: {error_msg}")
+                if self.metrics is not None:
+                    self.metrics.failures.labels("validation").inc()
+                raise ValueError(error_msg)
+        if not logs:
+            return []
+
+        # Cache-Treffer übernehmen, nur der Rest wird bewertet
+        results: list[ScoreResult | None] = [None] * len(logs)
+        cache_keys: list[str | None] = [None] * len(logs)
+        cache = self.cache
+        if cache is not None:
+            fingerprint = config.fingerprint()
+            for index, log in enumerate(logs):
+                cache_key = cache_keys[index] = cache.make_key(log, fingerprint)
+                results[index] = cache.get(cache_key)
+        pending = [index for index, result in enumerate(results) if result is None]
+
+        # Keywords und Flags pro Log, als Spalten gesammelt
+        matcher = config.get_keyword_matcher()
+        price_flags = bytearray(len(pending))
+        legal_flags = bytearray(len(pending))
+        stop_flags = bytearray(len(pending))
+        placeholder_flags = bytearray(len(pending))
+        keywords: list[tuple[list[str], list[str]]] = []
+        for row, index in enumerate(pending):
+            log = logs[index]
+            turns = self._extract_turns(log)
+            if fast:
+                price_flags[row], legal_flags[row] = matcher.has_claims_turns(turns)
+                keywords.append(([], []))
+            else:
+                price_keywords, legal_keywords = matcher.match_turns(turns)
+                price_flags[row] = len(price_keywords) > 0
+                legal_flags[row] = len(legal_keywords) > 0
+                keywords.append((price_keywords, legal_keywords))
+            stop_flags[row] = bool(log.get("stop_triggered", False))
+            result_text = str(log.get("result", ""))
+            placeholder_flags[row] = "PLACEHOLDER" in result_text or "STOP_REQUIRED" in result_text
+
+        risks, levels = _batch_risk(price_flags, legal_flags, stop_flags, placeholder_flags, config)
+
+        check_transcript = "transcript" in config.get_rules().fields
+        for row, index in enumerate(pending):
+            log = logs[index]
+            result = ScoreResult(
+                agent_id=log.get("agent_id"),
+                contact=log.get("contact_name"),
+                timestamp=log.get("timestamp"),
+                price_claim=bool(price_flags[row]),
+                price_keywords_found=keywords[row][0],
+                legal_claim=bool(legal_flags[row]),
+                legal_keywords_found=keywords[row][1],
+                stop_triggered=bool(stop_flags[row]),
+                placeholder_used=bool(placeholder_flags[row]),
+                risk=risks[row],
+                risk_level=_RISK_LEVELS[levels[row]],
+                config_version=config_version
+            )
+            if not fast:
+                transcript = " ".join(_transcript_turns(log)) if check_transcript else ""
+                result.violations = self._check_violations(log, transcript, result, config)
+                key = cache_keys[index]
+                if cache is not None and key is not None:
+                    cache.put(key, result)
+            results[index] = result
+
+        # Jede Position ist jetzt belegt (Cache-Treffer oder neu bewertet)
+        scored = [result for result in results if result is not None]
+        assert len(scored) == len(logs)
+        self._agent_stats.merge(_group_statistics(scored))
+
+        if self.metrics is not None:
+            share = (time.perf_counter() - start) / len(logs)
+            for _ in logs:
+                self.metrics.latency.observe(share)
+        return scored
+
+    def _update_statistics(self, result: ScoreResult) -> None:
+        """Aktualisiert die Agent-Statistiken (threadsicher, Shard des aufrufenden Threads)."""
+        self._agent_stats.add(result)
 
     def score_file(self, file_path: str | Path) -> ScoreResult:
         """Verarbeitet eine einzelne Log-Datei."""
+        return self.score_log(self._load_file(file_path))
+
+    def _load_file(self, file_path: str | Path) -> Any:
+        """Liest und parst eine Log-Datei."""
         logger.info(f"Verarbeite: {file_path}")
 
         with open(file_path, 'r', encoding='utf-8') as f:
-            log_data = json.load(f)
-
-        return self.score_log(log_data)
-
-    def score_directory(self, dir_path: str | Path, pattern: str = "*.json") -> list[ScoreResult]:
+            return self._parse_json(f.read())
+
+    def _score_in_shard(self, log: Any, shard: ShardSpec | None) -> ScoreResult | None:
+        """Bewertet das Log, sofern es zum Shard gehört (sonst None)."""
+        if shard is not None and not shard.owns_log(log):
+            return None
+        return self.score_log(log)
+
+    def _score_file_in_shard(self, file_path: Path, shard: ShardSpec | None) -> ScoreResult | None:
+        """Wie ``score_file``; None, wenn das Log zu einem anderen Shard gehört."""
+        if shard is None or shard.key != "agent":
+            # Dateien fremder Shards wurden bereits beim Auflisten aussortiert
+            return self.score_file(file_path)
+        return self._score_in_shard(self._load_file(file_path), shard)
+
+    def _list_files(self, dir_path: str | Path, pattern: str, shard: ShardSpec | None = None) -> list[Path]:
+        """Sortierte Dateien des Verzeichnisses, bei Sharding nach Pfad nur die des Shards."""
+        files = sorted(Path(dir_path).glob(pattern))
+        if shard is not None:
+            files = [file_path for file_path in files if shard.owns_path(file_path, dir_path)]
+        return files
+
+    def _parse_json(self, text: str | bytes) -> Any:
+        """Parst JSON; mit Profiler wird die Dauer als Stufe "load" erfasst."""
+        try:
+            if self.profiler is None:
+                return json.loads(text)
+            start = time.perf_counter_ns()
+            data = json.loads(text)
+            self.profiler.record("load", time.perf_counter_ns() - start)
+            return data
+        except json.JSONDecodeError:
+            if self.metrics is not None:
+                self.metrics.failures.labels("parse").inc()
+            raise
+
+    def score_directory(
+        self,
+        dir_path: str | Path,
+        pattern: str = "*.json",
+        workers: int = 1,
+        chunk_size: int | None = None,
+        manifest_path: str | Path | None = None,
+        shard: ShardSpec | None = None
+    ) -> list[ScoreResult]:
         """
         Verarbeitet alle Log-Dateien in einem Verzeichnis.
 
         Args:
             dir_path: Pfad zum Verzeichnis
             pattern: Glob-Pattern für Dateien (Standard: *.json)
+            workers: Anzahl Worker-Prozesse (1 = sequentiell im aktuellen Prozess)
+            chunk_size: Dateien pro Worker-Auftrag (Standard: automatisch)
+            manifest_path: Optionales Manifest für inkrementelles Re-Scoring;
+                unveränderte Dateien werden übersprungen und ihre Ergebnisse
+                wiederverwendet (pro Shard ein eigenes Manifest)
+            shard: Optional nur die Dateien bzw. Logs dieses Shards bewerten
 
         Returns:
-            Liste der Scoring-Ergebnisse
+            Liste der Scoring-Ergebnisse (in sortierter Dateireihenfolge)
         """
-        dir_path = Path(dir_path)
-        results = []
+        files = self._list_files(dir_path, pattern, shard)
+
+        if manifest_path is not None:
+            manifest = ScoreManifest(manifest_path, self.config, shard, self.fast)
+            results = self._score_files_incremental(files, manifest, workers, chunk_size, shard)
+        else:
+            results = [
+                result for _, result in self._score_files(files, workers, chunk_size, shard) if result is not None
+            ]
+
+        logger.info(f"Verarbeitet: {len(results)} Dateien")
+        return results
+
+    def iter_score_directory(
+        self,
+        dir_path: str | Path,
+        pattern: str = "*.json",
+        shard: ShardSpec | None = None
+    ) -> Iterator[ScoreResult]:
+        """
+        Bewertet die Log-Dateien eines Verzeichnisses einzeln als Generator.
 
-        for file_path in sorted(dir_path.glob(pattern)):
+        Wie ``score_directory`` (sequentiell), aber ohne alle Ergebnisse zu
+        sammeln; fehlerhafte oder nicht lesbare Dateien werden wie in
+        ``_score_files`` protokolliert und übersprungen.
+        """
+        count = 0
+        for file_path in self._list_files(dir_path, pattern, shard):
             try:
-                result = self.score_file(file_path)
-                results.append(result)
-            except (json.JSONDecodeError, ValueError) as e:
+                result = self._score_file_in_shard(file_path, shard)
+            except (json.JSONDecodeError, ValueError, OSError) as e:
                 logger.error(f"Fehler bei {file_path}: {e}")
+                continue
+            if result is None:
+                continue
+            count += 1
+            yield result
+        logger.info(f"Verarbeitet: {count} Dateien")
+
+    def _score_files(
+        self,
+        files: list[Path],
+        workers: int = 1,
+        chunk_size: int | None = None,
+        shard: ShardSpec | None = None
+    ) -> list[tuple[Path, ScoreResult | None]]:
+        """
+        Bewertet Dateien sequentiell oder in einem Prozess-Pool.
 
-        logger.info(f"Verarbeitet: {len(results)} Dateien")
+        Returns:
+            Paare aus (Datei, Ergebnis) in Eingabereihenfolge; Ergebnis ist
+            None bei ungültigem JSON, ungültiger Log-Struktur, einer nicht
+            lesbaren Datei oder einem Log eines anderen Shards
+        """
+        if workers > 1 and len(files) > 1:
+            return self._score_files_parallel(files, workers, chunk_size, shard)
+
+        scored: list[tuple[Path, ScoreResult | None]] = []
+        for file_path in files:
+            try:
+                scored.append((file_path, self._score_file_in_shard(file_path, shard)))
+            except (json.JSONDecodeError, ValueError, OSError) as e:
+                logger.error(f"Fehler bei {file_path}: {e}")
+                scored.append((file_path, None))
+        return scored
+
+    def _score_files_parallel(
+        self,
+        files: list[Path],
+        workers: int,
+        chunk_size: int | None = None,
+        shard: ShardSpec | None = None
+    ) -> list[tuple[Path, ScoreResult | None]]:
+        """
+        Bewertet Dateien in einem Prozess-Pool.
+
+        Jeder Worker hält einen eigenen Scorer; pro Chunk liefert er die
+        Ergebnisse und seine Teilstatistiken zurück, die hier in
+        ``_agent_stats`` zusammengeführt werden.
+        """
+        from concurrent.futures import ProcessPoolExecutor
+
+        if chunk_size is None:
+            chunk_size = max(1, min(256, len(files) // (workers * 4)))
+        chunks = [files[i:i + chunk_size] for i in range(0, len(files), chunk_size)]
+
+        # Worker öffnen eigene Verbindungen zum selben Cache
+        cache_args = (self.cache.path, self.cache.max_entries) if self.cache is not None else None
+        if self.cache is not None:
+            self.cache.flush()
+
+        scored: list[tuple[Path, ScoreResult | None]] = []
+        profiler, metrics = self.profiler, self.metrics
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker_scorer,
+            initargs=(self.config, cache_args, profiler is not None, metrics is not None, shard, self.fast)
+        ) as executor:
+            if metrics is not None:
+                metrics.in_flight.inc(len(files))
+            try:
+                # map() liefert die Chunks in Eingabereihenfolge zurück
+                for chunk in executor.map(_score_file_chunk, chunks):
+                    scored.extend(chunk.scored)
+                    self.merge_statistics(chunk.stats)
+                    if profiler is not None and chunk.profile is not None:
+                        profiler.merge(chunk.profile)
+                    if metrics is not None and chunk.metrics is not None:
+                        metrics.merge(chunk.metrics)
+                        metrics.in_flight.dec(len(chunk.scored))
+                    if self.cache is not None:
+                        self.cache.hits += chunk.cache_counts[0]
+                        self.cache.misses += chunk.cache_counts[1]
+            finally:
+                if metrics is not None:
+                    metrics.in_flight.dec(len(files) - len(scored))
+
+        if self.cache is not None:
+            self.cache.sync()
+
+        return scored
+
+    def _score_files_incremental(
+        self,
+        files: list[Path],
+        manifest: "ScoreManifest",
+        workers: int = 1,
+        chunk_size: int | None = None,
+        shard: ShardSpec | None = None
+    ) -> list[ScoreResult]:
+        """Bewertet nur neue/geänderte Dateien und übernimmt den Rest aus dem Manifest."""
+        cached: dict[Path, ScoreResult | None] = {}
+        pending: list[Path] = []
+
+        for file_path in files:
+            hit, result = manifest.lookup(file_path)
+            if hit:
+                cached[file_path] = result
+            else:
+                pending.append(file_path)
+
+        logger.info(f"Manifest: {len(cached)} unverändert, {len(pending)} neu/geändert")
+
+        # Stand vor dem Scoring festhalten: Änderungen währenddessen führen
+        # beim nächsten Lauf zu erneutem Scoring statt zu einem falschen Treffer
+        snapshots = {file_path: manifest.snapshot(file_path) for file_path in pending}
+        for file_path, result in self._score_files(pending, workers, chunk_size, shard):
+            snapshot = snapshots[file_path]
+            if snapshot is not None:
+                manifest.update(file_path, snapshot, result)
+            cached[file_path] = result
+
+        manifest.prune(files)
+        manifest.save()
+
+        results = []
+        for file_path in files:
+            result = cached[file_path]
+            if result is None:
+                continue
+            if file_path not in manifest.updated:
+                # Statistikbeitrag der wiederverwendeten Ergebnisse übernehmen
+                self._update_statistics(result)
+            results.append(result)
         return results
 
+    def merge_statistics(self, partial_stats: dict[str, AgentStatistics]) -> None:
+        """Führt Teilstatistiken (z.B. aus Worker-Prozessen) in die eigenen Statistiken zusammen."""
+        self._agent_stats.merge(partial_stats)
+
+    def iter_score_jsonl(
+        self,
+        file_path: str | Path,
+        on_error: Callable[[int, str], None] | None = None,
+        shard: ShardSpec | None = None
+    ) -> Iterator[ScoreResult]:
+        """
+        Bewertet eine JSONL-Datei (ein Log pro Zeile) zeilenweise.
+
+        Die Datei wird nie vollständig geladen; der Speicherbedarf ist
+        unabhängig von der Dateigröße. Fehlerhafte Zeilen werden mit
+        Zeilennummer protokolliert und übersprungen, leere Zeilen ignoriert.
+
+        Args:
+            file_path: Pfad zur JSONL-Datei
+            on_error: Optionaler Callback (zeilennummer, fehlermeldung) für fehlerhafte Zeilen
+            shard: Optional nur die Zeilen dieses Shards bewerten (nach
+                Zeilennummer bzw. ``agent_id``)
+
+        Yields:
+            ScoreResult pro gültiger Zeile
+        """
+        logger.info(f"Verarbeite JSONL: {file_path}")
+
+        with open(file_path, 'r', encoding='utf-8') as f:
+            for line_number, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                if shard is not None and shard.key == "path" and not shard.owns(str(line_number)):
+                    continue
+                try:
+                    result = self._score_in_shard(self._parse_json(line), shard)
+                except (json.JSONDecodeError, ValueError) as e:
+                    logger.error(f"Fehler in {file_path}, Zeile {line_number}: {e}")
+                    if on_error:
+                        on_error(line_number, str(e))
+                    continue
+                if result is not None:
+                    yield result
+
     async def score_file_async(self, file_path: str | Path) -> ScoreResult:
         """Asynchrone Verarbeitung einer Log-Datei."""
-        loop = asyncio.get_event_loop()
+        import asyncio
+
+        loop = asyncio.get_running_loop()
         return await loop.run_in_executor(None, self.score_file, file_path)
 
-    async def score_directory_async(self, dir_path: str | Path, pattern: str = "*.json") -> list[ScoreResult]:
-        """Asynchrone Batch-Verarbeitung eines Verzeichnisses."""
-        dir_path = Path(dir_path)
-        files = list(dir_path.glob(pattern))
+    def _score_file_data(self, file_path: Path, data: bytes, shard: ShardSpec | None = None) -> ScoreResult | None:
+        """Bewertet den bereits gelesenen Inhalt einer Log-Datei (wie ``score_file``)."""
+        logger.info(f"Verarbeite: {file_path}")
+        return self._score_in_shard(self._parse_json(data.decode("utf-8")), shard)
+
+    async def iter_score_directory_async(
+        self,
+        dir_path: str | Path,
+        pattern: str = "*.json",
+        max_in_flight: int = 64,
+        ordered: bool = False,
+        read_workers: int = 8,
+        score_workers: int = 1,
+        shard: ShardSpec | None = None
+    ) -> AsyncIterator[tuple[Path, ScoreResult]]:
+        """
+        Bewertet ein Verzeichnis über eine mehrstufige asynchrone Pipeline.
 
-        tasks = [self.score_file_async(f) for f in files]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        Stufen: Dateien finden → lesen (I/O-Threads) → parsen und bewerten
+        (Scoring-Threads) → ausgeben. Die Stufen sind über begrenzte Queues
+        verbunden; höchstens ``max_in_flight`` Dateien befinden sich
+        gleichzeitig zwischen Fund und Ausgabe. Speicherbedarf und offene
+        Dateien bleiben damit unabhängig von der Anzahl der Dateien.
 
-        # Fehler filtern
-        valid_results = []
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                logger.error(f"Fehler bei {files[i]}: {result}")
-            else:
-                valid_results.append(result)
+        Args:
+            dir_path: Pfad zum Verzeichnis
+            pattern: Glob-Pattern für Dateien (Standard: *.json)
+            max_in_flight: Maximale Anzahl gleichzeitig bearbeiteter Dateien
+            ordered: Ergebnisse in Fundreihenfolge ausgeben (über einen
+                Reorder-Puffer von höchstens ``max_in_flight`` Einträgen)
+            read_workers: Anzahl paralleler Lesevorgänge
+            score_workers: Anzahl Scoring-Threads (Scoring ist CPU-gebunden,
+                mehr als 1 bringt unter dem GIL kaum Gewinn)
+            shard: Optional nur die Dateien bzw. Logs dieses Shards bewerten
+
+        Yields:
+            Tuple aus (Datei, ScoreResult); fehlerhafte Dateien werden
+            protokolliert und übersprungen
+        """
+        import asyncio
+        from concurrent.futures import ThreadPoolExecutor
+
+        loop = asyncio.get_running_loop()
+        done = object()
+        in_flight = asyncio.Semaphore(max_in_flight)
+        metrics = self.metrics
+        # Für das in_flight-Gauge: gefundene, aber noch nicht ausgegebene Dateien
+        pending = 0
+        path_queue: asyncio.Queue = asyncio.Queue(maxsize=max_in_flight)
+        data_queue: asyncio.Queue = asyncio.Queue(maxsize=max_in_flight)
+        # Durch in_flight begrenzt, daher ohne eigene maxsize
+        out_queue: asyncio.Queue = asyncio.Queue()
+        io_pool = ThreadPoolExecutor(max_workers=read_workers, thread_name_prefix="scorer-read")
+        score_pool = ThreadPoolExecutor(max_workers=score_workers, thread_name_prefix="scorer-score")
+
+        def read_bytes(file_path: Path) -> bytes:
+            with open(file_path, 'rb') as f:
+                return f.read()
+
+        def next_paths(paths: Iterator[Path]) -> list[Path]:
+            if shard is not None:
+                paths = (path for path in paths if shard.owns_path(path, dir_path))
+            return [path for _, path in zip(range(256), paths)]
+
+        async def close_queue(queue: asyncio.Queue, consumers: int) -> None:
+            # Endmarker nur bei regulärem Ende senden: bei Abbruch gibt es
+            # keine Abnehmer mehr und ein put() auf eine volle Queue hinge.
+            for _ in range(consumers):
+                await queue.put(done)
+
+        async def discover() -> None:
+            nonlocal pending
+            try:
+                paths = Path(dir_path).glob(pattern)
+                seq = 0
+                while batch := await loop.run_in_executor(io_pool, next_paths, paths):
+                    for path in batch:
+                        await in_flight.acquire()
+                        pending += 1
+                        if metrics is not None:
+                            metrics.in_flight.inc()
+                        await path_queue.put((seq, path))
+                        seq += 1
+            except Exception:
+                await close_queue(path_queue, read_workers)
+                raise
+            await close_queue(path_queue, read_workers)
+
+        async def reader() -> None:
+            while (item := await path_queue.get()) is not done:
+                seq, path = item
+                try:
+                    data = await loop.run_in_executor(io_pool, read_bytes, path)
+                except Exception as e:
+                    await out_queue.put((seq, path, e))
+                    continue
+                await data_queue.put((seq, path, data))
+
+        async def scorer() -> None:
+            while (item := await data_queue.get()) is not done:
+                seq, path, data = item
+                outcome: ScoreResult | Exception | None
+                try:
+                    outcome = await loop.run_in_executor(score_pool, self._score_file_data, path, data, shard)
+                except Exception as e:
+                    outcome = e
+                await out_queue.put((seq, path, outcome))
+
+        async def run_readers() -> None:
+            await asyncio.gather(*(reader() for _ in range(read_workers)))
+            await close_queue(data_queue, score_workers)
+
+        async def run_scorers() -> None:
+            await asyncio.gather(*(scorer() for _ in range(score_workers)))
+            await close_queue(out_queue, 1)
+
+        tasks = [
+            asyncio.create_task(discover()),
+            asyncio.create_task(run_readers()),
+            asyncio.create_task(run_scorers()),
+        ]
+        reorder_buffer: dict[int, tuple[Path, Any]] = {}
+        next_seq = 0
+        try:
+            while (item := await out_queue.get()) is not done:
+                seq, path, result = item
+                if ordered:
+                    reorder_buffer[seq] = (path, result)
+                    ready = []
+                    while next_seq in reorder_buffer:
+                        ready.append(reorder_buffer.pop(next_seq))
+                        next_seq += 1
+                else:
+                    ready = [(path, result)]
+
+                for path, result in ready:
+                    in_flight.release()
+                    pending -= 1
+                    if metrics is not None:
+                        metrics.in_flight.dec()
+                    if isinstance(result, Exception):
+                        logger.error(f"Fehler bei {path}: {result}")
+                    elif result is not None:
+                        yield path, result
+
+            # Fehler der Pipeline-Stufen (z.B. bei der Dateisuche) weiterreichen
+            for task in tasks:
+                await task
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            io_pool.shutdown(wait=False, cancel_futures=True)
+            score_pool.shutdown(wait=False, cancel_futures=True)
+            if metrics is not None:
+                metrics.in_flight.dec(pending)
+
+    async def score_directory_async(
+        self,
+        dir_path: str | Path,
+        pattern: str = "*.json",
+        max_in_flight: int = 64,
+        ordered: bool = True,
+        shard: ShardSpec | None = None
+    ) -> list[ScoreResult]:
+        """
+        Asynchrone Batch-Verarbeitung eines Verzeichnisses.
 
-        return valid_results
+        Nutzt die Pipeline aus ``iter_score_directory_async``; Ergebnisse
+        werden standardmäßig in Fundreihenfolge zurückgegeben.
+        """
+        results = [
+            result async for _, result in self.iter_score_directory_async(
+                dir_path, pattern, max_in_flight=max_in_flight, ordered=ordered, shard=shard
+            )
+        ]
+        logger.info(f"Verarbeitet: {len(results)} Dateien")
+        return results
+
+    def enable_profiling(self, callback: Callable[[str, int], None] | None = None) -> StageProfiler:
+        """
+        Aktiviert die Laufzeitmessung pro Verarbeitungsstufe.
+
+        Args:
+            callback: Optionaler Callback (stufe, nanosekunden) pro Messung
+
+        Returns:
+            Der aktive StageProfiler
+        """
+        self.profiler = StageProfiler(callback)
+        return self.profiler
+
+    def disable_profiling(self) -> None:
+        """Deaktiviert die Laufzeitmessung."""
+        self.profiler = None
+
+    def get_profile(self) -> dict:
+        """Gibt die Aufschlüsselung pro Stufe zurück (leer ohne Profiler)."""
+        return self.profiler.get_report() if self.profiler is not None else {}
 
     def get_agent_statistics(self) -> dict[str, AgentStatistics]:
-        """Gibt die gesammelten Agent-Statistiken zurück."""
-        return dict(self._agent_stats)
+        """
+        Gibt die gesammelten Agent-Statistiken zurück.
+
+        Die Shards der Scoring-Threads werden erst hier zusammengeführt;
+        das Ergebnis ist eine Momentaufnahme, die sich danach nicht mehr ändert.
+        """
+        return self._agent_stats.snapshot()
 
-    def get_summary(self, results: list[ScoreResult]) -> dict:
+    def get_summary(self, results: Iterable[ScoreResult]) -> dict:
         """
         Erstellt eine Zusammenfassung der Ergebnisse.
 
         Args:
-            results: Liste der Scoring-Ergebnisse
+            results: Scoring-Ergebnisse (Liste, ScoreResultBatch oder beliebiges Iterable)
 
         Returns:
             Dictionary mit Zusammenfassung
         """
-        if not results:
-            return {"total": 0, "message": "Keine Ergebnisse"}
+        accumulator = SummaryAccumulator()
+        for r in results:
+            accumulator.add(r)
+        return accumulator.to_dict()
 
-        risk_counts = defaultdict(int)
-        total_risk = 0
-        critical_results = []
+    def reset_statistics(self) -> None:
+        """Setzt die Statistiken zurück."""
+        self._agent_stats.clear()
 
-        for r in results:
-            risk_counts[r.risk_level.value] += 1
-            total_risk += r.risk
-            if r.is_critical():
-                critical_results.append({
-                    "agent_id": r.agent_id,
-                    "risk_level": r.risk_level.value,
-                    "violations": r.violations
+
+_RISK_LEVELS = list(RiskLevel)
+_RISK_LEVEL_INDEX = {level: index for index, level in enumerate(_RISK_LEVELS)}
+
+
+@functools.lru_cache(maxsize=None)
+def _numpy() -> Any:
+    """NumPy, falls installiert (optionale Abhängigkeit für ``score_logs``), sonst None."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def _batch_risk(
+    price: bytearray,
+    legal: bytearray,
+    stop: bytearray,
+    placeholder: bytearray,
+    config: ScoringConfig
+) -> tuple[list[int], list[int]]:
+    """
+    Risikoscores und Level-Indizes (in ``_RISK_LEVELS``) für Flag-Spalten.
+
+    Rechnet wie ``AgentLogScorer._risk_score`` und ``_get_risk_level``; mit
+    NumPy für alle Zeilen auf einmal. Ein nicht ganzzahliger
+    ``placeholder_bonus`` wird wie im Einzelpfad in Python gerechnet.
+    """
+    np = _numpy()
+    if np is None or not isinstance(config.placeholder_bonus, int):
+        risks = [
+            AgentLogScorer._risk_score(
+                bool(price_flag), bool(legal_flag), bool(stop_flag), bool(placeholder_flag), config
+            )
+            for price_flag, legal_flag, stop_flag, placeholder_flag in zip(price, legal, stop, placeholder)
+        ]
+        thresholds = config.risk_thresholds
+        bounds = (thresholds.get("low", 0), thresholds.get("medium", 1), thresholds.get("high", 2))
+        levels = [next((i for i, bound in enumerate(bounds) if risk <= bound), 3) for risk in risks]
+        return risks, levels
+
+    price_column = np.frombuffer(price, dtype=np.uint8).astype(np.int64)
+    legal_column = np.frombuffer(legal, dtype=np.uint8).astype(np.int64)
+    stop_column = np.frombuffer(stop, dtype=np.uint8).astype(np.int64)
+    claims = (price_column | legal_column).astype(bool)
+    bonus = np.where(np.frombuffer(placeholder, dtype=np.uint8).astype(bool) & claims, config.placeholder_bonus, 0)
+    risk_column = np.maximum(price_column + legal_column - stop_column + bonus, 0)
+
+    # Wie die if-Kette in _get_risk_level: die erste passende Schwelle gewinnt
+    thresholds = config.risk_thresholds
+    level_column = np.select(
+        [
+            risk_column <= thresholds.get("low", 0),
+            risk_column <= thresholds.get("medium", 1),
+            risk_column <= thresholds.get("high", 2),
+        ],
+        [0, 1, 2],
+        default=3,
+    )
+    return risk_column.tolist(), level_column.tolist()
+
+
+def _group_statistics(results: list[ScoreResult]) -> dict[str, AgentStatistics]:
+    """
+    Agent-Statistiken eines Batches als gruppierte Summen je Agent.
+
+    Entspricht ``AgentStatistics.add`` für jedes Ergebnis. Mit NumPy werden
+    die Zeilen nach Agent sortiert und alle Zähler mit einem
+    ``add.reduceat`` summiert; Agenten erscheinen in der Reihenfolge ihres
+    ersten Ergebnisses. Nicht ganzzahlige Risikoscores (z.B. bei
+    ``placeholder_bonus: -1.5``) würden in der int64-Spalte abgeschnitten
+    und werden wie in ``_batch_risk`` in Python summiert.
+    """
+    np = _numpy()
+    if np is None or not all(isinstance(r.risk, int) for r in results):
+        partial: dict[str, AgentStatistics] = {}
+        for result in results:
+            stats = partial.get(result.agent_id)
+            if stats is None:
+                stats = partial[result.agent_id] = AgentStatistics(agent_id=result.agent_id)
+            stats.add(result)
+        return partial
+
+    count = len(results)
+    agent_index: dict = {}
+    codes = np.fromiter(
+        (agent_index.setdefault(r.agent_id, len(agent_index)) for r in results), dtype=np.intp, count=count
+    )
+    levels = np.fromiter((_RISK_LEVEL_INDEX[r.risk_level] for r in results), dtype=np.int64, count=count)
+    columns = np.stack([
+        np.fromiter((r.risk for r in results), dtype=np.int64, count=count),
+        np.fromiter((r.price_claim for r in results), dtype=bool, count=count),
+        np.fromiter((r.legal_claim for r in results), dtype=bool, count=count),
+        np.fromiter((r.stop_triggered for r in results), dtype=bool, count=count),
+        np.fromiter((r.placeholder_used for r in results), dtype=bool, count=count),
+        levels >= ScoreResultBatch.CRITICAL_FROM,
+        *(levels == level for level in range(len(_RISK_LEVELS))),
+    ]).astype(np.int64)
+
+    # Jede Gruppe ist nicht leer: Startpositionen aus den Gruppengrößen
+    order = np.argsort(codes, kind="stable")
+    sizes = np.bincount(codes, minlength=len(agent_index))
+    starts = np.concatenate(([0], np.cumsum(sizes)[:-1]))
+    sums = np.add.reduceat(columns[:, order], starts, axis=1).T.tolist()
+    sizes = sizes.tolist()
+
+    partial = {}
+    for agent_id, code in agent_index.items():
+        risk, price, legal, stops, placeholders, critical, *level_counts = sums[code]
+        partial[agent_id] = AgentStatistics(
+            agent_id=agent_id,
+            total_interactions=sizes[code],
+            total_risk_score=risk,
+            price_claims=price,
+            legal_claims=legal,
+            stops_triggered=stops,
+            placeholders_used=placeholders,
+            critical_incidents=critical,
+            risk_levels={level.value: n for level, n in zip(_RISK_LEVELS, level_counts)},
+        )
+    return partial
+
+
+class ScoreResultView:
+    """
+    Zeilenansicht auf ein Ergebnis in einem ScoreResultBatch.
+
+    Verhält sich lesend wie ein ScoreResult (gleiche Attribute, ``to_dict``,
+    ``is_critical``), dekodiert die Werte aber erst beim Zugriff.
+    """
+
+    __slots__ = ("_batch", "_index")
+
+    def __init__(self, batch: "ScoreResultBatch", index: int):
+        self._batch = batch
+        self._index = index
+
+    @property
+    def agent_id(self) -> str:
+        return self._batch._agent_table[self._batch._agent_ids[self._index]]
+
+    @property
+    def contact(self) -> str | None:
+        return self._batch._get_text(self._index, 0)
+
+    @property
+    def timestamp(self) -> str | None:
+        return self._batch._get_text(self._index, 1)
+
+    @property
+    def price_claim(self) -> bool:
+        return bool(self._batch._flags[self._index] & ScoreResultBatch.PRICE)
+
+    @property
+    def legal_claim(self) -> bool:
+        return bool(self._batch._flags[self._index] & ScoreResultBatch.LEGAL)
+
+    @property
+    def stop_triggered(self) -> bool:
+        return bool(self._batch._flags[self._index] & ScoreResultBatch.STOP)
+
+    @property
+    def placeholder_used(self) -> bool:
+        return bool(self._batch._flags[self._index] & ScoreResultBatch.PLACEHOLDER)
+
+    @property
+    def price_keywords_found(self) -> list[str]:
+        batch = self._batch
+        return batch._decode_ids(batch._price_ids, batch._price_ends, self._index, batch._keyword_table)
+
+    @property
+    def legal_keywords_found(self) -> list[str]:
+        batch = self._batch
+        return batch._decode_ids(batch._legal_ids, batch._legal_ends, self._index, batch._keyword_table)
+
+    @property
+    def violations(self) -> list[str]:
+        batch = self._batch
+        return batch._decode_ids(batch._violation_ids, batch._violation_ends, self._index, batch._violation_table)
+
+    @property
+    def risk(self) -> int:
+        batch = self._batch
+        risk = batch._risks[self._index]
+        return risk if batch._flags[self._index] & batch.RISK_FLOAT else int(risk)
+
+    @property
+    def risk_level(self) -> RiskLevel:
+        return _RISK_LEVELS[self._batch._levels[self._index]]
+
+    @property
+    def config_version(self) -> str | None:
+        return self._batch._version_table[self._batch._version_ids[self._index]]
+
+    def is_critical(self) -> bool:
+        """Prüft ob das Ergebnis kritisch ist."""
+        return self._batch._levels[self._index] >= ScoreResultBatch.CRITICAL_FROM
+
+    def to_result(self) -> ScoreResult:
+        """Materialisiert die Zeile als ScoreResult."""
+        return ScoreResult(
+            agent_id=self.agent_id,
+            contact=self.contact,
+            timestamp=self.timestamp,
+            price_claim=self.price_claim,
+            price_keywords_found=self.price_keywords_found,
+            legal_claim=self.legal_claim,
+            legal_keywords_found=self.legal_keywords_found,
+            stop_triggered=self.stop_triggered,
+            placeholder_used=self.placeholder_used,
+            risk=self.risk,
+            risk_level=self.risk_level,
+            violations=self.violations,
+            config_version=self.config_version
+        )
+
+    def to_dict(self) -> dict:
+        """Konvertiert zu Dictionary für JSON-Export (identisch zu ScoreResult.to_dict)."""
+        return self.to_result().to_dict()
+
+    def __repr__(self) -> str:
+        return f"ScoreResultView({self.to_result()!r})"
+
+
+class ScoreResultBatch:
+    """
+    Spaltenbasierter Speicher für sehr viele ScoreResults.
+
+    Statt eines Objekts pro Ergebnis werden parallele Arrays gehalten:
+    Risk, Level und Flags als kompakte Zahlen (Risk als Ganzzahl, ab dem
+    ersten nicht ganzzahligen Risk als Gleitkommazahl), Agent-IDs, gefundene
+    Keywords und Verstöße als IDs gegen internierte Tabellen (die
+    Keyword-Tabelle ist mit den Keywords der Konfiguration vorbelegt),
+    Kontakt und Zeitstempel als UTF-8 in einem gemeinsamen Puffer.
+
+    Iteration und Indexzugriff liefern ScoreResultView-Objekte, die überall
+    akzeptiert werden, wo ScoreResults gelesen werden (``get_summary``,
+    ``DashboardGenerator.generate``, Report-Writer).
+    """
+
+    PRICE = 1
+    LEGAL = 2
+    STOP = 4
+    PLACEHOLDER = 8
+    CONTACT_NONE = 16
+    TIMESTAMP_NONE = 32
+    RISK_FLOAT = 64
+    CRITICAL_FROM = _RISK_LEVELS.index(RiskLevel.HIGH)
+
+    def __init__(self, config: ScoringConfig | None = None):
+        self._risks: array = array('i')
+        self._levels = array('B')
+        self._flags = array('B')
+        self._agent_ids = array('I')
+        self._agent_table: list = []
+        self._agent_index: dict = {}
+
+        self._keyword_table: list[str] = []
+        self._keyword_index: dict[str, int] = {}
+        if config is not None:
+            for keyword in config.price_keywords + config.legal_keywords:
+                self._intern(keyword, self._keyword_table, self._keyword_index)
+        self._price_ids = array('I')
+        self._price_ends = array('I')
+        self._legal_ids = array('I')
+        self._legal_ends = array('I')
+
+        self._violation_table: list[str] = []
+        self._violation_index: dict[str, int] = {}
+        self._violation_ids = array('I')
+        self._violation_ends = array('I')
+
+        # Konfigurationsversionen wiederholen sich fast immer
+        self._version_table: list[str | None] = []
+        self._version_index: dict[str | None, int] = {}
+        self._version_ids = array('I')
+
+        # Kontakt und Zeitstempel: zwei End-Offsets pro Zeile
+        self._text = bytearray()
+        self._text_ends = array('Q')
+
+    @classmethod
+    def from_results(cls, results: Iterable[ScoreResult], config: ScoringConfig | None = None) -> "ScoreResultBatch":
+        """Erstellt einen Batch aus einem (auch streamenden) Iterable von Ergebnissen."""
+        batch = cls(config)
+        batch.extend(results)
+        return batch
+
+    @staticmethod
+    def _intern(value: Any, table: list, index: dict) -> int:
+        value_id = index.get(value)
+        if value_id is None:
+            value_id = len(table)
+            index[value] = value_id
+            table.append(value)
+        return value_id
+
+    def append(self, result: ScoreResult) -> None:
+        """Fügt ein Ergebnis hinzu."""
+        flags = 0
+        if result.price_claim:
+            flags |= self.PRICE
+        if result.legal_claim:
+            flags |= self.LEGAL
+        if result.stop_triggered:
+            flags |= self.STOP
+        if result.placeholder_used:
+            flags |= self.PLACEHOLDER
+        if result.contact is None:
+            flags |= self.CONTACT_NONE
+        if result.timestamp is None:
+            flags |= self.TIMESTAMP_NONE
+        if not isinstance(result.risk, int):
+            # z.B. bei nicht ganzzahligem placeholder_bonus
+            flags |= self.RISK_FLOAT
+            if self._risks.typecode != 'd':
+                self._risks = array('d', self._risks)
+
+        self._risks.append(result.risk)
+        self._levels.append(_RISK_LEVELS.index(result.risk_level))
+        self._flags.append(flags)
+        self._agent_ids.append(self._intern(result.agent_id, self._agent_table, self._agent_index))
+        self._version_ids.append(self._intern(result.config_version, self._version_table, self._version_index))
+
+        for ids, ends, values, table, index in (
+            (self._price_ids, self._price_ends, result.price_keywords_found, self._keyword_table, self._keyword_index),
+            (self._legal_ids, self._legal_ends, result.legal_keywords_found, self._keyword_table, self._keyword_index),
+            (self._violation_ids, self._violation_ends, result.violations, self._violation_table, self._violation_index),
+        ):
+            for value in values:
+                ids.append(self._intern(value, table, index))
+            ends.append(len(ids))
+
+        for text in (result.contact, result.timestamp):
+            if text is not None:
+                self._text += str(text).encode("utf-8")
+            self._text_ends.append(len(self._text))
+
+    def extend(self, results: Iterable[ScoreResult]) -> None:
+        """Fügt alle Ergebnisse eines Iterables hinzu."""
+        for result in results:
+            self.append(result)
+
+    def _get_text(self, index: int, slot: int) -> str | None:
+        if self._flags[index] & (self.CONTACT_NONE if slot == 0 else self.TIMESTAMP_NONE):
+            return None
+        position = 2 * index + slot
+        start = self._text_ends[position - 1] if position else 0
+        return self._text[start:self._text_ends[position]].decode("utf-8")
+
+    @staticmethod
+    def _decode_ids(ids: array, ends: array, index: int, table: list) -> list:
+        start = ends[index - 1] if index else 0
+        return [table[value_id] for value_id in ids[start:ends[index]]]
+
+    def __len__(self) -> int:
+        return len(self._risks)
+
+    def __getitem__(self, index: int) -> ScoreResultView:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("ScoreResultBatch-Index außerhalb des Bereichs")
+        return ScoreResultView(self, index)
+
+    def __iter__(self) -> Iterator[ScoreResultView]:
+        for index in range(len(self)):
+            yield ScoreResultView(self, index)
+
+    def nbytes(self) -> int:
+        """Ungefährer Speicherbedarf der Spalten in Bytes (ohne internierte Tabellen)."""
+        columns = (
+            self._risks, self._levels, self._flags, self._agent_ids,
+            self._price_ids, self._price_ends, self._legal_ids, self._legal_ends,
+            self._violation_ids, self._violation_ends, self._text_ends
+        )
+        return sum(column.itemsize * len(column) for column in columns) + len(self._text)
+
+
+class SummaryAccumulator:
+    """
+    Inkrementeller Aufbau der Zusammenfassung aus ``AgentLogScorer.get_summary``.
+
+    Ergebnisse werden einzeln hinzugefügt und nicht gespeichert; nur die
+    kritischen Vorfälle werden für die Ausgabe behalten (abschaltbar über
+    ``collect_incidents``, dann wird nur ihre Anzahl gezählt).
+    """
+
+    def __init__(self, collect_incidents: bool = True):
+        self.collect_incidents = collect_incidents
+        self.total = 0
+        self.total_risk = 0
+        self.critical_count = 0
+        self.risk_counts: dict[str, int] = defaultdict(int)
+        self.critical_results: list[dict] = []
+        self.agent_ids: set = set()
+
+    def add(self, result: ScoreResult) -> None:
+        """Nimmt ein Ergebnis in die Zusammenfassung auf."""
+        self.total += 1
+        self.total_risk += result.risk
+        self.risk_counts[result.risk_level.value] += 1
+        self.agent_ids.add(result.agent_id)
+        if result.is_critical():
+            self.critical_count += 1
+            if self.collect_incidents:
+                self.critical_results.append({
+                    "agent_id": result.agent_id,
+                    "risk_level": result.risk_level.value,
+                    "violations": result.violations
                 })
 
+    def merge(self, other: "SummaryAccumulator") -> "SummaryAccumulator":
+        """Übernimmt Zähler und Vorfälle einer anderen Zusammenfassung."""
+        self.total += other.total
+        self.total_risk += other.total_risk
+        self.critical_count += other.critical_count
+        for level, count in other.risk_counts.items():
+            self.risk_counts[level] += count
+        self.critical_results.extend(other.critical_results)
+        self.agent_ids |= other.agent_ids
+        return self
+
+    def to_dict(self) -> dict:
+        """Gibt die Zusammenfassung im Format von ``get_summary`` zurück."""
+        if not self.total:
+            return {"total": 0, "message": "Keine Ergebnisse"}
+
         return {
-            "total": len(results),
-            "average_risk": round(total_risk / len(results), 2),
-            "risk_distribution": dict(risk_counts),
-            "critical_count": len(critical_results),
-            "critical_incidents": critical_results,
-            "agents_analyzed": len(set(r.agent_id for r in results))
+            "total": self.total,
+            "average_risk": round(self.total_risk / self.total, 2),
+            "risk_distribution": dict(self.risk_counts),
+            "critical_count": self.critical_count,
+            "critical_incidents": self.critical_results,
+            "agents_analyzed": len(self.agent_ids)
         }
 
-    def reset_statistics(self) -> None:
-        """Setzt die Statistiken zurück."""
-        self._agent_stats.clear()
 
+class StatisticsAggregate:
+    """
+    Serialisierbares, zusammenführbares Teilaggregat eines Scoring-Laufs.
+
+    Enthält alles für Agent-Statistiken, ``get_summary`` und das
+    Supervisor-Dashboard, ohne die einzelnen Ergebnisse: die Rohzähler pro
+    Agent, die Summary-Zähler, die kritischen Vorfälle und den Top-K-Index
+    der potenziellen Issues. ``merge`` ist assoziativ und kommutativ;
+    Vorfälle werden in kanonischer Reihenfolge ausgegeben. Das Zusammenführen von
+    Teilaggregaten (z.B. pro Host) ergibt damit exakt dasselbe wie ein
+    einziges Aggregat über alle Logs.
+    """
+
+    FORMAT = "agent-log-scorer/partial"
+    VERSION = 2
+
+    def __init__(self, config_fingerprint: str | None = None):
+        self.config_fingerprint = config_fingerprint
+        self.agents: dict[str, AgentStatistics] = {}
+        self.summary = SummaryAccumulator()
+        self.dashboard = DashboardAccumulator()
+
+    def add(self, result: ScoreResult) -> None:
+        """Nimmt ein Ergebnis auf."""
+        stats = self.agents.get(result.agent_id)
+        if stats is None:
+            stats = self.agents[result.agent_id] = AgentStatistics(agent_id=result.agent_id)
+        stats.add(result)
+        self.summary.add(result)
+        self.dashboard.add(result)
+
+    def merge(self, other: "StatisticsAggregate") -> "StatisticsAggregate":
+        """
+        Führt ein anderes Teilaggregat in dieses zusammen.
 
-class ReportGenerator:
-    """Generiert Reports in verschiedenen Formaten."""
+        Raises:
+            ValueError: Wenn die Teilaggregate mit unterschiedlicher Konfiguration erstellt wurden
+        """
+        if self.config_fingerprint and other.config_fingerprint and self.config_fingerprint != other.config_fingerprint:
+            raise ValueError("Teilaggregate stammen aus unterschiedlichen Konfigurationen")
+        self.config_fingerprint = self.config_fingerprint or other.config_fingerprint
+        for agent_id, partial in other.agents.items():
+            stats = self.agents.get(agent_id)
+            if stats is None:
+                stats = self.agents[agent_id] = AgentStatistics(agent_id=agent_id)
+            stats.merge(partial)
+        self.summary.merge(other.summary)
+        self.dashboard.merge(other.dashboard)
+        return self
 
     @staticmethod
-    def to_json(results: list[ScoreResult], output_path: str | Path) -> None:
-        """Exportiert Ergebnisse als JSON."""
-        data = [r.to_dict() for r in results]
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(data, indent=2, ensure_ascii=False, fp=f)
-        logger.info(f"JSON-Report gespeichert: {output_path}")
+    def _incident_key(incident: dict) -> tuple:
+        return str(incident["agent_id"]), incident["risk_level"], incident["violations"]
+
+    def get_agent_statistics(self) -> dict[str, AgentStatistics]:
+        """Agent-Statistiken, nach Agent-ID sortiert."""
+        return {agent_id: self.agents[agent_id] for agent_id in sorted(self.agents, key=str)}
+
+    def get_summary(self) -> dict:
+        """Zusammenfassung im Format von ``get_summary`` (Vorfälle in kanonischer Reihenfolge)."""
+        summary = self.summary.to_dict()
+        if self.summary.total:
+            summary["risk_distribution"] = {
+                level.value: self.summary.risk_counts[level.value]
+                for level in _RISK_LEVELS if self.summary.risk_counts.get(level.value)
+            }
+            summary["critical_incidents"] = sorted(summary["critical_incidents"], key=self._incident_key)
+        return summary
+
+    def get_dashboard(self) -> dict:
+        """Supervisor-Dashboard wie ``DashboardGenerator.generate``."""
+        return self.dashboard.to_dashboard(self.get_agent_statistics())
+
+    def to_dict(self) -> dict:
+        """Stabiles, kanonisch sortiertes Serialisierungsformat."""
+        return {
+            "format": self.FORMAT,
+            "version": self.VERSION,
+            "config_fingerprint": self.config_fingerprint,
+            "agents": [stats.to_state() for stats in self.get_agent_statistics().values()],
+            "summary": {
+                "total": self.summary.total,
+                "total_risk": self.summary.total_risk,
+                "critical_count": self.summary.critical_count,
+                "risk_counts": {
+                    level.value: self.summary.risk_counts[level.value]
+                    for level in _RISK_LEVELS if self.summary.risk_counts.get(level.value)
+                },
+                "critical_incidents": sorted(self.summary.critical_results, key=self._incident_key),
+                "agent_ids": sorted(self.summary.agent_ids, key=str),
+            },
+            "dashboard": self.dashboard.to_state(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "StatisticsAggregate":
+        """
+        Liest ein Teilaggregat aus ``to_dict``.
+
+        Raises:
+            ValueError: Bei unbekanntem Format oder nicht unterstützter Version
+        """
+        if data.get("format") != cls.FORMAT:
+            raise ValueError(f"Kein Teilaggregat (format={data.get('format')!r})")
+        if data.get("version") != cls.VERSION:
+            raise ValueError(f"Nicht unterstützte Version des Teilaggregats: {data.get('version')}")
+
+        aggregate = cls(data.get("config_fingerprint"))
+        for state in data["agents"]:
+            aggregate.agents[state["agent_id"]] = AgentStatistics.from_state(state)
+        summary = data["summary"]
+        aggregate.summary.total = summary["total"]
+        aggregate.summary.total_risk = summary["total_risk"]
+        aggregate.summary.critical_count = summary["critical_count"]
+        aggregate.summary.risk_counts.update(summary["risk_counts"])
+        aggregate.summary.critical_results = list(summary["critical_incidents"])
+        aggregate.summary.agent_ids = set(summary["agent_ids"])
+        aggregate.dashboard = DashboardAccumulator.from_state(data["dashboard"])
+        return aggregate
+
+    def save(self, path: str | Path) -> None:
+        """Speichert das Teilaggregat als JSON (atomar)."""
+        path = Path(path)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, indent=1)
+        os.replace(tmp_path, path)
+        logger.info(f"Teilaggregat gespeichert: {path} ({self.summary.total} Ergebnisse)")
+
+    @classmethod
+    def load(cls, path: str | Path) -> "StatisticsAggregate":
+        """Lädt ein mit ``save`` geschriebenes Teilaggregat."""
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls.from_dict(json.load(f))
+
+
+# Schlüssel, nach denen ein Korpus auf Shards verteilt werden kann
+SHARD_KEYS = ("path", "agent")
+
+
+@dataclass(frozen=True)
+class ShardSpec:
+    """
+    Auswahl eines Shards für verteilte Batch-Läufe (``--shard I/N``).
+
+    Jede Datei (bzw. JSONL-Zeile) gehört über einen stabilen Hash genau zu
+    einem der ``count`` Shards. ``key="path"`` verteilt nach dem relativen
+    Dateipfad (bzw. der Zeilennummer) und ist sehr gleichmäßig;
+    ``key="agent"`` verteilt nach ``agent_id``, sodass die Statistiken jedes
+    Agenten vollständig in einem Shard liegen (die Balance hängt dann von
+    der Verteilung der Logs auf die Agenten ab).
+    """
+    index: int
+    count: int
+    key: str = "path"
+
+    def __post_init__(self):
+        if self.count < 1 or not 0 <= self.index < self.count:
+            raise ValueError(f"Ungültiger Shard {self.index}/{self.count} (erwartet 0 <= I < N)")
+        if self.key not in SHARD_KEYS:
+            raise ValueError(f"Unbekannter Shard-Schlüssel: {self.key} (erlaubt: {', '.join(SHARD_KEYS)})")
+
+    @classmethod
+    def parse(cls, spec: str, key: str = "path") -> "ShardSpec":
+        """Liest eine Angabe der Form ``I/N`` (I von 0 bis N-1)."""
+        index, sep, count = spec.partition("/")
+        if not sep or not index.strip().isdigit() or not count.strip().isdigit():
+            raise ValueError(f"Ungültige Shard-Angabe: {spec!r} (erwartet I/N)")
+        return cls(int(index), int(count), key)
 
     @staticmethod
-    def to_csv(results: list[ScoreResult], output_path: str | Path) -> None:
-        """Exportiert Ergebnisse als CSV."""
-        if not results:
+    def bucket(key: str, count: int) -> int:
+        """Stabiler Shard eines Schlüssels (unabhängig von Prozess, Rechner und PYTHONHASHSEED)."""
+        digest = hashlib.blake2b(key.encode("utf-8", "surrogatepass"), digest_size=8).digest()
+        return int.from_bytes(digest, "big") % count
+
+    def owns(self, key: str) -> bool:
+        """Ob der Schlüssel zu diesem Shard gehört."""
+        return self.bucket(key, self.count) == self.index
+
+    def owns_path(self, file_path: Path, root: str | Path) -> bool:
+        """Ob die Datei zu diesem Shard gehört (bei ``key="agent"`` erst nach dem Laden entscheidbar)."""
+        return self.key != "path" or self.owns(Path(file_path).relative_to(root).as_posix())
+
+    def owns_log(self, log: Any) -> bool:
+        """Ob das geladene Log zu diesem Shard gehört (bei ``key="path"`` immer True)."""
+        if self.key != "agent":
+            return True
+        agent_id = log.get("agent_id") if isinstance(log, dict) else None
+        # Ungültige Logs landen in genau einem Shard und werden dort als Fehler gemeldet
+        return self.owns("" if agent_id is None else str(agent_id))
+
+    def output_path(self, path: str | Path) -> str:
+        """
+        Ausgabepfad dieses Shards: ``{shard}`` wird durch den Index ersetzt,
+        sonst wird ``.shardIofN`` vor der Dateiendung eingefügt.
+        """
+        path = str(path)
+        if "{shard}" in path:
+            return path.replace("{shard}", str(self.index))
+        p = Path(path)
+        return str(p.with_name(f"{p.stem}.shard{self.index}of{self.count}{p.suffix}"))
+
+    def __str__(self) -> str:
+        return f"{self.index}/{self.count} ({self.key})"
+
+
+# Scorer des aktuellen Worker-Prozesses (siehe AgentLogScorer._score_files_parallel)
+_worker_scorer: AgentLogScorer | None = None
+_worker_shard: ShardSpec | None = None
+
+
+def _init_worker_scorer(
+    config: ScoringConfig,
+    cache_args: tuple[str, int] | None = None,
+    profile: bool = False,
+    collect_metrics: bool = False,
+    shard: ShardSpec | None = None,
+    fast: bool = False
+) -> None:
+    """Initialisiert den Scorer eines Worker-Prozesses."""
+    global _worker_scorer, _worker_shard
+    _worker_shard = shard
+    cache = ResultCache(*cache_args) if cache_args else None
+    _worker_scorer = AgentLogScorer(
+        config=config, cache=cache, profiler=StageProfiler() if profile else None, fast=fast
+    )
+    if collect_metrics:
+        # Nach dem Konstruktor setzen: Cache-Zähler kommen über cache_counts zum Elternprozess
+        _worker_scorer.metrics = ScorerMetrics()
+
+
+class _ChunkResult(NamedTuple):
+    """Ergebnis eines Worker-Chunks."""
+    scored: list[tuple[Path, ScoreResult | None]]
+    stats: dict[str, AgentStatistics]
+    cache_counts: tuple[int, int]
+    profile: StageProfiler | None
+    metrics: ScorerMetrics | None
+
+
+def _score_file_chunk(files: list[Path]) -> _ChunkResult:
+    """
+    Bewertet einen Chunk von Dateien im Worker.
+
+    Returns:
+        Ergebnisse, Teilstatistiken, (Cache-Hits, Cache-Misses) sowie Profil
+        und Metriken des Chunks (None, wenn nicht aktiviert)
+    """
+    scorer = _worker_scorer
+    if scorer is None:
+        raise RuntimeError("Worker-Scorer nicht initialisiert")
+
+    scored = scorer._score_files(files, shard=_worker_shard)
+    partial_stats = scorer.get_agent_statistics()
+    scorer.reset_statistics()
+
+    cache_counts = (0, 0)
+    if scorer.cache is not None:
+        scorer.cache.flush()
+        cache_counts = (scorer.cache.hits, scorer.cache.misses)
+        scorer.cache.hits = scorer.cache.misses = 0
+
+    profile = scorer.profiler
+    if profile is not None:
+        scorer.profiler = StageProfiler()
+    metrics = scorer.metrics
+    if metrics is not None:
+        scorer.metrics = ScorerMetrics()
+    return _ChunkResult(scored, partial_stats, cache_counts, profile, metrics)
+
+
+class ScoreManifest:
+    """
+    On-Disk-Manifest bereits bewerteter Dateien für inkrementelles Re-Scoring.
+
+    Pro Datei werden Größe, mtime, SHA-256 des Inhalts und das Ergebnis
+    gespeichert. Stimmen Größe und mtime überein, gilt die Datei als
+    unverändert; sonst entscheidet der Content-Hash. Weicht der
+    Config-Fingerprint (oder der Shard bzw. der schnelle Modus) ab, wird das
+    gesamte Manifest verworfen.
+    """
+
+    VERSION = 1
+
+    def __init__(
+        self,
+        path: str | Path,
+        config: ScoringConfig,
+        shard: ShardSpec | None = None,
+        fast: bool = False
+    ):
+        self.path = Path(path)
+        self.config_fingerprint = config.fingerprint() if shard is None else f"{config.fingerprint()}:{shard}"
+        if fast:
+            # Schnelle Ergebnisse ohne Keyword-Listen/Verstöße nicht im vollen Modus wiederverwenden
+            self.config_fingerprint += ":fast"
+        self.entries: dict[str, dict] = {}
+        self.updated: set[Path] = set()
+        self._load()
+
+    def _load(self) -> None:
+        """Lädt das Manifest, sofern es zur aktuellen Konfiguration passt."""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except (json.JSONDecodeError, OSError) as e:
+            logger.warning(f"Manifest {self.path} nicht lesbar, wird neu aufgebaut: {e}")
             return
 
-        fieldnames = [
-            'agent_id', 'contact', 'timestamp', 'price_claim', 'legal_claim',
-            'stop_triggered', 'placeholder_used', 'risk', 'risk_level', 'violations'
-        ]
+        if data.get("version") != self.VERSION or data.get("config_fingerprint") != self.config_fingerprint:
+            logger.info("Konfiguration geändert: Manifest wird verworfen")
+            return
+        self.entries = data.get("entries", {})
+
+    @staticmethod
+    def _key(file_path: Path) -> str:
+        return str(Path(file_path).resolve())
+
+    @staticmethod
+    def _digest(file_path: Path) -> str:
+        hasher = hashlib.sha256()
+        with open(file_path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                hasher.update(block)
+        return hasher.hexdigest()
+
+    def lookup(self, file_path: Path) -> tuple[bool, ScoreResult | None]:
+        """
+        Prüft ob eine Datei seit dem letzten Lauf unverändert ist.
+
+        Returns:
+            Tuple aus (unverändert, gespeichertes Ergebnis oder None bei
+            zuvor fehlerhafter Datei)
+        """
+        entry = self.entries.get(self._key(file_path))
+        if entry is None:
+            return False, None
+
+        try:
+            stat = os.stat(file_path)
+            if entry["size"] != stat.st_size or entry["mtime_ns"] != stat.st_mtime_ns:
+                if entry["size"] != stat.st_size or entry["sha256"] != self._digest(file_path):
+                    return False, None
+                # Nur mtime geändert (z.B. touch/Kopie): Inhalt identisch, beim
+                # nächsten Lauf genügt wieder der Vergleich von Größe und mtime
+                entry["mtime_ns"] = stat.st_mtime_ns
+        except OSError:
+            # Datei inzwischen gelöscht o.ä.: wie eine geänderte Datei behandeln
+            return False, None
+
+        result = entry.get("result")
+        return True, ScoreResult.from_dict(result) if result is not None else None
+
+    def snapshot(self, file_path: Path) -> dict | None:
+        """Erfasst Größe, mtime und Content-Hash einer Datei (None, wenn sie nicht lesbar ist)."""
+        try:
+            stat = os.stat(file_path)
+            return {
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+                "sha256": self._digest(file_path)
+            }
+        except OSError:
+            return None
+
+    def update(self, file_path: Path, snapshot: dict, result: ScoreResult | None) -> None:
+        """Speichert das (neue) Ergebnis einer Datei zum Stand von ``snapshot``."""
+        self.entries[self._key(file_path)] = {
+            **snapshot,
+            "result": result.to_dict() if result is not None else None
+        }
+        self.updated.add(file_path)
+
+    def prune(self, files: Iterable[Path]) -> None:
+        """Entfernt Einträge für Dateien, die nicht mehr existieren."""
+        keep = {self._key(f) for f in files}
+        for key in [k for k in self.entries if k not in keep]:
+            del self.entries[key]
+
+    def save(self) -> None:
+        """Schreibt das Manifest atomar auf die Platte."""
+        data = {
+            "version": self.VERSION,
+            "config_fingerprint": self.config_fingerprint,
+            "entries": self.entries
+        }
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp_path, self.path)
+        logger.info(f"Manifest gespeichert: {self.path} ({len(self.entries)} Einträge)")
+
+
+class ResultCache:
+    """
+    Persistenter, inhaltsadressierter Cache für ScoreResults (SQLite).
+
+    Schlüssel ist der SHA-256 über den normalisierten Log-Inhalt (kanonisches
+    JSON) und den Config-Fingerprint; byte-identische oder erneut
+    gelieferte Logs werden so ohne erneute Extraktion bewertet. Die Anzahl
+    der Einträge ist begrenzt, verdrängt wird der am längsten nicht
+    genutzte Eintrag (LRU). Schreibzugriffe werden gebündelt committet.
+    """
+
+    COMMIT_INTERVAL = 256
+
+    def __init__(self, path: str | Path, max_entries: int = 100_000):
+        self.path = str(path)
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._pending_writes = 0
+
+        import sqlite3
+
+        self._conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS results ("
+            "key TEXT PRIMARY KEY, result TEXT NOT NULL, last_used INTEGER NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_results_last_used ON results (last_used)")
+        self._conn.commit()
 
-        with open(output_path, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            for r in results:
-                row = r.to_dict()
-                row['violations'] = "; ".join(row['violations'])
-                row['risk_level'] = row['risk_level']
-                # Nur relevante Felder
-                writer.writerow({k: row.get(k, '') for k in fieldnames})
+        self._count = 0
+        self._clock = 0
+        self.sync()
 
-        logger.info(f"CSV-Report gespeichert: {output_path}")
+    def sync(self) -> None:
+        """Liest Füllstand und LRU-Uhr neu ein (nach Schreibzugriffen anderer Prozesse)."""
+        with self._lock:
+            count, last_used = self._conn.execute("SELECT COUNT(*), MAX(last_used) FROM results").fetchone()
+            self._count = count
+            self._clock = max(self._clock, last_used or 0)
 
     @staticmethod
-    def to_html(results: list[ScoreResult], summary: dict, output_path: str | Path) -> None:
-        """Generiert einen HTML-Report."""
-        risk_colors = {
-            "LOW": "#28a745",
-            "MEDIUM": "#ffc107",
-            "HIGH": "#fd7e14",
-            "CRITICAL": "#dc3545"
+    def make_key(log: dict, config_fingerprint: str) -> str:
+        """Berechnet den Cache-Schlüssel aus normalisiertem Log und Config-Fingerprint."""
+        normalized = json.dumps(log, sort_keys=True, ensure_ascii=False, separators=(",", ":"), default=str)
+        hasher = hashlib.sha256(config_fingerprint.encode("ascii"))
+        hasher.update(normalized.encode("utf-8"))
+        return hasher.hexdigest()
+
+    def get(self, key: str) -> ScoreResult | None:
+        """Gibt das gecachte Ergebnis zurück oder None."""
+        with self._lock:
+            row = self._conn.execute("SELECT result FROM results WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._clock += 1
+            self._conn.execute("UPDATE results SET last_used = ? WHERE key = ?", (self._clock, key))
+            self._after_write()
+        return ScoreResult.from_dict(json.loads(row[0]))
+
+    def put(self, key: str, result: ScoreResult) -> None:
+        """Speichert ein Ergebnis und verdrängt bei Bedarf die ältesten Einträge."""
+        payload = json.dumps(result.to_dict(), ensure_ascii=False, separators=(",", ":"))
+        with self._lock:
+            self._clock += 1
+            cursor = self._conn.execute(
+                "INSERT OR IGNORE INTO results (key, result, last_used) VALUES (?, ?, ?)",
+                (key, payload, self._clock)
+            )
+            self._count += cursor.rowcount
+            if self._count > self.max_entries:
+                excess = self._count - self.max_entries
+                self._conn.execute(
+                    "DELETE FROM results WHERE key IN "
+                    "(SELECT key FROM results ORDER BY last_used LIMIT ?)",
+                    (excess,)
+                )
+                self._count -= excess
+            self._after_write()
+
+    def _after_write(self) -> None:
+        self._pending_writes += 1
+        if self._pending_writes >= self.COMMIT_INTERVAL:
+            self._conn.commit()
+            self._pending_writes = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def flush(self) -> None:
+        """Committet ausstehende Schreibzugriffe."""
+        with self._lock:
+            self._conn.commit()
+            self._pending_writes = 0
+
+    def close(self) -> None:
+        """Committet und schließt die Datenbank."""
+        self.flush()
+        self._conn.close()
+
+    def get_stats(self) -> dict:
+        """Gibt Hit/Miss-Zähler und Füllstand zurück."""
+        lookups = self.hits + self.misses
+        return {
+            "entries": self._count,
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0
         }
 
-        rows_html = ""
-        for r in results:
-            color = risk_colors.get(r.risk_level.value, "#6c757d")
-            violations_html = "<br>".join(r.violations) if r.violations else "-"
-            rows_html += f"""
-            <tr>
-                <td>{r.agent_id}</td>
-                <td>{r.contact or '-'}</td>
-                <td>{r.timestamp or '-'}</td>
-                <td>{'Ja' if r.price_claim else 'Nein'}</td>
-                <td>{'Ja' if r.legal_claim else 'Nein'}</td>
-                <td>{'Ja' if r.stop_triggered else 'Nein'}</td>
-                <td>{r.risk}</td>
-                <td style="background-color: {color}; color: white; font-weight: bold;">{r.risk_level.value}</td>
-                <td>{violations_html}</td>
-            </tr>
-            """
 
-        html = f"""<!DOCTYPE html>
+class ConfigReloader:
+    """
+    Lädt die Konfiguration eines lang laufenden Scorers im Hintergrund neu.
+
+    Ein Thread prüft alle ``interval`` Sekunden mtime und Größe der
+    YAML-Datei (``AgentLogScorer.check_config``); ``request`` erzwingt ein
+    Neuladen, z.B. aus einem SIGHUP-Handler. Parsen und Kompilieren laufen
+    in diesem Thread, der Scorer tauscht nur noch die fertige Konfiguration
+    aus; die Scoring-Schleife wartet dabei nie.
+    """
+
+    INTERVAL = 2.0
+
+    def __init__(self, scorer: AgentLogScorer, interval: float = INTERVAL):
+        if scorer.config_path is None:
+            raise ValueError("Scorer hat keinen Konfigurationspfad")
+        self.scorer = scorer
+        self.interval = interval
+        self._requested = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def request(self) -> None:
+        """Fordert ein Neuladen an (auch aus Signal-Handlern aufrufbar)."""
+        self._requested.set()
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            self._requested.wait(self.interval)
+            if self._stopped.is_set():
+                break
+            forced = self._requested.is_set()
+            self._requested.clear()
+            try:
+                if forced:
+                    self.scorer.reload_config()
+                else:
+                    self.scorer.check_config()
+            except Exception as e:
+                logger.error(f"Neuladen der Konfiguration fehlgeschlagen: {e}")
+
+    def start(self) -> "ConfigReloader":
+        """Startet den Hintergrund-Thread."""
+        self._thread = threading.Thread(target=self._run, name="config-reloader", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Beendet den Hintergrund-Thread."""
+        if self._thread is not None:
+            self._stopped.set()
+            self._requested.set()
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> "ConfigReloader":
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.stop()
+
+
+class _Inotify:
+    """Minimaler inotify-Zugriff über ctypes (nur Linux, ohne Zusatzpakete)."""
+
+    IN_MODIFY = 0x002
+    IN_CLOSE_WRITE = 0x008
+    IN_MOVED_TO = 0x080
+    IN_CREATE = 0x100
+    IN_Q_OVERFLOW = 0x4000
+    _EVENT = struct.Struct("iIII")
+
+    def __init__(self, dir_path: Path):
+        import ctypes
+        import ctypes.util
+
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self.fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 fehlgeschlagen")
+        mask = self.IN_MODIFY | self.IN_CLOSE_WRITE | self.IN_MOVED_TO | self.IN_CREATE
+        if libc.inotify_add_watch(self.fd, os.fsencode(dir_path), mask) < 0:
+            errno = ctypes.get_errno()
+            os.close(self.fd)
+            raise OSError(errno, f"inotify_add_watch fehlgeschlagen: {dir_path}")
+
+    def read(self, timeout: float) -> set[str] | None:
+        """Wartet bis ``timeout`` auf Events; gibt geänderte Dateinamen oder bei Überlauf None zurück."""
+        if not select.select([self.fd], [], [], timeout)[0]:
+            return set()
+        names: set[str] = set()
+        while True:
+            try:
+                data = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                return names
+            offset = 0
+            while offset < len(data):
+                _, mask, _, length = self._EVENT.unpack_from(data, offset)
+                offset += self._EVENT.size
+                if mask & self.IN_Q_OVERFLOW:
+                    return None
+                names.add(os.fsdecode(data[offset:offset + length].rstrip(b"\0")))
+                offset += length
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+class LogWatcher:
+    """
+    Überwacht ein Verzeichnis und bewertet neue Logs, sobald sie geschrieben werden.
+
+    Ein einziger, warm gehaltener ``AgentLogScorer`` bewertet nur neue
+    Inhalte: JSON-Dateien bei jeder Änderung, JSONL-Dateien ab dem zuletzt
+    gelesenen Offset (nur vollständige Zeilen; eine noch unvollständige
+    letzte Zeile wird beim nächsten Durchlauf gelesen). Änderungen werden
+    unter Linux über inotify erkannt, sonst über einen ``os.scandir``-Poll
+    von Größe und mtime. Gekürzte oder ersetzte JSONL-Dateien werden von
+    vorn gelesen.
+
+    Eine JSON-Datei, die sich nicht parsen lässt, wird meist noch
+    geschrieben: sie wird ohne Fehlermeldung zurückgestellt und erst nach
+    ``settle`` Sekunden erneut gelesen, statt bei jedem Schreibzugriff.
+    Erst wenn sie auch dann ungültig ist, wird ein Fehler gemeldet. Dateien,
+    die zwischen Erkennung und Lesen verschwinden oder nicht lesbar sind,
+    werden übersprungen.
+    """
+
+    SETTLE = 0.5
+
+    def __init__(
+        self,
+        scorer: AgentLogScorer,
+        dir_path: str | Path,
+        patterns: tuple[str, ...] = ("*.json", "*.jsonl"),
+        poll_interval: float = 0.2,
+        use_inotify: bool = True,
+        settle: float = SETTLE
+    ):
+        self.scorer = scorer
+        self.dir_path = Path(dir_path)
+        self.patterns = patterns
+        self.poll_interval = poll_interval
+        self.settle = settle
+        # Pfad -> (inode, Größe, mtime_ns, gelesener Offset)
+        self._state: dict[Path, tuple[int, int, int, int]] = {}
+        # Zurückgestellte JSON-Dateien -> Zeitpunkt des nächsten Versuchs (monotonic)
+        self._pending: dict[Path, float] = {}
+        self._inotify: _Inotify | None = None
+        if use_inotify and sys.platform.startswith("linux"):
+            try:
+                self._inotify = _Inotify(self.dir_path)
+            except (OSError, AttributeError) as e:
+                logger.warning(f"inotify nicht verfügbar, nutze Polling: {e}")
+
+    @property
+    def uses_inotify(self) -> bool:
+        return self._inotify is not None
+
+    def _matches(self, name: str) -> bool:
+        return any(fnmatch.fnmatch(name, pattern) for pattern in self.patterns)
+
+    def scan(self) -> list[tuple[Path, ScoreResult]]:
+        """Prüft alle passenden Dateien des Verzeichnisses und bewertet neue Inhalte."""
+        with os.scandir(self.dir_path) as entries:
+            names = [entry.name for entry in entries if entry.is_file() and self._matches(entry.name)]
+        return self.check(sorted(names))
+
+    def check(self, names: Iterable[str]) -> list[tuple[Path, ScoreResult]]:
+        """Bewertet neue Inhalte der angegebenen Dateien (Namen relativ zum Verzeichnis)."""
+        results: list[tuple[Path, ScoreResult]] = []
+        for name in names:
+            if self._matches(name):
+                results.extend(self._check_file(self.dir_path / name))
+        return results
+
+    def _check_file(self, path: Path) -> list[tuple[Path, ScoreResult]]:
+        try:
+            stat = path.stat()
+        except OSError:
+            self._forget(path)
+            return []
+
+        inode, size, mtime_ns, offset = self._state.get(path, (stat.st_ino, -1, -1, 0))
+        if (size, mtime_ns) == (stat.st_size, stat.st_mtime_ns) and inode == stat.st_ino:
+            return []
+
+        if path.suffix != ".jsonl":
+            return self._check_json(path, stat)
+
+        if inode != stat.st_ino or stat.st_size < offset:
+            logger.info(f"Datei ersetzt oder gekürzt, lese von vorn: {path}")
+            offset = 0
+        results = []
+        try:
+            with open(path, 'rb') as f:
+                f.seek(offset)
+                data = f.read(stat.st_size - offset)
+        except OSError as e:
+            # Zwischen stat und open gelöscht, rotiert oder nicht lesbar
+            logger.warning(f"Datei nicht lesbar, übersprungen: {path}: {e}")
+            self._forget(path)
+            return []
+        complete = data[:data.rfind(b"\n") + 1]
+        for line in complete.splitlines():
+            if not line.strip():
+                continue
+            try:
+                results.append((path, self.scorer.score_log(self.scorer._parse_json(line))))
+            except (json.JSONDecodeError, UnicodeDecodeError, ValueError) as e:
+                logger.error(f"Fehler in {path}: {e}")
+        self._state[path] = (stat.st_ino, stat.st_size, stat.st_mtime_ns, offset + len(complete))
+        return results
+
+    def _check_json(self, path: Path, stat: os.stat_result) -> list[tuple[Path, ScoreResult]]:
+        if stat.st_size == 0:
+            # Gerade angelegt, Inhalt folgt
+            return []
+        retry_at = self._pending.get(path)
+        if retry_at is not None and time.monotonic() < retry_at:
+            # Wird noch geschrieben: nicht bei jedem Schreibzugriff neu parsen
+            return []
+
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+        except OSError as e:
+            logger.warning(f"Datei nicht lesbar, übersprungen: {path}: {e}")
+            self._forget(path)
+            return []
+
+        try:
+            result = self.scorer._score_file_data(path, data)
+        except (json.JSONDecodeError, UnicodeDecodeError, ValueError) as e:
+            if retry_at is None:
+                # Evtl. noch nicht fertig geschrieben: nach der Ruhezeit erneut
+                logger.debug(f"Unvollständig, später erneut: {path}: {e}")
+                self._pending[path] = time.monotonic() + self.settle
+                return []
+            logger.error(f"Fehler bei {path}: {e}")
+            result = None
+        # Erst bei der nächsten Änderung wieder lesen
+        self._pending.pop(path, None)
+        self._state[path] = (stat.st_ino, stat.st_size, stat.st_mtime_ns, 0)
+        return [(path, result)] if result is not None else []
+
+    def _forget(self, path: Path) -> None:
+        self._state.pop(path, None)
+        self._pending.pop(path, None)
+
+    def wait(self, timeout: float | None = None) -> list[tuple[Path, ScoreResult]]:
+        """Wartet bis zu ``timeout`` Sekunden auf Änderungen und bewertet die neuen Inhalte."""
+        timeout = self.poll_interval if timeout is None else timeout
+        if self._inotify is None:
+            time.sleep(timeout)
+            return self.scan()
+        if self._pending:
+            # Zurückgestellte Dateien auch ohne weiteres Ereignis erneut prüfen
+            timeout = min(timeout, max(0.0, min(self._pending.values()) - time.monotonic()))
+        names = self._inotify.read(timeout)
+        if names is None:
+            logger.warning("inotify-Queue übergelaufen, prüfe alle Dateien")
+            return self.scan()
+        return self.check(sorted(names | {path.name for path in self._pending}))
+
+    def run(
+        self,
+        on_result: Callable[[Path, ScoreResult], None],
+        stop: threading.Event | None = None,
+        initial_scan: bool = False
+    ) -> None:
+        """
+        Läuft bis ``stop`` gesetzt wird und übergibt jedes Ergebnis sofort an ``on_result``.
+
+        Args:
+            on_result: Callback (datei, ergebnis) pro neuem Ergebnis
+            stop: Event zum Beenden (Standard: läuft bis KeyboardInterrupt)
+            initial_scan: Bereits vorhandene Dateien beim Start bewerten
+                (Standard: nur später geschriebene Inhalte)
+        """
+        stop = stop or threading.Event()
+        logger.info(f"Überwache {self.dir_path} ({'inotify' if self.uses_inotify else 'Polling'})")
+        if initial_scan:
+            pending = self.scan()
+        else:
+            self._skip_existing()
+            pending = []
+        while True:
+            for path, result in pending:
+                on_result(path, result)
+            if stop.is_set():
+                return
+            pending = self.wait()
+
+    def _skip_existing(self) -> None:
+        with os.scandir(self.dir_path) as entries:
+            for entry in entries:
+                if entry.is_file() and self._matches(entry.name):
+                    stat = entry.stat()
+                    self._state[Path(entry.path)] = (stat.st_ino, stat.st_size, stat.st_mtime_ns, stat.st_size)
+
+    def close(self) -> None:
+        """Gibt den inotify-Deskriptor frei."""
+        if self._inotify is not None:
+            self._inotify.close()
+            self._inotify = None
+
+
+class ReportWriter(ABC):
+    """
+    Basisklasse für streamende Report-Writer.
+
+    Ergebnisse werden einzeln mit ``write`` direkt in die Datei geschrieben,
+    der Speicherbedarf ist unabhängig von der Anzahl der Ergebnisse.
+    Verwendung als Context-Manager oder über ``open``/``write``/``close``.
+    """
+
+    FORMAT = ""
+    _newline: str | None = None
+
+    def __init__(self, output_path: str | Path):
+        self.output_path = output_path
+        self.count = 0
+        self._file: Any = None
+
+    def open(self) -> "ReportWriter":
+        """Öffnet die Ausgabedatei und schreibt den Kopf."""
+        self._file = open(self.output_path, 'w', encoding='utf-8', newline=self._newline)
+        self._write_header()
+        return self
+
+    def write(self, result: ScoreResult) -> None:
+        """Schreibt ein einzelnes Ergebnis."""
+        self._write_result(result)
+        self.count += 1
+
+    def flush(self) -> None:
+        """Schreibt gepufferte Daten in die Datei (z.B. im Watch-Modus)."""
+        if self._file is not None:
+            self._file.flush()
+
+    def write_all(self, results: Iterable[ScoreResult]) -> None:
+        """Schreibt alle Ergebnisse eines Iterables."""
+        for result in results:
+            self.write(result)
+
+    def close(self) -> None:
+        """Schreibt den Abschluss und schließt die Datei."""
+        if self._file is None:
+            return
+        try:
+            self._write_footer()
+        finally:
+            self._file.close()
+            self._file = None
+        logger.info(f"{self.FORMAT}-Report gespeichert: {self.output_path}")
+
+    def __enter__(self) -> "ReportWriter":
+        return self.open()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def _write_header(self) -> None:
+        pass
+
+    @abstractmethod
+    def _write_result(self, result: ScoreResult) -> None:
+        """Schreibt die Zeile bzw. den Eintrag eines Ergebnisses."""
+
+    def _write_footer(self) -> None:
+        pass
+
+
+class JsonReportWriter(ReportWriter):
+    """Schreibt Ergebnisse als JSON-Array (identisch zu ``json.dump(..., indent=2)``)."""
+
+    FORMAT = "JSON"
+
+    def _write_header(self) -> None:
+        self._file.write("[")
+
+    def _write_result(self, result: ScoreResult) -> None:
+        item = json.dumps(result.to_dict(), indent=2, ensure_ascii=False)
+        self._file.write(("\n  " if self.count == 0 else ",\n  ") + item.replace("\n", "\n  "))
+
+    def _write_footer(self) -> None:
+        self._file.write("]" if self.count == 0 else "\n]")
+
+
+class JsonlReportWriter(ReportWriter):
+    """Schreibt Ergebnisse als JSONL (ein Ergebnis pro Zeile)."""
+
+    FORMAT = "JSONL"
+
+    def _write_result(self, result: ScoreResult) -> None:
+        self._file.write(json.dumps(result.to_dict(), ensure_ascii=False) + "\n")
+
+
+class CsvReportWriter(ReportWriter):
+    """Schreibt Ergebnisse als CSV."""
+
+    FORMAT = "CSV"
+    FIELDNAMES = [
+        'agent_id', 'contact', 'timestamp', 'price_claim', 'legal_claim',
+        'stop_triggered', 'placeholder_used', 'risk', 'risk_level', 'violations'
+    ]
+    _newline = ''
+
+    def _write_header(self) -> None:
+        import csv
+
+        self._writer = csv.DictWriter(self._file, fieldnames=self.FIELDNAMES)
+        self._writer.writeheader()
+
+    def _write_result(self, result: ScoreResult) -> None:
+        row = result.to_dict()
+        row['violations'] = "; ".join(row['violations'])
+        # Nur relevante Felder
+        self._writer.writerow({k: row.get(k, '') for k in self.FIELDNAMES})
+
+
+class HtmlReportWriter(ReportWriter):
+    """
+    Schreibt einen HTML-Report Zeile für Zeile.
+
+    Ist die Zusammenfassung beim Öffnen noch nicht bekannt, wird sie beim
+    Schließen aus den geschriebenen Ergebnissen erstellt und nach der
+    Tabelle ausgegeben (per CSS trotzdem oben angezeigt).
+    """
+
+    FORMAT = "HTML"
+    RISK_COLORS = {
+        "LOW": "#28a745",
+        "MEDIUM": "#ffc107",
+        "HIGH": "#fd7e14",
+        "CRITICAL": "#dc3545"
+    }
+
+    HEAD = """<!DOCTYPE html>
 <html lang="de">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Agent Log Scorer Report</title>
+    <title>$title</title>
     <style>
-        body {{ font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; margin: 20px; background: #f5f5f5; }}
-        .container {{ max-width: 1400px; margin: 0 auto; }}
-        h1 {{ color: #333; border-bottom: 2px solid #007bff; padding-bottom: 10px; }}
-        .summary {{ background: white; padding: 20px; border-radius: 8px; margin-bottom: 20px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }}
-        .summary-grid {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(150px, 1fr)); gap: 15px; }}
-        .stat-box {{ text-align: center; padding: 15px; background: #f8f9fa; border-radius: 8px; }}
-        .stat-value {{ font-size: 2em; font-weight: bold; color: #007bff; }}
-        .stat-label {{ color: #666; font-size: 0.9em; }}
-        table {{ width: 100%; border-collapse: collapse; background: white; border-radius: 8px; overflow: hidden; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }}
-        th {{ background: #007bff; color: white; padding: 12px; text-align: left; }}
-        td {{ padding: 10px; border-bottom: 1px solid #eee; }}
-        tr:hover {{ background: #f8f9fa; }}
-        .critical-section {{ background: #fff5f5; border: 1px solid #dc3545; border-radius: 8px; padding: 15px; margin-top: 20px; }}
-        .timestamp {{ color: #666; font-size: 0.8em; margin-top: 20px; }}
+        body { font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; margin: 20px; background: #f5f5f5; }
+        .container { max-width: 1400px; margin: 0 auto; display: flex; flex-direction: column; }
+        h1 { color: #333; border-bottom: 2px solid #007bff; padding-bottom: 10px; order: -2; }
+        .summary { background: white; padding: 20px; border-radius: 8px; margin-bottom: 20px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }
+        .summary.deferred { order: -1; }
+        .summary-grid { display: grid; grid-template-columns: repeat(auto-fit, minmax(150px, 1fr)); gap: 15px; }
+        .stat-box { text-align: center; padding: 15px; background: #f8f9fa; border-radius: 8px; }
+        .stat-value { font-size: 2em; font-weight: bold; color: #007bff; }
+        .stat-label { color: #666; font-size: 0.9em; }
+        table { width: 100%; border-collapse: collapse; background: white; border-radius: 8px; overflow: hidden; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }
+        th { background: #007bff; color: white; padding: 12px; text-align: left; }
+        td { padding: 10px; border-bottom: 1px solid #eee; }
+        tr:hover { background: #f8f9fa; }
+        .critical-section { background: #fff5f5; border: 1px solid #dc3545; border-radius: 8px; padding: 15px; margin-top: 20px; }
+        .timestamp { color: #666; font-size: 0.8em; margin-top: 20px; }
+        .pagination { display: flex; gap: 15px; margin: 15px 0; }
+        .page-list { background: white; padding: 20px; border-radius: 8px; margin-bottom: 20px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }
     </style>
 </head>
 <body>
     <div class="container">
-        <h1>Agent Log Scorer Report</h1>
-
-        <div class="summary">
-            <h2>Zusammenfassung</h2>
-            <div class="summary-grid">
-                <div class="stat-box">
-                    <div class="stat-value">{summary.get('total', 0)}</div>
-                    <div class="stat-label">Logs analysiert</div>
-                </div>
-                <div class="stat-box">
-                    <div class="stat-value">{summary.get('average_risk', 0)}</div>
-                    <div class="stat-label">Durchschn. Risiko</div>
-                </div>
-                <div class="stat-box">
-                    <div class="stat-value">{summary.get('agents_analyzed', 0)}</div>
-                    <div class="stat-label">Agenten</div>
-                </div>
-                <div class="stat-box">
-                    <div class="stat-value" style="color: #dc3545;">{summary.get('critical_count', 0)}</div>
-                    <div class="stat-label">Kritische Vorfälle</div>
-                </div>
-            </div>
-        </div>
+        <h1>$title</h1>
+"""
 
+    TABLE_START = """
         <h2>Detaillierte Ergebnisse</h2>
         <table>
             <thead>
@@ -604,53 +3849,471 @@ class ReportGenerator:
                 </tr>
             </thead>
             <tbody>
-                {rows_html}
-            </tbody>
+"""
+
+    TABLE_END = """            </tbody>
         </table>
+"""
 
+    def __init__(self, output_path: str | Path, summary: dict | None = None):
+        super().__init__(output_path)
+        self.summary = summary
+        self._accumulator = SummaryAccumulator(collect_incidents=False) if summary is None else None
+
+    @classmethod
+    def render_head(cls, title: str = "Agent Log Scorer Report") -> str:
+        """Rendert Dokumentkopf inklusive Styles und Überschrift."""
+        return cls.HEAD.replace("$title", html.escape(title))
+
+    @staticmethod
+    def render_footer() -> str:
+        """Rendert Zeitstempel und Dokumentende."""
+        return f"""
         <p class="timestamp">Report erstellt: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
     </div>
 </body>
 </html>"""
 
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(html)
-        logger.info(f"HTML-Report gespeichert: {output_path}")
+    @classmethod
+    def render_summary(cls, summary: dict, deferred: bool = False) -> str:
+        """Rendert den Zusammenfassungs-Block."""
+        css_class = "summary deferred" if deferred else "summary"
+        return f"""
+        <div class="{css_class}">
+            <h2>Zusammenfassung</h2>
+            <div class="summary-grid">
+                <div class="stat-box">
+                    <div class="stat-value">{summary.get('total', 0)}</div>
+                    <div class="stat-label">Logs analysiert</div>
+                </div>
+                <div class="stat-box">
+                    <div class="stat-value">{summary.get('average_risk', 0)}</div>
+                    <div class="stat-label">Durchschn. Risiko</div>
+                </div>
+                <div class="stat-box">
+                    <div class="stat-value">{summary.get('agents_analyzed', 0)}</div>
+                    <div class="stat-label">Agenten</div>
+                </div>
+                <div class="stat-box">
+                    <div class="stat-value" style="color: #dc3545;">{summary.get('critical_count', 0)}</div>
+                    <div class="stat-label">Kritische Vorfälle</div>
+                </div>
+            </div>
+        </div>
+"""
+
+    @classmethod
+    def render_row(cls, r: ScoreResult) -> str:
+        """Rendert eine Tabellenzeile."""
+        color = cls.RISK_COLORS.get(r.risk_level.value, "#6c757d")
+        violations_html = "<br>".join(html.escape(v) for v in r.violations) if r.violations else "-"
+        return f"""            <tr>
+                <td>{html.escape(str(r.agent_id))}</td>
+                <td>{html.escape(str(r.contact or '-'))}</td>
+                <td>{html.escape(str(r.timestamp or '-'))}</td>
+                <td>{'Ja' if r.price_claim else 'Nein'}</td>
+                <td>{'Ja' if r.legal_claim else 'Nein'}</td>
+                <td>{'Ja' if r.stop_triggered else 'Nein'}</td>
+                <td>{r.risk}</td>
+                <td style="background-color: {color}; color: white; font-weight: bold;">{r.risk_level.value}</td>
+                <td>{violations_html}</td>
+            </tr>
+"""
+
+    def _write_header(self) -> None:
+        self._file.write(self.render_head())
+        if self.summary is not None:
+            self._file.write(self.render_summary(self.summary))
+        self._file.write(self.TABLE_START)
+
+    def _write_result(self, result: ScoreResult) -> None:
+        if self._accumulator is not None:
+            self._accumulator.add(result)
+        self._file.write(self.render_row(result))
+
+    def _write_footer(self) -> None:
+        self._file.write(self.TABLE_END)
+        if self._accumulator is not None:
+            self._file.write(self.render_summary(self._accumulator.to_dict(), deferred=True))
+        self._file.write(self.render_footer())
+
+
+class _HtmlPageSeries:
+    """Folge verlinkter HTML-Seiten mit je ``page_size`` Tabellenzeilen."""
+
+    def __init__(self, index_path: Path, kind: str, title: str, page_size: int):
+        self.index_path = index_path
+        self.kind = kind
+        self.title = title
+        self.page_size = page_size
+        self.rows = 0
+        # (Dateiname, erste Zeile, letzte Zeile) pro Seite
+        self.pages: list[list] = []
+        self._file: TextIO | None = None
+        self._rows_in_page = 0
+
+    def page_name(self, number: int) -> str:
+        return f"{self.index_path.stem}_{self.kind}_{number:04d}{self.index_path.suffix}"
+
+    def write(self, result: ScoreResult) -> None:
+        if self._file is not None and self._rows_in_page >= self.page_size:
+            # Erst jetzt ist klar, dass es eine nächste Seite gibt
+            self._finish_page(has_next=True)
+        file = self._file if self._file is not None else self._start_page()
+        file.write(HtmlReportWriter.render_row(result))
+        self._rows_in_page += 1
+        self.rows += 1
+        self.pages[-1][2] = self.rows
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._finish_page(has_next=False)
+
+    def _navigation(self, number: int, has_next: bool) -> str:
+        links = []
+        if number > 1:
+            links.append(f'<a href="{html.escape(self.page_name(number - 1))}">&laquo; Zurück</a>')
+        links.append(f'<a href="{html.escape(self.index_path.name)}">Übersicht</a>')
+        if has_next:
+            links.append(f'<a href="{html.escape(self.page_name(number + 1))}">Weiter &raquo;</a>')
+        return '\n        <div class="pagination">' + " ".join(links) + "</div>\n"
+
+    def _start_page(self) -> TextIO:
+        number = len(self.pages) + 1
+        name = self.page_name(number)
+        file = self._file = open(self.index_path.with_name(name), 'w', encoding='utf-8')
+        file.write(HtmlReportWriter.render_head(f"{self.title} – Seite {number}"))
+        file.write(HtmlReportWriter.TABLE_START)
+        self._rows_in_page = 0
+        self.pages.append([name, self.rows + 1, self.rows])
+        return file
+
+    def _finish_page(self, has_next: bool) -> None:
+        file = self._file
+        if file is None:
+            return
+        file.write(HtmlReportWriter.TABLE_END)
+        file.write(self._navigation(len(self.pages), has_next))
+        file.write(HtmlReportWriter.render_footer())
+        file.close()
+        self._file = None
+
+    def render_links(self) -> str:
+        """Rendert die Linkliste aller Seiten für die Übersichtsseite."""
+        if not self.pages:
+            return "<p>Keine Einträge</p>"
+        items = "".join(
+            f'\n                <li><a href="{html.escape(name)}">Seite {number}</a> (Zeilen {first}–{last})</li>'
+            for number, (name, first, last) in enumerate(self.pages, start=1)
+        )
+        return f"<ul>{items}\n            </ul>"
+
+
+class PaginatedHtmlReportWriter(ReportWriter):
+    """
+    Schreibt den HTML-Report auf mehrere verlinkte Seiten.
+
+    ``output_path`` wird zur Übersichtsseite mit Zusammenfassung und Links;
+    daneben entstehen ``<name>_page_NNNN.html`` mit je ``page_size`` Zeilen
+    und ``<name>_critical_NNNN.html`` nur mit HIGH/CRITICAL-Ergebnissen.
+    Jede Zeile wird genau einmal geschrieben (lineare Laufzeit), im
+    Speicher liegen nur Seitenzähler.
+    """
+
+    FORMAT = "HTML"
+
+    def __init__(self, output_path: str | Path, page_size: int = 5000, summary: dict | None = None):
+        if page_size < 1:
+            raise ValueError("page_size muss mindestens 1 sein")
+        super().__init__(output_path)
+        self.page_size = page_size
+        self.summary = summary
+        self._accumulator = SummaryAccumulator(collect_incidents=False) if summary is None else None
+        index_path = Path(output_path)
+        self._all_pages = _HtmlPageSeries(index_path, "page", "Alle Ergebnisse", page_size)
+        self._critical_pages = _HtmlPageSeries(index_path, "critical", "Kritische Vorfälle", page_size)
+
+    def open(self) -> "PaginatedHtmlReportWriter":
+        """Seiten werden bei Bedarf geöffnet, die Übersicht beim Schließen geschrieben."""
+        return self
+
+    def _write_result(self, result: ScoreResult) -> None:
+        if self._accumulator is not None:
+            self._accumulator.add(result)
+        self._all_pages.write(result)
+        if result.is_critical():
+            self._critical_pages.write(result)
+
+    @property
+    def page_files(self) -> list[str]:
+        """Dateinamen aller geschriebenen Ergebnisseiten."""
+        return [page[0] for page in self._all_pages.pages]
+
+    def close(self) -> None:
+        """Schließt die letzten Seiten und schreibt die Übersichtsseite."""
+        self._all_pages.close()
+        self._critical_pages.close()
+
+        # Ohne vorgegebene Zusammenfassung wurde sie beim Schreiben gesammelt
+        summary = self.summary
+        if summary is None:
+            assert self._accumulator is not None
+            summary = self._accumulator.to_dict()
+        with open(self.output_path, 'w', encoding='utf-8') as f:
+            f.write(HtmlReportWriter.render_head())
+            f.write(HtmlReportWriter.render_summary(summary))
+            f.write(f"""
+        <div class="page-list critical-section">
+            <h2>Kritische Vorfälle ({self._critical_pages.rows})</h2>
+            {self._critical_pages.render_links()}
+        </div>
+
+        <div class="page-list">
+            <h2>Alle Ergebnisse ({self._all_pages.rows})</h2>
+            {self._all_pages.render_links()}
+        </div>
+""")
+            f.write(HtmlReportWriter.render_footer())
+        logger.info(
+            f"HTML-Report gespeichert: {self.output_path} "
+            f"({len(self._all_pages.pages)} Seiten, {len(self._critical_pages.pages)} kritische Seiten)"
+        )
+
+
+class ReportGenerator:
+    """Generiert Reports in verschiedenen Formaten."""
+
+    @staticmethod
+    def to_json(results: Iterable[ScoreResult], output_path: str | Path) -> None:
+        """Exportiert Ergebnisse als JSON."""
+        with JsonReportWriter(output_path) as writer:
+            writer.write_all(results)
+
+    @staticmethod
+    def to_csv(results: Iterable[ScoreResult], output_path: str | Path) -> None:
+        """Exportiert Ergebnisse als CSV."""
+        results = iter(results)
+        first = next(results, None)
+        if first is None:
+            return
+
+        with CsvReportWriter(output_path) as writer:
+            writer.write(first)
+            writer.write_all(results)
+
+    @staticmethod
+    def to_html(
+        results: Iterable[ScoreResult],
+        summary: dict,
+        output_path: str | Path,
+        page_size: int | None = None
+    ) -> None:
+        """
+        Generiert einen HTML-Report.
+
+        Mit ``page_size`` wird der Report auf verlinkte Seiten aufgeteilt
+        (siehe PaginatedHtmlReportWriter), sonst als einzelne Seite erstellt.
+        """
+        writer: ReportWriter
+        if page_size:
+            writer = PaginatedHtmlReportWriter(output_path, page_size=page_size, summary=summary)
+        else:
+            writer = HtmlReportWriter(output_path, summary=summary)
+        with writer:
+            writer.write_all(results)
+
+
+class TopIssueIndex:
+    """
+    Begrenzter Top-K-Index der potenziellen Issues für das Dashboard.
+
+    Hält per Min-Heap nur die ``k`` schwersten Issues: geordnet nach
+    Risikostufe, Anzahl der Verstöße und Aktualität (neuester Zeitstempel
+    zuerst), bei Gleichstand deterministisch nach Agent und Issue. Zusätzlich
+    werden die Gesamtzahl der Issues und die Agenten mit kritischen Issues
+    gezählt. Speicherbedarf O(k) (plus betroffene Agenten); ``merge`` ist
+    reihenfolgeunabhängig.
+    """
+
+    _RISK_RANK = {level.value: rank for rank, level in enumerate(RiskLevel)}
+
+    def __init__(self, k: int = 10):
+        if k < 0:
+            raise ValueError(f"k muss >= 0 sein: {k}")
+        self.k = k
+        self.count = 0
+        self.critical_agents: set = set()
+        self._heap: list[tuple[tuple, int, int, dict]] = []
+        self._seq = 0
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def push(self, issue: dict, violations: int) -> None:
+        """Nimmt ein Issue (Format von ``DashboardGenerator.issues_for``) auf."""
+        self.count += 1
+        if issue["risk"] == RiskLevel.CRITICAL.value:
+            self.critical_agents.add(issue["agent_id"])
+        if not self.k:
+            return
+        rank = (
+            self._RISK_RANK[issue["risk"]], violations, issue["timestamp"] or "", str(issue["agent_id"]), issue["issue"]
+        )
+        if len(self._heap) >= self.k and rank <= self._heap[0][0]:
+            return
+        # seq verhindert den Vergleich der Dictionaries bei gleichem Rang
+        entry = (rank, self._seq, violations, issue)
+        self._seq += 1
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, entry)
+        else:
+            heapq.heapreplace(self._heap, entry)
+
+    def add(self, result: ScoreResult) -> None:
+        """Nimmt die Issues eines Ergebnisses auf."""
+        issues = DashboardGenerator.issues_for(result)
+        if issues:
+            violations = len(result.violations)
+            for issue in issues:
+                self.push(issue, violations)
+
+    def merge(self, other: "TopIssueIndex") -> "TopIssueIndex":
+        """Führt einen anderen Index in diesen zusammen (``k`` bleibt erhalten)."""
+        count = self.count + other.count
+        for _, _, violations, issue in other._heap:
+            self.push(issue, violations)
+        self.count = count
+        self.critical_agents |= other.critical_agents
+        return self
+
+    def top(self) -> list[dict]:
+        """Die bis zu ``k`` schwersten Issues, schwerstes zuerst."""
+        return [entry[3] for entry in sorted(self._heap, key=lambda entry: entry[0], reverse=True)]
+
+    def to_state(self) -> dict:
+        """Serialisierbarer Zustand (kanonisch sortiert)."""
+        return {
+            "k": self.k,
+            "count": self.count,
+            "critical_agents": sorted(self.critical_agents, key=str),
+            "top": [
+                {**entry[3], "violations": entry[2]}
+                for entry in sorted(self._heap, key=lambda entry: entry[0], reverse=True)
+            ],
+        }
+
+    @classmethod
+    def from_state(cls, data: dict) -> "TopIssueIndex":
+        """Erstellt den Index aus ``to_state``."""
+        index = cls(data["k"])
+        for item in data["top"]:
+            issue = dict(item)
+            index.push(issue, issue.pop("violations"))
+        index.count = data["count"]
+        index.critical_agents = set(data["critical_agents"])
+        return index
+
+
+class DashboardAccumulator:
+    """
+    Sammelt die ergebnisabhängigen Dashboard-Felder in einem Durchlauf.
+
+    Verstöße werden gezählt, Issues landen im ``TopIssueIndex``; die
+    Ergebnisse selbst werden nicht gehalten, sodass auch Streams beliebiger
+    Länge mit O(k) Speicher zum Dashboard führen.
+    """
+
+    def __init__(self, top_k: int = 10):
+        self.total_violations = 0
+        self.issues = TopIssueIndex(top_k)
+
+    def add(self, result: ScoreResult) -> None:
+        """Nimmt ein Ergebnis auf."""
+        self.total_violations += len(result.violations)
+        self.issues.add(result)
+
+    def merge(self, other: "DashboardAccumulator") -> "DashboardAccumulator":
+        """Führt einen anderen Akkumulator in diesen zusammen."""
+        self.total_violations += other.total_violations
+        self.issues.merge(other.issues)
+        return self
+
+    def to_dashboard(self, agent_stats: dict[str, AgentStatistics]) -> dict:
+        """Baut das Dashboard mit den Agent-Statistiken."""
+        return DashboardGenerator.build(self, agent_stats)
+
+    def to_state(self) -> dict:
+        """Serialisierbarer Zustand."""
+        return {"total_violations": self.total_violations, "issues": self.issues.to_state()}
+
+    @classmethod
+    def from_state(cls, data: dict) -> "DashboardAccumulator":
+        """Erstellt den Akkumulator aus ``to_state``."""
+        accumulator = cls()
+        accumulator.total_violations = data["total_violations"]
+        accumulator.issues = TopIssueIndex.from_state(data["issues"])
+        return accumulator
 
 
 class DashboardGenerator:
     """Generiert Supervisor-Dashboard-Daten."""
 
     @staticmethod
-    def generate(results: list[ScoreResult], agent_stats: dict[str, AgentStatistics]) -> dict:
+    def generate(
+        results: Iterable[ScoreResult],
+        agent_stats: dict[str, AgentStatistics],
+        top_k: int = 10
+    ) -> dict:
         """
         Generiert Dashboard-Daten im Format des supervisor_dashboard_mock.
 
+        Die Ergebnisse werden in einem Durchlauf verarbeitet und nicht
+        gehalten; ``results`` darf ein beliebig langer Generator sein.
+
         Args:
-            results: Liste der Scoring-Ergebnisse
+            results: Scoring-Ergebnisse (Liste, ScoreResultBatch oder Generator)
             agent_stats: Agent-Statistiken
+            top_k: Anzahl der schwersten Issues im Dashboard
 
         Returns:
             Dashboard-Dictionary
         """
-        # Kritische Issues sammeln
-        potential_issues = []
+        accumulator = DashboardAccumulator(top_k)
         for r in results:
-            if r.is_critical():
-                issue_type = []
-                if r.price_claim and not r.stop_triggered:
-                    issue_type.append("Price mentioned without fact")
-                if r.legal_claim and not r.stop_triggered:
-                    issue_type.append("No STOP on legal question")
-
-                for issue in issue_type:
-                    potential_issues.append({
-                        "agent_id": r.agent_id,
-                        "issue": issue,
-                        "risk": r.risk_level.value,
-                        "timestamp": r.timestamp
-                    })
+            accumulator.add(r)
+        return DashboardGenerator.build(accumulator, agent_stats)
 
+    @staticmethod
+    def issues_for(r: ScoreResult) -> list[dict]:
+        """Potenzielle Issues eines Ergebnisses (nur bei kritischen Ergebnissen)."""
+        if not r.is_critical():
+            return []
+        issue_type = []
+        if r.price_claim and not r.stop_triggered:
+            issue_type.append("Price mentioned without fact")
+        if r.legal_claim and not r.stop_triggered:
+            issue_type.append("No STOP on legal question")
+
+        return [
+            {
+                "agent_id": r.agent_id,
+                "issue": issue,
+                "risk": r.risk_level.value,
+                "timestamp": r.timestamp
+            }
+            for issue in issue_type
+        ]
+
+    @staticmethod
+    def build(accumulator: DashboardAccumulator, agent_stats: dict[str, AgentStatistics]) -> dict:
+        """
+        Baut das Dashboard aus gesammelten Issues und Statistiken.
+
+        Args:
+            accumulator: Verstöße und Top-K-Issues aller Ergebnisse
+            agent_stats: Agent-Statistiken
+        """
+        issues = accumulator.issues
         # Agenten mit schlechter Performance identifizieren
         agents_to_review = []
         for agent_id, stats in agent_stats.items():
@@ -669,27 +4332,24 @@ class DashboardGenerator:
                 "agents_active": len(agent_stats),
                 "total_interactions": sum(s.total_interactions for s in agent_stats.values()),
                 "stopped_calls_today": sum(s.stops_triggered for s in agent_stats.values()),
-                "potential_issues": potential_issues[:10],  # Top 10
+                "potential_issues": issues.top(),
                 "agents_requiring_review": agents_to_review,
-                "action_required": len(potential_issues) > 0,
+                "action_required": issues.count > 0,
                 "summary": {
                     "average_risk": round(
                         sum(s.average_risk for s in agent_stats.values()) / max(len(agent_stats), 1), 2
                     ),
-                    "total_violations": sum(
-                        len(r.violations) for r in results
-                    ),
+                    "total_violations": accumulator.total_violations,
                     "stop_compliance_rate": f"{sum(s.stop_rate for s in agent_stats.values()) / max(len(agent_stats), 1):.1%}"
                 }
             }
         }
 
         # Empfehlungen generieren
-        if potential_issues:
-            critical_agents = [i["agent_id"] for i in potential_issues if i["risk"] == "CRITICAL"]
-            if critical_agents:
+        if issues.count:
+            if issues.critical_agents:
                 dashboard["supervisor_dashboard"]["supervisor_recommendation"] = (
-                    f"Pause {', '.join(set(critical_agents))} and rebrief immediately"
+                    f"Pause {', '.join(map(str, sorted(issues.critical_agents, key=str)))} and rebrief immediately"
                 )
             else:
                 dashboard["supervisor_dashboard"]["supervisor_recommendation"] = (
@@ -710,36 +4370,469 @@ class DashboardGenerator:
         logger.info(f"Dashboard gespeichert: {output_path}")
 
 
-class AlertSystem:
-    """Einfaches Alert-System für kritische Vorfälle."""
+class AlertSink(ABC):
+    """
+    Ziel für Alerts (Basisklasse).
+
+    ``write_batch`` wird vom Hintergrund-Thread des ``AlertSystem`` mit
+    gesammelten Alerts aufgerufen, nie aus der Scoring-Schleife.
+    """
+
+    @abstractmethod
+    def write_batch(self, alerts: list[dict]) -> None:
+        """Gibt einen Batch von Alerts aus."""
+
+    def close(self) -> None:
+        pass
+
+
+class StreamAlertSink(AlertSink):
+    """Schreibt Alerts als JSON-Zeilen in einen Stream (Standard: stdout)."""
+
+    def __init__(self, stream: Any = None):
+        self.stream = stream
+
+    def write_batch(self, alerts: list[dict]) -> None:
+        stream = self.stream or sys.stdout
+        stream.write("".join(json.dumps(alert, ensure_ascii=False) + "\n" for alert in alerts))
+        stream.flush()
+
+
+class FileAlertSink(AlertSink):
+    """Hängt Alerts als JSONL an eine Datei an."""
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self._file: TextIO | None = None
+
+    def write_batch(self, alerts: list[dict]) -> None:
+        file = self._file
+        if file is None:
+            file = self._file = open(self.path, 'a', encoding='utf-8')
+        file.write("".join(json.dumps(alert, ensure_ascii=False) + "\n" for alert in alerts))
+        file.flush()
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
 
-    def __init__(self, threshold: RiskLevel = RiskLevel.HIGH):
+
+class WebhookAlertSink(AlertSink):
+    """Sendet Alerts gebündelt per HTTP-POST (``{"alerts": [...]}``) an einen Webhook."""
+
+    def __init__(self, url: str, timeout: float = 5.0):
+        if not url.startswith(("http://", "https://")):
+            raise ValueError(f"Webhook-URL muss mit http:// oder https:// beginnen: {url}")
+        self.url = url
+        self.timeout = timeout
+
+    def write_batch(self, alerts: list[dict]) -> None:
+        import urllib.request
+
+        request = urllib.request.Request(
+            self.url,
+            data=json.dumps({"alerts": alerts}, ensure_ascii=False).encode("utf-8"),
+            headers={"Content-Type": "application/json"},
+            method="POST"
+        )
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            response.read()
+
+
+class AlertSystem:
+    """
+    Alert-System für kritische Vorfälle.
+
+    Gleiche Alerts (Agent, Risk-Level, Verstöße) werden innerhalb von
+    ``window`` Sekunden zusammengefasst: gemeldet wird der erste, nach Ende
+    des Fensters (beim nächsten Alert oder bei ``flush``) folgt eine
+    Zusammenfassung mit der Anzahl der Wiederholungen. Gemeldete Alerts sind durch ``rate_limit`` (pro Sekunde)
+    begrenzt und landen in einem Ringpuffer der letzten ``max_recent``
+    Alerts. Sinks werden von einem Hintergrund-Thread gebündelt beschrieben;
+    ``check`` blockiert nie (bei voller Queue wird verworfen und gezählt).
+
+    ``check`` ist threadsicher (Fenster, Token-Bucket und Queue stehen
+    unter einem eigenen Lock; der Scoring-Service ruft es aus mehreren
+    Request-Threads auf); nach Gebrauch ``close`` aufrufen, um die Sinks zu leeren.
+    """
+
+    def __init__(
+        self,
+        threshold: RiskLevel = RiskLevel.HIGH,
+        metrics: ScorerMetrics | None = None,
+        window: float = 60.0,
+        max_recent: int = 1000,
+        rate_limit: float | None = None,
+        sinks: list[AlertSink] | None = None,
+        batch_size: int = 100,
+        flush_interval: float = 1.0,
+        queue_size: int = 10_000,
+        max_groups: int = 100_000,
+        clock: Callable[[], float] = time.monotonic
+    ):
         self.threshold = threshold
-        self.alerts: list[dict] = []
+        self.metrics = metrics
+        self.window = window
+        self.alerts: deque[dict] = deque(maxlen=max_recent)
+        self.rate_limit = rate_limit
+        self.max_groups = max_groups
+        self.sinks = list(sinks or [])
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._clock = clock
+        # Offene Fenster pro Alert-Schlüssel, nach Fensterbeginn geordnet
+        self._groups: dict[tuple, dict] = {}
+        self._burst = max(1.0, rate_limit) if rate_limit else 0.0
+        self._tokens = self._burst
+        self._refilled = clock()
+        self._rate_limited_notice = 0
+        self.stats = {
+            "triggered": 0, "emitted": 0, "aggregated": 0, "rate_limited": 0, "dropped": 0, "sink_errors": 0
+        }
+
+        self._lock = threading.Lock()
+        self._queue: queue.Queue[dict | None] | None = None
+        self._thread: threading.Thread | None = None
+        if self.sinks:
+            import queue
+            self._queue = queue.Queue(maxsize=queue_size)
+            self._queue_full = queue.Full
+            self._thread = threading.Thread(target=self._dispatch, name="alert-sinks", daemon=True)
+            self._thread.start()
 
     def check(self, result: ScoreResult) -> bool:
         """Prüft ob ein Alert ausgelöst werden soll."""
-        if result.risk_level >= self.threshold:
-            alert = {
-                "timestamp": datetime.now().isoformat(),
-                "agent_id": result.agent_id,
-                "risk_level": result.risk_level.value,
-                "risk_score": result.risk,
-                "violations": result.violations,
-                "message": f"ALERT: Agent {result.agent_id} hat Risk-Level {result.risk_level.value}"
-            }
-            self.alerts.append(alert)
-            logger.warning(alert["message"])
-            return True
-        return False
+        if result.risk_level < self.threshold:
+            return False
+        with self._lock:
+            self._check(result)
+        return True
+
+    def _check(self, result: ScoreResult) -> None:
+        self.stats["triggered"] += 1
+        if self.metrics is not None:
+            self.metrics.alerts.labels(result.risk_level.value).inc()
+
+        now = self._clock()
+        self._expire(now)
+        key = (result.agent_id, result.risk_level, tuple(result.violations))
+        group = self._groups.get(key)
+        if group is not None:
+            # Wiederholung im laufenden Fenster: nur zählen
+            group["repeats"] += 1
+            group["last_seen"] = datetime.now().isoformat()
+            self.stats["aggregated"] += 1
+            if self.metrics is not None:
+                self.metrics.alerts_suppressed.labels("aggregated").inc()
+            return
+
+        alert = {
+            "timestamp": datetime.now().isoformat(),
+            "agent_id": result.agent_id,
+            "risk_level": result.risk_level.value,
+            "risk_score": result.risk,
+            "violations": result.violations,
+            "message": f"ALERT: Agent {result.agent_id} hat Risk-Level {result.risk_level.value}"
+        }
+        self._groups[key] = {"alert": alert, "start": now, "repeats": 0, "last_seen": alert["timestamp"]}
+        if len(self._groups) > self.max_groups:
+            self._close_group(next(iter(self._groups)), now)
+        self._emit(alert, now)
+
+    def _expire(self, now: float) -> None:
+        """Schließt abgelaufene Fenster (die ältesten stehen vorne)."""
+        while self._groups:
+            key = next(iter(self._groups))
+            if now - self._groups[key]["start"] < self.window:
+                break
+            self._close_group(key, now)
+
+    def _close_group(self, key: tuple, now: float) -> None:
+        """Schließt ein Fenster und meldet ggf. die Zusammenfassung der Wiederholungen."""
+        group = self._groups.pop(key)
+        if group["repeats"]:
+            alert = group["alert"]
+            self._emit({
+                **alert,
+                "timestamp": group["last_seen"],
+                "first_seen": alert["timestamp"],
+                "repeats": group["repeats"],
+                "message": f"ALERT: Agent {alert['agent_id']} hat Risk-Level {alert['risk_level']} "
+                           f"({group['repeats']} weitere seit {alert['timestamp']})"
+            }, now)
+
+    def _emit(self, alert: dict, now: float) -> None:
+        """Meldet einen Alert (Log, Ringpuffer, Sinks), sofern das Rate-Limit es erlaubt."""
+        if self.rate_limit is not None:
+            self._tokens = min(self._burst, self._tokens + (now - self._refilled) * self.rate_limit)
+            self._refilled = now
+            if self._tokens < 1:
+                self.stats["rate_limited"] += 1
+                if self.metrics is not None:
+                    self.metrics.alerts_suppressed.labels("rate_limited").inc()
+                return
+            self._tokens -= 1
+            if self.stats["rate_limited"] > self._rate_limited_notice:
+                logger.warning(
+                    f"{self.stats['rate_limited'] - self._rate_limited_notice} Alerts durch Rate-Limit unterdrückt"
+                )
+                self._rate_limited_notice = self.stats["rate_limited"]
+
+        self.stats["emitted"] += 1
+        self.alerts.append(alert)
+        logger.warning(alert["message"])
+        if self._queue is not None:
+            try:
+                self._queue.put_nowait(alert)
+            except self._queue_full:
+                # Volle Queue: lieber verwerfen als das Scoring aufzuhalten
+                self.stats["dropped"] += 1
+                if self.metrics is not None:
+                    self.metrics.alerts_suppressed.labels("dropped").inc()
+
+    def _dispatch(self) -> None:
+        """Hintergrund-Thread: sammelt Alerts und schreibt sie gebündelt in die Sinks."""
+        import queue
+
+        alerts = self._queue
+        if alerts is None:
+            return
+        done = False
+        while not done:
+            batch: list[dict] = []
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                try:
+                    item = alerts.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+                if item is None:
+                    done = True
+                    break
+                batch.append(item)
+            if batch:
+                self._write_batch(batch)
+
+    def _write_batch(self, batch: list[dict]) -> None:
+        for sink in self.sinks:
+            try:
+                sink.write_batch(batch)
+            except Exception as e:
+                self.stats["sink_errors"] += 1
+                logger.error(f"Alert-Sink {type(sink).__name__} fehlgeschlagen: {e}")
+
+    def flush(self) -> None:
+        """Schließt alle offenen Fenster und meldet ihre Zusammenfassungen."""
+        with self._lock:
+            now = self._clock()
+            while self._groups:
+                self._close_group(next(iter(self._groups)), now)
+
+    def close(self) -> None:
+        """Meldet offene Zusammenfassungen, leert die Sinks und beendet den Hintergrund-Thread."""
+        self.flush()
+        if self._thread is not None and self._queue is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+            for sink in self.sinks:
+                sink.close()
+
+    def __enter__(self) -> "AlertSystem":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
 
     def get_alerts(self) -> list[dict]:
-        """Gibt alle Alerts zurück."""
-        return self.alerts
+        """Gibt die zuletzt gemeldeten Alerts zurück (höchstens ``max_recent``)."""
+        with self._lock:
+            return list(self.alerts)
+
+    def get_stats(self) -> dict:
+        """Zähler: ausgelöst, gemeldet, zusammengefasst, durch Rate-Limit bzw. volle Queue verworfen."""
+        with self._lock:
+            return {**self.stats, "open_windows": len(self._groups)}
 
     def clear(self) -> None:
         """Löscht alle Alerts."""
-        self.alerts.clear()
+        with self._lock:
+            self.alerts.clear()
+            self._groups.clear()
+
+
+@functools.lru_cache(maxsize=None)
+def _scoring_server_class() -> type:
+    """Erstellt die Server-Klassen des Scoring-Service (``http.server`` wird erst hier importiert)."""
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class _ScoringRequestHandler(BaseHTTPRequestHandler):
+        """Request-Handler des Scoring-Service (Keep-Alive über HTTP/1.1)."""
+
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+        server: Any
+
+        def do_GET(self) -> None:
+            if self.path == "/metrics":
+                metrics = self.server.scorer.metrics
+                if metrics is None:
+                    self._send_json(404, {"error": "Metriken nicht aktiviert"})
+                    return
+                self._send(200, metrics.render().encode("utf-8"), "text/plain; version=0.0.4; charset=utf-8")
+            elif self.path == "/stats":
+                stats = {agent_id: s.to_dict() for agent_id, s in self.server.scorer.get_agent_statistics().items()}
+                self._send_json(200, stats)
+            elif self.path == "/health":
+                self._send_json(200, {"status": "ok", "config_version": self.server.scorer.config_version})
+            else:
+                self._send_json(404, {"error": f"Unbekannter Pfad: {self.path}"})
+
+        def do_POST(self) -> None:
+            if self.path not in ("/score", "/score/batch"):
+                self._send_json(404, {"error": f"Unbekannter Pfad: {self.path}"})
+                return
+
+            try:
+                length = int(self.headers.get("Content-Length") or 0)
+            except ValueError:
+                length = -1
+            if length < 0:
+                # Ohne gültige Länge ist das Ende des Bodys unbekannt
+                self.close_connection = True
+                self._send_json(400, {"error": "Ungültiger Content-Length-Header"})
+                return
+            if length > self.server.max_body_bytes:
+                self.close_connection = True
+                self._send_json(413, {"error": f"Request zu groß (max. {self.server.max_body_bytes} Bytes)"})
+                return
+            body = self.rfile.read(length)
+
+            metrics = self.server.scorer.metrics
+            if metrics is not None:
+                metrics.in_flight.inc()
+            try:
+                if self.path == "/score":
+                    self._send_json(200, self._score(self.server.scorer._parse_json(body)).to_dict())
+                else:
+                    self._send_json(200, {"results": [self._score_item(log) for log in self._parse_batch(body)]})
+            except (json.JSONDecodeError, UnicodeDecodeError, ValueError) as e:
+                self._send_json(400, {"error": str(e)})
+            finally:
+                if metrics is not None:
+                    metrics.in_flight.dec()
+
+        def _parse_batch(self, body: bytes) -> list[Any]:
+            """Akzeptiert ein JSON-Array oder JSONL (ein Log pro Zeile)."""
+            parse = self.server.scorer._parse_json
+            text = body.decode("utf-8")
+            if text.lstrip().startswith("["):
+                return parse(text)
+            return [parse(line) for line in text.splitlines() if line.strip()]
+
+        def _score(self, log: Any) -> ScoreResult:
+            # Ohne Lock: Statistiken, Cache, Metriken und Alerts sind threadsicher
+            result = self.server.scorer.score_log(log)
+            if self.server.alert_system is not None:
+                self.server.alert_system.check(result)
+            return result
+
+        def _score_item(self, log: Any) -> dict:
+            try:
+                return self._score(log).to_dict()
+            except ValueError as e:
+                return {"error": str(e)}
+
+        def _send_json(self, status: int, payload: Any) -> None:
+            data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+            self._send(status, data, "application/json; charset=utf-8")
+
+        def _send(self, status: int, data: bytes, content_type: str) -> None:
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, format: str, *args: Any) -> None:
+            logger.debug(f"{self.address_string()} - {format % args}")
+
+
+    class _ScoringHTTPServer(ThreadingHTTPServer):
+        daemon_threads = True
+
+        def __init__(self, address: tuple[str, int], scorer: AgentLogScorer,
+                     alert_system: AlertSystem | None, max_body_bytes: int):
+            super().__init__(address, _ScoringRequestHandler)
+            self.scorer = scorer
+            self.alert_system = alert_system
+            self.max_body_bytes = max_body_bytes
+
+    return _ScoringHTTPServer
+
+
+class ScoringService:
+    """
+    Lokaler HTTP-Service mit vorgeladenem ``AgentLogScorer``.
+
+    Endpunkte:
+        POST /score        Ein Log (JSON-Objekt) -> ScoreResult als JSON
+        POST /score/batch  JSON-Array oder JSONL -> {"results": [...]};
+                           ungültige Logs liefern {"error": ...} an ihrer Position
+        GET  /stats        Agent-Statistiken
+        GET  /metrics      Betriebsmetriken im Prometheus-Textformat (falls aktiviert)
+        GET  /health       Statusprüfung
+
+    Konfiguration und Keyword-Matcher werden nur einmal beim Start geladen;
+    Verbindungen bleiben per Keep-Alive offen. Jede Verbindung läuft in
+    einem eigenen Thread, Requests werden ohne globalen Lock parallel
+    bewertet.
+    """
+
+    MAX_BODY_BYTES = 32 * 1024 * 1024
+
+    def __init__(
+        self,
+        scorer: AgentLogScorer,
+        host: str = "127.0.0.1",
+        port: int = 8080,
+        alert_system: AlertSystem | None = None,
+        max_body_bytes: int = MAX_BODY_BYTES
+    ):
+        self.scorer = scorer
+        self._server = _scoring_server_class()((host, port), scorer, alert_system, max_body_bytes)
+        self._thread: threading.Thread | None = None
+
+    @property
+    def address(self) -> tuple[str, int]:
+        """Tatsächliche Adresse (host, port), z.B. bei Port 0."""
+        return self._server.server_address[:2]
+
+    def serve_forever(self) -> None:
+        """Bearbeitet Requests bis ``shutdown`` aufgerufen wird."""
+        logger.info(f"Scoring-Service läuft auf http://{self.address[0]}:{self.address[1]}")
+        self._server.serve_forever()
+
+    def start(self) -> "ScoringService":
+        """Startet den Service in einem Hintergrund-Thread."""
+        self._thread = threading.Thread(target=self.serve_forever, name="scoring-service", daemon=True)
+        self._thread.start()
+        return self
+
+    def shutdown(self) -> None:
+        """Beendet den Service und schließt den Socket."""
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+
+    def __enter__(self) -> "ScoringService":
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.shutdown()
 
 
 def process_log_file(file_path: str, config_path: str | None = None) -> dict:
@@ -800,10 +4893,218 @@ def get_risk_level(risk_score: int, thresholds: dict) -> str:
     return scorer._get_risk_level(risk_score).value
 
 
-def main():
+def _create_report_writers(args: Any, json_lines: bool = False) -> list[ReportWriter]:
+    """Erstellt die Report-Writer für --output/--csv/--html (--output im JSONL-Modus als JSONL)."""
+    writers: list[ReportWriter] = []
+    if args.output:
+        writers.append(JsonlReportWriter(args.output) if json_lines else JsonReportWriter(args.output))
+    if args.csv:
+        writers.append(CsvReportWriter(args.csv))
+    if args.html:
+        if args.html_page_size:
+            writers.append(PaginatedHtmlReportWriter(args.html, page_size=args.html_page_size))
+        else:
+            writers.append(HtmlReportWriter(args.html))
+    return writers
+
+
+def _create_alert_sinks(args: Any) -> list[AlertSink]:
+    """Erstellt die Alert-Sinks für --alert-file/--alert-webhook/--alert-stdout."""
+    sinks: list[AlertSink] = []
+    if args.alert_file:
+        sinks.append(FileAlertSink(args.alert_file))
+    if args.alert_webhook:
+        sinks.append(WebhookAlertSink(args.alert_webhook))
+    if args.alert_stdout:
+        sinks.append(StreamAlertSink())
+    return sinks
+
+
+def _stream_results(
+    results: Iterable[ScoreResult],
+    writers: list[ReportWriter],
+    alert_system: AlertSystem,
+    accumulators: Iterable[StatisticsAggregate | DashboardAccumulator | None] = ()
+) -> SummaryAccumulator:
+    """Leitet jedes Ergebnis an Alerts, Summary, Report-Writer und weitere Akkumulatoren weiter."""
+    summary_accumulator = SummaryAccumulator()
+    active = [accumulator for accumulator in accumulators if accumulator is not None]
+    try:
+        for writer in writers:
+            writer.open()
+        for result in results:
+            alert_system.check(result)
+            summary_accumulator.add(result)
+            for accumulator in active:
+                accumulator.add(result)
+            for writer in writers:
+                writer.write(result)
+    finally:
+        for writer in writers:
+            writer.close()
+    return summary_accumulator
+
+
+def _save_dashboard(
+    dashboard: DashboardAccumulator,
+    scorer: AgentLogScorer,
+    input_path: str,
+    shard: ShardSpec | None = None
+) -> None:
+    """Speichert das Live-Dashboard neben dem Input (pro Shard eine eigene Datei)."""
+    dashboard_path = os.path.join(os.path.dirname(input_path), "supervisor_dashboard_live.json")
+    if shard is not None:
+        dashboard_path = shard.output_path(dashboard_path)
+    DashboardGenerator.save(dashboard.to_dashboard(scorer.get_agent_statistics()), dashboard_path)
+
+
+def _run_jsonl(
+    args: Any,
+    input_path: str,
+    scorer: AgentLogScorer,
+    alert_system: AlertSystem,
+    shard: ShardSpec | None = None
+) -> int:
+    """Streamt eine JSONL-Datei durch Scorer, Alerts, Summary und die Report-Writer."""
+    malformed_lines = 0
+
+    def count_malformed(line_number: int, error: str) -> None:
+        nonlocal malformed_lines
+        malformed_lines += 1
+
+    results = scorer.iter_score_jsonl(input_path, on_error=count_malformed, shard=shard)
+    aggregate = StatisticsAggregate(scorer.config.fingerprint()) if args.partial_output else None
+    dashboard = DashboardAccumulator() if args.dashboard else None
+    summary_accumulator = _stream_results(
+        results, _create_report_writers(args, json_lines=True), alert_system, (aggregate, dashboard)
+    )
+    if aggregate is not None:
+        aggregate.save(args.partial_output)
+    if dashboard is not None:
+        _save_dashboard(dashboard, scorer, input_path, shard)
+
+    summary = summary_accumulator.to_dict()
+    summary["malformed_lines"] = malformed_lines
+    print(json.dumps(summary, indent=2, ensure_ascii=False))
+
+    if args.stats:
+        print("\n--- Agent-Statistiken ---")
+        for stats in scorer.get_agent_statistics().values():
+            print(json.dumps(stats.to_dict(), indent=2, ensure_ascii=False))
+
+    if alert_system.stats["triggered"]:
+        print(f"\n⚠️  {alert_system.stats['triggered']} Alerts ausgelöst!")
+
+    return 1 if summary.get("critical_count", 0) > 0 else 0
+
+
+def _run_watch(args: Any, watch_dir: str, scorer: AgentLogScorer, alert_system: AlertSystem) -> int:
+    """Bewertet neue Logs in ``watch_dir`` fortlaufend, bis der Prozess mit Strg+C beendet wird."""
+    writers = _create_report_writers(args, json_lines=True)
+    summary_accumulator = SummaryAccumulator(collect_incidents=False)
+    watcher = LogWatcher(scorer, watch_dir, poll_interval=args.poll_interval)
+    metrics_written = time.monotonic()
+
+    def on_result(path: Path, result: ScoreResult) -> None:
+        nonlocal metrics_written
+        alert_system.check(result)
+        summary_accumulator.add(result)
+        for writer in writers:
+            writer.write(result)
+            writer.flush()
+        print(json.dumps({"file": str(path), **result.to_dict()}, ensure_ascii=False), flush=True)
+        # Metrik-Datei höchstens einmal pro Sekunde aktualisieren
+        if args.metrics_file and scorer.metrics is not None and time.monotonic() - metrics_written >= 1.0:
+            scorer.metrics.write(args.metrics_file)
+            metrics_written = time.monotonic()
+
+    try:
+        for writer in writers:
+            writer.open()
+        watcher.run(on_result)
+    except KeyboardInterrupt:
+        logger.info("Watch-Modus beendet")
+    finally:
+        watcher.close()
+        for writer in writers:
+            writer.close()
+
+    summary = summary_accumulator.to_dict()
+    print(json.dumps(summary, indent=2, ensure_ascii=False))
+    return 1 if summary.get("critical_count", 0) > 0 else 0
+
+
+def _configure_logging(verbose: bool) -> None:
+    """Konfiguriert das Logging (erst beim CLI-Aufruf, nicht beim Import des Moduls)."""
+    log_level = os.environ.get("LOG_LEVEL", "INFO").upper()
+    logging.basicConfig(
+        level=logging.DEBUG if verbose else getattr(logging, log_level, logging.INFO),
+        format='%(asctime)s - %(levelname)s - %(name)s - %(message)s'
+    )
+
+
+def _run_merge(argv: list[str]) -> int:
+    """
+    Unterbefehl ``merge``: führt Teilaggregate (``--partial-output``) zusammen.
+
+    Gibt die Summary aus wie ein Lauf über alle Logs auf einem Rechner und
+    schreibt optional das Dashboard und das zusammengeführte Teilaggregat.
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="agent_log_scorer.py merge",
+        description="Teilaggregate mehrerer Scoring-Läufe zusammenführen"
+    )
+    parser.add_argument("partials", nargs="+", help="Teilaggregat-Dateien (--partial-output)")
+    parser.add_argument("-o", "--output", help="Zusammengeführtes Teilaggregat in diese Datei schreiben")
+    parser.add_argument("--dashboard", metavar="FILE", help="Supervisor-Dashboard in diese Datei schreiben")
+    parser.add_argument("--stats", action="store_true", help="Agent-Statistiken anzeigen")
+    parser.add_argument("-v", "--verbose", action="store_true", help="Ausführliche Ausgabe")
+    args = parser.parse_args(argv)
+
+    _configure_logging(args.verbose)
+
+    try:
+        aggregate = StatisticsAggregate()
+        for path in args.partials:
+            aggregate.merge(StatisticsAggregate.load(path))
+    except FileNotFoundError as e:
+        logger.error(f"Datei nicht gefunden: {e}")
+        return 4
+    except json.JSONDecodeError as e:
+        logger.error(f"Ungültiges JSON: {e}")
+        return 5
+    except (ValueError, KeyError, TypeError) as e:
+        logger.error(f"Ungültiges Teilaggregat: {e}")
+        return 6
+
+    if args.output:
+        aggregate.save(args.output)
+
+    summary = aggregate.get_summary()
+    print(json.dumps(summary, indent=2, ensure_ascii=False))
+
+    if args.dashboard:
+        DashboardGenerator.save(aggregate.get_dashboard(), args.dashboard)
+
+    if args.stats:
+        print("\n--- Agent-Statistiken ---")
+        for stats in aggregate.get_agent_statistics().values():
+            print(json.dumps(stats.to_dict(), indent=2, ensure_ascii=False))
+
+    return 1 if summary.get("critical_count", 0) > 0 else 0
+
+
+def main(argv: list[str] | None = None):
     """Haupteinstiegspunkt für die Kommandozeile."""
     import argparse
 
+    if argv is None:
+        argv = sys.argv[1:]
+    if argv[:1] == ["merge"]:
+        return _run_merge(argv[1:])
+
     parser = argparse.ArgumentParser(
         description="Agent Log Scorer - Risikobewertung für KI-Agenten-Logs",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -813,6 +5114,15 @@ Beispiele:
   %(prog)s --batch ./logs/                # Verzeichnis batch-verarbeiten
   %(prog)s --batch ./logs/ --html report.html  # Mit HTML-Report
   %(prog)s --batch ./logs/ --dashboard    # Dashboard generieren
+  %(prog)s --batch ./logs/ --workers 8    # Parallel mit 8 Prozessen
+  %(prog)s --jsonl calls.jsonl -o out.jsonl  # JSONL-Datei streamen
+  %(prog)s --batch ./logs/ --manifest .scored.json  # Nur neue/geänderte Dateien bewerten
+  %(prog)s --batch ./logs/ --cache scores.db  # Persistenter Ergebnis-Cache
+  %(prog)s --jsonl calls.jsonl --fast -o out.jsonl  # Nur Risikobewertung, frühzeitiger Abbruch der Suche
+  %(prog)s --batch ./logs/a --partial-output a.partial.json  # Teilaggregat pro Rechner
+  %(prog)s merge a.partial.json b.partial.json --dashboard dashboard.json  # Teilaggregate zusammenführen
+  %(prog)s --serve 8080 --reload-config    # Service, Konfiguration ohne Neustart austauschen
+  %(prog)s --batch ./logs/ --shard 0/4 --partial-output part.json  # Shard 0 von 4 (-> part.shard0of4.json)
         """
     )
     parser.add_argument(
@@ -830,9 +5140,36 @@ Beispiele:
         action="store_true",
         help="Batch-Modus: Verarbeite alle JSON-Dateien im Verzeichnis"
     )
+    parser.add_argument(
+        "--jsonl",
+        action="store_true",
+        help="Input ist eine JSONL-Datei (ein Log pro Zeile), wird zeilenweise gestreamt"
+    )
+    parser.add_argument(
+        "--watch",
+        metavar="DIR",
+        help="Verzeichnis überwachen und neue/angehängte Logs sofort bewerten (läuft bis Strg+C)"
+    )
+    parser.add_argument(
+        "--serve",
+        metavar="PORT",
+        type=int,
+        help="Als lokaler HTTP-Service starten (POST /score, POST /score/batch, GET /stats)"
+    )
+    parser.add_argument(
+        "--host",
+        default="127.0.0.1",
+        help="Adresse für --serve (Standard: 127.0.0.1)"
+    )
+    parser.add_argument(
+        "--poll-interval",
+        type=float,
+        default=0.2,
+        help="Prüfintervall in Sekunden im Watch-Modus (Standard: 0.2)"
+    )
     parser.add_argument(
         "-o", "--output",
-        help="Output-Datei für JSON-Export"
+        help="Output-Datei für JSON-Export (im JSONL-Modus: ein Ergebnis pro Zeile)"
     )
     parser.add_argument(
         "--csv",
@@ -842,6 +5179,11 @@ Beispiele:
         "--html",
         help="HTML-Report exportieren"
     )
+    parser.add_argument(
+        "--html-page-size",
+        type=int,
+        help="HTML-Report auf Seiten mit je N Zeilen aufteilen (plus Seite nur mit kritischen Vorfällen)"
+    )
     parser.add_argument(
         "--dashboard",
         action="store_true",
@@ -863,12 +5205,112 @@ Beispiele:
         action="store_true",
         help="Asynchrone Verarbeitung (schneller bei vielen Dateien)"
     )
+    parser.add_argument(
+        "-w", "--workers",
+        type=int,
+        default=1,
+        help="Anzahl Worker-Prozesse im Batch-Modus (Standard: 1 = sequentiell)"
+    )
+    parser.add_argument(
+        "--fast",
+        action="store_true",
+        help="Schneller Modus: nur risk/risk_level, ohne Keyword-Listen und Verstöße"
+    )
+    parser.add_argument(
+        "--manifest",
+        help="Manifest-Datei für inkrementelles Re-Scoring im Batch-Modus"
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Laufzeit pro Verarbeitungsstufe messen und als Tabelle ausgeben"
+    )
+    parser.add_argument(
+        "--metrics-file",
+        help="Betriebsmetriken im Prometheus-Textformat in diese Datei schreiben"
+    )
+    parser.add_argument(
+        "--cache",
+        help="SQLite-Datei für den persistenten Ergebnis-Cache"
+    )
+    parser.add_argument(
+        "--cache-size",
+        type=int,
+        default=100_000,
+        help="Maximale Anzahl Einträge im Ergebnis-Cache (Standard: 100000)"
+    )
+    parser.add_argument(
+        "--partial-output",
+        metavar="FILE",
+        help="Zusammenführbares Teilaggregat schreiben (Batch/JSONL; siehe Unterbefehl merge)"
+    )
+    parser.add_argument(
+        "--reload-config",
+        action="store_true",
+        help="Konfiguration im Watch-/Service-Modus bei Änderung der Datei oder per SIGHUP neu laden"
+    )
+    parser.add_argument(
+        "--alert-window",
+        type=float,
+        default=60.0,
+        help="Gleiche Alerts (Agent, Risk-Level, Verstöße) innerhalb von N Sekunden zusammenfassen (Standard: 60)"
+    )
+    parser.add_argument(
+        "--alert-rate",
+        type=float,
+        help="Höchstens N gemeldete Alerts pro Sekunde (Standard: unbegrenzt)"
+    )
+    parser.add_argument(
+        "--alert-file",
+        help="Alerts gebündelt als JSONL an diese Datei anhängen"
+    )
+    parser.add_argument(
+        "--alert-webhook",
+        metavar="URL",
+        help="Alerts gebündelt per HTTP-POST an diesen Webhook senden"
+    )
+    parser.add_argument(
+        "--alert-stdout",
+        action="store_true",
+        help="Alerts gebündelt als JSON-Zeilen auf stdout ausgeben"
+    )
+    parser.add_argument(
+        "--shard",
+        metavar="I/N",
+        help="Nur Shard I von N bewerten (I = 0..N-1); Ausgabedateien erhalten den Zusatz .shardIofN "
+             "bzw. ersetzen {shard} im Pfad"
+    )
+    parser.add_argument(
+        "--shard-key",
+        choices=SHARD_KEYS,
+        default="path",
+        help="Verteilung nach Dateipfad/Zeilennummer oder nach agent_id (Standard: path)"
+    )
 
-    args = parser.parse_args()
-
-    if args.verbose:
-        logging.getLogger().setLevel(logging.DEBUG)
+    args = parser.parse_args(argv)
+    _configure_logging(args.verbose)
 
+    shard = None
+    if args.shard:
+        if args.watch or args.serve is not None:
+            parser.error("--shard wird nur im Batch- und JSONL-Modus unterstützt")
+        try:
+            shard = ShardSpec.parse(args.shard, args.shard_key)
+        except ValueError as e:
+            parser.error(str(e))
+        # Jeder Shard schreibt in eigene Dateien
+        for name in ("output", "csv", "html", "manifest", "metrics_file", "partial_output"):
+            if getattr(args, name):
+                setattr(args, name, shard.output_path(getattr(args, name)))
+        logger.info(f"Shard {shard}")
+
+    if args.reload_config and not (args.watch or args.serve is not None):
+        parser.error("--reload-config wird nur im Watch- und Service-Modus unterstützt")
+
+    cache = None
+    scorer = None
+    alert_system = None
+    reloader = None
     try:
         # Pfad auflösen
         input_path = args.input
@@ -877,40 +5319,69 @@ Beispiele:
 
         # Scorer initialisieren
         config_path = args.config if args.config else None
-        scorer = AgentLogScorer(config_path=config_path)
-        alert_system = AlertSystem()
+        cache = ResultCache(args.cache, max_entries=args.cache_size) if args.cache else None
+        metrics = ScorerMetrics() if args.metrics_file or args.serve is not None else None
+        scorer = AgentLogScorer(config_path=config_path, cache=cache, metrics=metrics, fast=args.fast)
+        if args.profile:
+            scorer.enable_profiling()
+        alert_system = AlertSystem(
+            metrics=metrics,
+            window=args.alert_window,
+            rate_limit=args.alert_rate,
+            sinks=_create_alert_sinks(args)
+        )
+        if args.reload_config:
+            reloader = ConfigReloader(scorer).start()
+            import signal
+            if hasattr(signal, "SIGHUP"):
+                signal.signal(signal.SIGHUP, lambda signum, frame: reloader.request())
 
         # Verarbeitung
+        if args.serve is not None:
+            service = ScoringService(scorer, host=args.host, port=args.serve, alert_system=alert_system)
+            try:
+                service.serve_forever()
+            except KeyboardInterrupt:
+                logger.info("Scoring-Service beendet")
+            finally:
+                service.shutdown()
+            return 0
+
+        if args.watch:
+            return _run_watch(args, args.watch, scorer, alert_system)
+
+        if args.jsonl:
+            return _run_jsonl(args, input_path, scorer, alert_system, shard)
+
         if args.batch or os.path.isdir(input_path):
             # Batch-Modus
-            if args.use_async:
-                results = asyncio.run(scorer.score_directory_async(input_path))
+            results: Iterable[ScoreResult]
+            if args.workers > 1 or args.manifest:
+                results = scorer.score_directory(
+                    input_path, workers=args.workers, manifest_path=args.manifest, shard=shard
+                )
+            elif args.use_async:
+                import asyncio
+                results = asyncio.run(scorer.score_directory_async(input_path, shard=shard))
             else:
-                results = scorer.score_directory(input_path)
-
-            # Alerts prüfen
-            for r in results:
-                alert_system.check(r)
-
-            # Summary erstellen
-            summary = scorer.get_summary(results)
+                # Ergebnisse werden direkt in Writer, Summary und Dashboard gestreamt
+                results = scorer.iter_score_directory(input_path, shard=shard)
+
+            # Alerts prüfen, Summary und Dashboard sammeln, Reports exportieren
+            aggregate = StatisticsAggregate(scorer.config.fingerprint()) if args.partial_output else None
+            dashboard = DashboardAccumulator() if args.dashboard else None
+            summary = _stream_results(
+                results, _create_report_writers(args), alert_system, (aggregate, dashboard)
+            ).to_dict()
+            if aggregate is not None:
+                aggregate.save(args.partial_output)
 
             # Output
             print(json.dumps(summary, indent=2, ensure_ascii=False))
 
-            # Reports exportieren
-            if args.output:
-                ReportGenerator.to_json(results, args.output)
-            if args.csv:
-                ReportGenerator.to_csv(results, args.csv)
-            if args.html:
-                ReportGenerator.to_html(results, summary, args.html)
-
             # Dashboard
-            if args.dashboard:
-                dashboard = DashboardGenerator.generate(results, scorer.get_agent_statistics())
-                dashboard_path = os.path.join(os.path.dirname(input_path), "supervisor_dashboard_live.json")
-                DashboardGenerator.save(dashboard, dashboard_path)
+            if dashboard is not None:
+                _save_dashboard(dashboard, scorer, input_path, shard)
 
             # Statistiken
             if args.stats:
@@ -919,14 +5390,16 @@ Beispiele:
                     print(json.dumps(stats.to_dict(), indent=2, ensure_ascii=False))
 
             # Alerts anzeigen
-            if alert_system.alerts:
-                print(f"\n⚠️  {len(alert_system.alerts)} Alerts ausgelöst!")
+            if alert_system.stats["triggered"]:
+                print(f"\n⚠️  {alert_system.stats['triggered']} Alerts ausgelöst!")
 
             # Exit-Code basierend auf kritischen Vorfällen
             return 1 if summary.get("critical_count", 0) > 0 else 0
 
         else:
             # Einzeldatei-Modus
+            if shard is not None:
+                parser.error("--shard wird nur im Batch- und JSONL-Modus unterstützt")
             result = scorer.score_file(input_path)
             alert_system.check(result)
 
@@ -934,9 +5407,9 @@ Beispiele:
 
             if args.stats:
                 print("\n--- Agent-Statistik ---")
-                stats = scorer.get_agent_statistics()
-                if result.agent_id in stats:
-                    print(json.dumps(stats[result.agent_id].to_dict(), indent=2, ensure_ascii=False))
+                agent_stats = scorer.get_agent_statistics()
+                if result.agent_id in agent_stats:
+                    print(json.dumps(agent_stats[result.agent_id].to_dict(), indent=2, ensure_ascii=False))
 
             # Exit-Code
             if result.risk_level == RiskLevel.CRITICAL:
@@ -962,6 +5435,21 @@ Beispiele:
             import traceback
             traceback.print_exc()
         return 99
+    finally:
+        if reloader is not None:
+            reloader.stop()
+        if alert_system is not None:
+            alert_system.close()
+        if scorer is not None and scorer.metrics is not None and args.metrics_file:
+            scorer.metrics.write(args.metrics_file)
+        if scorer is not None and scorer.profiler is not None:
+            print("\n--- Profil (pro Stufe) ---")
+            print(scorer.profiler.format_report())
+        if cache is not None:
+            if args.stats:
+                print("\n--- Cache ---")
+                print(json.dumps(cache.get_stats(), indent=2))
+            cache.close()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,91 @@
+"""
+Benchmark: Scoring-Latenz während die Konfiguration neu geladen wird
+
+Bewertet synthetische Logs in einer Schleife, während ein zweiter Thread
+die Konfiguration wiederholt neu lädt (YAML parsen, Matcher und Regeln
+kompilieren, atomar austauschen). Verglichen werden Durchsatz sowie p99
+und Maximum der Latenz pro Log mit einem Lauf ohne Neuladen.
+
+Aufruf:
+    python benchmarks/bench_config_reload.py
+    python benchmarks/bench_config_reload.py --logs 20000 --reload-interval 0.01 --json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from agents.agent_log_scorer import AgentLogScorer  # noqa: E402
+from synthetic import SyntheticLogGenerator  # noqa: E402
+
+
+def _measure(scorer: AgentLogScorer, logs: list[dict]) -> dict:
+    latencies = []
+    start = time.perf_counter()
+    for log in logs:
+        begin = time.perf_counter()
+        scorer.score_log(log)
+        latencies.append(time.perf_counter() - begin)
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    return {
+        "logs_per_second": round(len(logs) / elapsed),
+        "p99_us": round(latencies[int(len(latencies) * 0.99)] * 1e6, 1),
+        "max_us": round(latencies[-1] * 1e6, 1),
+    }
+
+
+def run(logs_count: int, reload_interval: float) -> dict:
+    """Misst ohne und mit parallelem Neuladen."""
+    logs = list(SyntheticLogGenerator(seed=5).logs(logs_count))
+    scorer = AgentLogScorer()
+    baseline = _measure(scorer, logs)
+
+    stop = threading.Event()
+    reloads = 0
+
+    def reload_loop() -> None:
+        nonlocal reloads
+        while not stop.wait(reload_interval):
+            scorer.reload_config()
+            reloads += 1
+
+    thread = threading.Thread(target=reload_loop, daemon=True)
+    thread.start()
+    try:
+        during = _measure(scorer, logs)
+    finally:
+        stop.set()
+        thread.join()
+
+    return {"logs": logs_count, "reloads": reloads, "baseline": baseline, "during_reload": during}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark für das Neuladen der Konfiguration")
+    parser.add_argument("--logs", type=int, default=10_000)
+    parser.add_argument("--reload-interval", type=float, default=0.05, help="Sekunden zwischen zwei Neuladevorgängen")
+    parser.add_argument("--json", action="store_true", help="Ergebnis als JSON ausgeben")
+    args = parser.parse_args()
+
+    logging.getLogger("agents.agent_log_scorer").setLevel(logging.ERROR)
+
+    row = run(args.logs, args.reload_interval)
+    if args.json:
+        print(json.dumps(row, indent=2))
+    else:
+        for key, value in row.items():
+            print(f"{key:>14}: {value}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,89 @@
+"""
+Benchmark: Schneller Modus (nur risk/risk_level) vs. vollständige Bewertung
+
+Bewertet lange, keyword-dichte synthetische Logs einmal vollständig und
+einmal mit ``score_log(..., fast=True)`` – mit den Standard-Keywords
+(Substring-Scan) und mit einer großen Keyword-Liste (Trie-Regex). Geprüft
+wird, dass ``risk`` und ``risk_level`` übereinstimmen; ausgegeben werden
+die Zeiten pro Log und der Speedup.
+
+Aufruf:
+    python benchmarks/bench_fast_verdict.py
+    python benchmarks/bench_fast_verdict.py --logs 500 --turns 400 --density 0.05 --json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import random
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from agents.agent_log_scorer import AgentLogScorer, ScoringConfig  # noqa: E402
+from synthetic import LogProfile, SyntheticLogGenerator  # noqa: E402
+
+
+def _extra_keywords(rng: random.Random, count: int) -> list[str]:
+    return ["".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(rng.randint(5, 9))) for _ in range(count)]
+
+
+def run(logs_count: int, turns: int, density: float, repeat: int) -> list[dict]:
+    """Misst vollständigen und schnellen Modus für beide Matcher-Varianten."""
+    logs = list(SyntheticLogGenerator(LogProfile(turns=turns, keyword_density=density), seed=13).logs(logs_count))
+    rng = random.Random(13)
+    default = ScoringConfig()
+    large = ScoringConfig(
+        price_keywords=default.price_keywords + _extra_keywords(rng, 300),
+        legal_keywords=default.legal_keywords + _extra_keywords(rng, 300),
+    )
+
+    rows = []
+    for config in (default, large):
+        scorer = AgentLogScorer(config=config)
+        full = [scorer.score_log(log) for log in logs]
+        fast = [scorer.score_log(log, fast=True) for log in logs]
+        identical = all((a.risk, a.risk_level) == (b.risk, b.risk_level) for a, b in zip(full, fast))
+
+        full_s = min(timeit.repeat(lambda: [scorer.score_log(log) for log in logs], number=1, repeat=repeat))
+        fast_s = min(timeit.repeat(lambda: [scorer.score_log(log, fast=True) for log in logs], number=1, repeat=repeat))
+        matcher = config.get_keyword_matcher()
+        rows.append({
+            "keywords": len(config.price_keywords) + len(config.legal_keywords),
+            "mode": "trie" if matcher.uses_trie else "scan",
+            "full_us": round(full_s / logs_count * 1e6, 1),
+            "fast_us": round(fast_s / logs_count * 1e6, 1),
+            "speedup": round(full_s / fast_s, 2),
+            "identical_risk": identical,
+        })
+    return rows
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark für den schnellen Bewertungsmodus")
+    parser.add_argument("--logs", type=int, default=200)
+    parser.add_argument("--turns", type=int, default=200, help="Turns pro Log")
+    parser.add_argument("--density", type=float, default=0.05, help="Anteil Keywords an den Wörtern")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--json", action="store_true", help="Ergebnis als JSON ausgeben")
+    args = parser.parse_args()
+
+    logging.getLogger("agents.agent_log_scorer").setLevel(logging.ERROR)
+
+    rows = run(args.logs, args.turns, args.density, args.repeat)
+    if args.json:
+        print(json.dumps(rows, indent=2))
+    else:
+        print(f"{'keywords':>9} {'mode':>5} {'full_us':>10} {'fast_us':>10} {'speedup':>8} {'identical':>10}")
+        for row in rows:
+            print(f"{row['keywords']:>9} {row['mode']:>5} {row['full_us']:>10} {row['fast_us']:>10} "
+                  f"{row['speedup']:>8} {row['identical_risk']!s:>10}")
+    return 0 if all(row["identical_risk"] for row in rows) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,117 @@
+"""
+Benchmark: Paginierter HTML-Report mit festem Speicherbudget
+
+Rendert synthetische Ergebnisse (Standard: 1 Mio. Zeilen) über den
+PaginatedHtmlReportWriter. Die Ergebnisse werden per Generator erzeugt und
+nie gesammelt; gemessen werden Laufzeit, Zeilen/s und der Speicherzuwachs
+(Peak-RSS bzw. tracemalloc-Peak). Überschreitet der Zuwachs das Budget,
+endet das Skript mit Exit-Code 1.
+
+Aufruf:
+    python benchmarks/bench_html_report.py
+    python benchmarks/bench_html_report.py --rows 100000 --page-size 5000 --budget-mb 32
+    python benchmarks/bench_html_report.py --rows 200000 --tracemalloc --json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import resource
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Iterator
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from agents.agent_log_scorer import PaginatedHtmlReportWriter, RiskLevel, ScoreResult  # noqa: E402
+
+LEVELS = [RiskLevel.LOW, RiskLevel.LOW, RiskLevel.MEDIUM, RiskLevel.HIGH, RiskLevel.CRITICAL]
+
+
+def synthetic_results(rows: int) -> Iterator[ScoreResult]:
+    """Erzeugt deterministische Ergebnisse ohne sie zu speichern."""
+    for i in range(rows):
+        level = LEVELS[i % len(LEVELS)]
+        risk = LEVELS.index(level)
+        yield ScoreResult(
+            agent_id=f"AGENT_{i % 250:03d}",
+            contact=f"Kontakt {i}",
+            timestamp="2025-12-23T10:30:00",
+            price_claim=risk > 0,
+            price_keywords_found=["euro"] if risk else [],
+            legal_claim=risk > 1,
+            legal_keywords_found=["gesetz"] if risk > 1 else [],
+            stop_triggered=False,
+            placeholder_used=False,
+            risk=risk,
+            risk_level=level,
+            violations=["Verstoß: price estimates without fact reference"] if risk else []
+        )
+
+
+def _peak_rss_mb() -> float:
+    # ru_maxrss ist unter Linux in KB, unter macOS in Bytes
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def run(rows: int, page_size: int, use_tracemalloc: bool) -> dict:
+    """Rendert den Report in ein temporäres Verzeichnis und misst Zeit und Speicher."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        output_path = Path(tmp_dir) / "report.html"
+        rss_before = _peak_rss_mb()
+        if use_tracemalloc:
+            tracemalloc.start()
+
+        start = time.perf_counter()
+        with PaginatedHtmlReportWriter(output_path, page_size=page_size) as writer:
+            writer.write_all(synthetic_results(rows))
+        elapsed = time.perf_counter() - start
+
+        if use_tracemalloc:
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            memory_mb = peak / (1024 * 1024)
+        else:
+            memory_mb = _peak_rss_mb() - rss_before
+
+        total_bytes = sum(p.stat().st_size for p in Path(tmp_dir).iterdir())
+        return {
+            "rows": rows,
+            "page_size": page_size,
+            "pages": len(writer.page_files),
+            "seconds": round(elapsed, 2),
+            "rows_per_second": round(rows / elapsed),
+            "output_mb": round(total_bytes / (1024 * 1024), 1),
+            "memory_mode": "tracemalloc_peak" if use_tracemalloc else "peak_rss_growth",
+            "memory_mb": round(memory_mb, 2),
+        }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark für den paginierten HTML-Report")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--page-size", type=int, default=5000)
+    parser.add_argument("--budget-mb", type=float, default=32.0, help="Maximal erlaubter Speicherzuwachs")
+    parser.add_argument("--tracemalloc", action="store_true", help="Python-Allokationen statt RSS messen (langsamer)")
+    parser.add_argument("--json", action="store_true", help="Ergebnis als JSON ausgeben")
+    args = parser.parse_args()
+
+    row = run(args.rows, args.page_size, args.tracemalloc)
+    row["budget_mb"] = args.budget_mb
+    row["within_budget"] = row["memory_mb"] <= args.budget_mb
+
+    if args.json:
+        print(json.dumps(row, indent=2))
+    else:
+        for key, value in row.items():
+            print(f"{key:>16}: {value}")
+    return 0 if row["within_budget"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,97 @@
+"""
+Benchmark: Latenz und Durchsatz des lokalen Scoring-Service
+
+Startet den ScoringService auf einem freien Port und schickt von mehreren
+Client-Threads über Keep-Alive-Verbindungen Requests an ``POST /score``.
+Gemessen werden Requests/s sowie p50/p99 der Latenz pro Request.
+
+Aufruf:
+    python benchmarks/bench_http_service.py
+    python benchmarks/bench_http_service.py --requests 20000 --clients 8 --json
+"""
+
+from __future__ import annotations
+
+import argparse
+import http.client
+import json
+import logging
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from agents.agent_log_scorer import AgentLogScorer, ScoringService  # noqa: E402
+
+LOG = {
+    "agent_id": "AGENT_BENCH",
+    "contact_name": "Max Mustermann",
+    "transcript": ["Kunde: Was kostet das?", "Agent: Das kostet 49 Euro im Monat, das ist gesetzlich erlaubt."],
+    "stop_triggered": False,
+    "result": "LEAD_CAPTURE",
+}
+
+
+def _percentile(values: list[float], percentile: float) -> float:
+    return values[min(len(values) - 1, int(len(values) * percentile))]
+
+
+def run(requests: int, clients: int) -> dict:
+    """Führt den Benchmark aus und gibt die Kennzahlen zurück."""
+    body = json.dumps(LOG)
+    per_client = requests // clients
+    latencies: list[list[float]] = [[] for _ in range(clients)]
+
+    with ScoringService(AgentLogScorer(), port=0) as service:
+        def client(index: int) -> None:
+            conn = http.client.HTTPConnection(*service.address)
+            for _ in range(per_client):
+                start = time.perf_counter()
+                conn.request("POST", "/score", body=body)
+                response = conn.getresponse()
+                response.read()
+                latencies[index].append(time.perf_counter() - start)
+            conn.close()
+
+        threads = [threading.Thread(target=client, args=(i,)) for i in range(clients)]
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - start
+
+    all_latencies = sorted(value for values in latencies for value in values)
+    return {
+        "requests": len(all_latencies),
+        "clients": clients,
+        "seconds": round(elapsed, 2),
+        "requests_per_second": round(len(all_latencies) / elapsed),
+        "p50_ms": round(_percentile(all_latencies, 0.50) * 1000, 3),
+        "p99_ms": round(_percentile(all_latencies, 0.99) * 1000, 3),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark für den Scoring-Service")
+    parser.add_argument("--requests", type=int, default=10_000)
+    parser.add_argument("--clients", type=int, default=4)
+    parser.add_argument("--json", action="store_true", help="Ergebnis als JSON ausgeben")
+    args = parser.parse_args()
+
+    # Request-Logging würde die Messung dominieren
+    logging.getLogger("agents.agent_log_scorer").setLevel(logging.WARNING)
+
+    row = run(args.requests, args.clients)
+    if args.json:
+        print(json.dumps(row, indent=2))
+    else:
+        for key, value in row.items():
+            print(f"{key:>20}: {value}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
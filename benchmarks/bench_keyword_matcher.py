@@ -0,0 +1,85 @@
+"""
+Benchmark: Kompilierter KeywordMatcher vs. Substring-Scan pro Keyword
+
+Vergleicht den bisherigen Ansatz (zwei Aufrufe von ``_check_keywords``, ein
+``kw.lower() in text_lower`` pro Keyword) mit ``KeywordMatcher.match`` bei
+wachsender Anzahl von Keywords.
+
+Aufruf:
+    python benchmarks/bench_keyword_matcher.py
+    python benchmarks/bench_keyword_matcher.py --sizes 25 500 2000 --json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from agents.agent_log_scorer import AgentLogScorer, KeywordMatcher, ScoringConfig  # noqa: E402
+
+ALPHABET = "abcdefghijklmnopqrstuvwxyzäöüß"
+
+
+def _words(rng: random.Random, count: int) -> list[str]:
+    return ["".join(rng.choice(ALPHABET) for _ in range(rng.randint(4, 10))) for _ in range(count)]
+
+
+def run(sizes: list[int], transcript_words: int, repeat: int, seed: int) -> list[dict]:
+    """Führt den Benchmark für alle Keyword-Anzahlen aus."""
+    rng = random.Random(seed)
+    config = ScoringConfig()
+    vocabulary = _words(rng, 3000) + config.price_keywords + config.legal_keywords
+    text = " ".join(rng.choice(vocabulary) for _ in range(transcript_words))
+    scorer = AgentLogScorer(config=config)
+
+    rows = []
+    for size in sizes:
+        price = config.price_keywords + _words(rng, max(0, size // 2 - len(config.price_keywords)))
+        legal = config.legal_keywords + _words(rng, max(0, size - len(price) - len(config.legal_keywords)))
+        matcher = KeywordMatcher(price, legal)
+
+        def legacy():
+            return scorer._check_keywords(text, price)[1], scorer._check_keywords(text, legal)[1]
+
+        assert matcher.match(text) == legacy()
+
+        legacy_s = min(timeit.repeat(legacy, number=repeat, repeat=3)) / repeat
+        matcher_s = min(timeit.repeat(lambda: matcher.match(text), number=repeat, repeat=3)) / repeat
+        rows.append({
+            "keywords": len(price) + len(legal),
+            "mode": "trie" if matcher.uses_trie else "scan",
+            "legacy_us": round(legacy_s * 1e6, 1),
+            "matcher_us": round(matcher_s * 1e6, 1),
+            "speedup": round(legacy_s / matcher_s, 2),
+        })
+    return rows
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark für den KeywordMatcher")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[25, 100, 250, 500, 1000, 2000])
+    parser.add_argument("--transcript-words", type=int, default=400)
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--json", action="store_true", help="Ergebnisse als JSON ausgeben")
+    args = parser.parse_args()
+
+    rows = run(args.sizes, args.transcript_words, args.repeat, args.seed)
+    if args.json:
+        print(json.dumps(rows, indent=2))
+    else:
+        print(f"{'Keywords':>9} {'Modus':>6} {'Legacy µs':>10} {'Matcher µs':>11} {'Speed-up':>9}")
+        for row in rows:
+            print(f"{row['keywords']:>9} {row['mode']:>6} {row['legacy_us']:>10} "
+                  f"{row['matcher_us']:>11} {row['speedup']:>8}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
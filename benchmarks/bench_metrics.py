@@ -0,0 +1,85 @@
+"""
+Benchmark: Overhead der Betriebsmetriken pro Log
+
+Bewertet dieselben synthetischen Logs mit und ohne ``ScorerMetrics`` und
+gibt den Mehraufwand pro Log aus. Überschreitet er das Budget (Standard:
+1 µs), endet das Skript mit Exit-Code 1.
+
+Aufruf:
+    python benchmarks/bench_metrics.py
+    python benchmarks/bench_metrics.py --logs 2000 --budget-us 1.0 --json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from agents.agent_log_scorer import AgentLogScorer, ScorerMetrics  # noqa: E402
+from synthetic import SyntheticLogGenerator  # noqa: E402
+
+
+def _per_log_us(scorers: dict[str, AgentLogScorer], logs: list[dict], repeat: int) -> dict[str, float]:
+    """Misst score_log abwechselnd für alle Scorer; das Minimum über die Wiederholungen zählt."""
+    best = dict.fromkeys(scorers, float("inf"))
+    for _ in range(repeat):
+        for label, scorer in scorers.items():
+            seconds = timeit.timeit(lambda: [scorer.score_log(log) for log in logs], number=1)
+            best[label] = min(best[label], seconds)
+    return {label: round(seconds / len(logs) * 1e6, 3) for label, seconds in best.items()}
+
+
+def run(logs_count: int, repeat: int) -> dict:
+    """
+    Misst den Overhead der Metriken.
+
+    ``overhead_us`` stammt aus einem Lauf, in dem das eigentliche Scoring
+    durch ein konstantes Ergebnis ersetzt ist; so bleibt nur der Aufwand
+    der Instrumentierung übrig, ohne das Rauschen des Scorings.
+    Zusätzlich werden die Ende-zu-Ende-Zeiten ausgegeben.
+    """
+    logs = list(SyntheticLogGenerator(seed=7).logs(logs_count))
+    row = _per_log_us(
+        {"without_us": AgentLogScorer(), "with_us": AgentLogScorer(metrics=ScorerMetrics())}, logs, repeat
+    )
+
+    hollow = {"without": AgentLogScorer(), "with": AgentLogScorer(metrics=ScorerMetrics())}
+    result = hollow["without"].score_log(logs[0])
+    for scorer in hollow.values():
+        scorer._score_log = lambda log, fast=False: result
+    isolated = _per_log_us(hollow, logs, repeat * 4)
+
+    row["logs"] = logs_count
+    row["overhead_us"] = round(isolated["with"] - isolated["without"], 3)
+    return row
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark für den Overhead der Metriken")
+    parser.add_argument("--logs", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=15)
+    parser.add_argument("--budget-us", type=float, default=1.0, help="Erlaubter Mehraufwand pro Log")
+    parser.add_argument("--json", action="store_true", help="Ergebnis als JSON ausgeben")
+    args = parser.parse_args()
+
+    logging.getLogger("agents.agent_log_scorer").setLevel(logging.ERROR)
+
+    row = run(args.logs, args.repeat)
+    row["budget_us"] = args.budget_us
+    row["within_budget"] = row["overhead_us"] <= args.budget_us
+    if args.json:
+        print(json.dumps(row, indent=2))
+    else:
+        for key, value in row.items():
+            print(f"{key:>14}: {value}")
+    return 0 if row["within_budget"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
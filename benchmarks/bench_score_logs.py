@@ -0,0 +1,102 @@
+"""
+Benchmark: Batch-Bewertung mit score_logs vs. score_log pro Log
+
+Bewertet dieselben synthetischen Logs einmal mit ``score_log`` in einer
+Schleife und einmal mit ``score_logs`` – mit NumPy (falls installiert)
+und in reinem Python. Zusätzlich wird nur die Aufnahme in die
+Agent-Statistiken gemessen (``AgentStatistics.add`` pro Ergebnis vs.
+gruppierte Summen je Agent). Sind Ergebnisse oder Statistiken nicht
+identisch, endet das Skript mit Exit-Code 1.
+
+Aufruf:
+    python benchmarks/bench_score_logs.py
+    python benchmarks/bench_score_logs.py --logs 100000 --fast --json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import agents.agent_log_scorer as scorer_module  # noqa: E402
+from agents.agent_log_scorer import AgentLogScorer  # noqa: E402
+from synthetic import SyntheticLogGenerator  # noqa: E402
+
+
+def _states(scorer: AgentLogScorer) -> dict:
+    return {agent_id: stats.to_state() for agent_id, stats in scorer.get_agent_statistics().items()}
+
+
+def run(logs_count: int, fast: bool, repeat: int) -> list[dict]:
+    """Misst die Schleife über score_log und score_logs je Backend."""
+    logs = list(SyntheticLogGenerator(seed=23).logs(logs_count))
+    reference = AgentLogScorer()
+    expected = [reference.score_log(log, fast=fast) for log in logs]
+    expected_stats = _states(reference)
+
+    numpy_backend = scorer_module._numpy
+    backends = {"python": lambda: None}
+    if numpy_backend() is not None:
+        backends["numpy"] = numpy_backend
+
+    rows = []
+    scalar = AgentLogScorer()
+    loop_s = min(timeit.repeat(lambda: [scalar.score_log(log, fast=fast) for log in logs], number=1, repeat=repeat))
+    scalar.reset_statistics()
+    stats_loop_s = min(timeit.repeat(
+        lambda: [scalar._update_statistics(result) for result in expected], number=1, repeat=repeat))
+    rows.append({
+        "variant": "score_log",
+        "us_per_log": round(loop_s / logs_count * 1e6, 2),
+        "statistics_us_per_log": round(stats_loop_s / logs_count * 1e6, 3),
+        "identical": True,
+    })
+
+    try:
+        for name, backend in backends.items():
+            scorer_module._numpy = backend
+            batched = AgentLogScorer()
+            identical = batched.score_logs(logs, fast=fast) == expected and _states(batched) == expected_stats
+            batch_s = min(timeit.repeat(lambda: batched.score_logs(logs, fast=fast), number=1, repeat=repeat))
+            stats_s = min(timeit.repeat(
+                lambda: scorer_module._group_statistics(expected), number=1, repeat=repeat))
+            rows.append({
+                "variant": f"score_logs[{name}]",
+                "us_per_log": round(batch_s / logs_count * 1e6, 2),
+                "statistics_us_per_log": round(stats_s / logs_count * 1e6, 3),
+                "identical": identical,
+            })
+    finally:
+        scorer_module._numpy = numpy_backend
+    return rows
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark für die Batch-Bewertung score_logs")
+    parser.add_argument("--logs", type=int, default=20_000)
+    parser.add_argument("--fast", action="store_true", help="Schneller Modus (nur risk/risk_level)")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--json", action="store_true", help="Ergebnis als JSON ausgeben")
+    args = parser.parse_args()
+
+    logging.getLogger("agents.agent_log_scorer").setLevel(logging.ERROR)
+
+    rows = run(args.logs, args.fast, args.repeat)
+    if args.json:
+        print(json.dumps(rows, indent=2))
+    else:
+        print(f"{'variant':>20} {'us_per_log':>11} {'statistics_us':>14} {'identical':>10}")
+        for row in rows:
+            print(f"{row['variant']:>20} {row['us_per_log']:>11} {row['statistics_us_per_log']:>14} "
+                  f"{row['identical']!s:>10}")
+    return 0 if all(row["identical"] for row in rows) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
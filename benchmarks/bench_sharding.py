@@ -0,0 +1,108 @@
+"""
+Benchmark: Verteilter Batch-Lauf mit N Shards auf einem Rechner
+
+Erzeugt einen synthetischen Korpus (siehe ``synthetic.py``), startet N
+Prozesse ``agent_log_scorer.py --batch ... --shard I/N --partial-output``
+gleichzeitig und führt die Teilaggregate mit ``merge`` zusammen. Geprüft
+wird, dass das Ergebnis identisch mit einem einzelnen Lauf über den
+gesamten Korpus ist und dass die Shards gleichmäßig ausgelastet sind.
+Ausgegeben werden Logs pro Shard, maximale Abweichung vom Mittel und die
+Laufzeiten; bei Abweichung oder Ungleichgewicht über ``--tolerance`` endet
+das Skript mit Exit-Code 1.
+
+Aufruf:
+    python benchmarks/bench_sharding.py
+    python benchmarks/bench_sharding.py --files 20000 --shards 8 --shard-key agent --json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from agents.agent_log_scorer import StatisticsAggregate  # noqa: E402
+from synthetic import LogProfile, SyntheticLogGenerator  # noqa: E402
+
+SCORER = Path(__file__).parent.parent / "agents" / "agent_log_scorer.py"
+
+
+def _command(*args: str) -> list[str]:
+    return [sys.executable, str(SCORER), *args]
+
+
+def run(files: int, shards: int, shard_key: str, agents: int) -> dict:
+    """Führt Einzel- und Shard-Lauf aus und vergleicht die Aggregate."""
+    env = {**os.environ, "LOG_LEVEL": "ERROR"}
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tmp = Path(tmp_dir)
+        corpus = tmp / "corpus"
+        SyntheticLogGenerator(LogProfile(agents=agents, keyword_density=0.02), seed=3).write_corpus(corpus, files)
+
+        start = time.perf_counter()
+        subprocess.run(_command("--batch", str(corpus), "--partial-output", str(tmp / "single.json")),
+                       env=env, stdout=subprocess.DEVNULL)
+        single_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        processes = [
+            subprocess.Popen(
+                _command("--batch", str(corpus), "--shard", f"{i}/{shards}", "--shard-key", shard_key,
+                         "--partial-output", str(tmp / "part.json")),
+                env=env, stdout=subprocess.DEVNULL
+            )
+            for i in range(shards)
+        ]
+        for process in processes:
+            process.wait()
+        sharded_seconds = time.perf_counter() - start
+
+        partials = [tmp / f"part.shard{i}of{shards}.json" for i in range(shards)]
+        subprocess.run(_command("merge", *map(str, partials), "-o", str(tmp / "merged.json")),
+                       env=env, stdout=subprocess.DEVNULL)
+
+        per_shard = [StatisticsAggregate.load(path).summary.total for path in partials]
+        merged = StatisticsAggregate.load(tmp / "merged.json").to_dict()
+        single = StatisticsAggregate.load(tmp / "single.json").to_dict()
+
+    mean = sum(per_shard) / shards
+    return {
+        "files": files,
+        "shards": shards,
+        "shard_key": shard_key,
+        "logs_per_shard": per_shard,
+        "max_imbalance": round(max(abs(count - mean) for count in per_shard) / mean, 4),
+        "identical_to_single": merged == single,
+        "single_seconds": round(single_seconds, 2),
+        "sharded_seconds": round(sharded_seconds, 2),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark für verteilte Läufe mit --shard")
+    parser.add_argument("--files", type=int, default=5000)
+    parser.add_argument("--shards", type=int, default=4)
+    parser.add_argument("--shard-key", choices=("path", "agent"), default="path")
+    parser.add_argument("--agents", type=int, default=500, help="Anzahl Agenten im Korpus")
+    parser.add_argument("--tolerance", type=float, default=0.05, help="Erlaubte Abweichung vom Mittel (0.05 = 5 %%)")
+    parser.add_argument("--json", action="store_true", help="Ergebnis als JSON ausgeben")
+    args = parser.parse_args()
+
+    row = run(args.files, args.shards, args.shard_key, args.agents)
+    if args.json:
+        print(json.dumps(row, indent=2))
+    else:
+        for key, value in row.items():
+            print(f"{key:>20}: {value}")
+    return 0 if row["identical_to_single"] and row["max_imbalance"] <= args.tolerance else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
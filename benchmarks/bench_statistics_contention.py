@@ -0,0 +1,150 @@
+"""
+Benchmark: Agent-Statistiken unter parallelem Scoring
+
+Nimmt vorab bewertete synthetische Logs mit 1..N Threads in die
+Statistik eines gemeinsamen Scorers auf. Gemessen wird nur die
+Aktualisierung der Statistik (ohne das Scoring selbst, das den
+Unterschied sonst im Rauschen verschwinden ließe). Verglichen werden
+drei Varianten:
+
+- ``sharded``: die threadsicheren Shards pro Thread (Standard)
+- ``global_lock``: ein gemeinsames Lock um jede Aktualisierung
+- ``unsynchronized``: ein gemeinsames Dictionary ohne Lock (nicht
+  threadsicher, nur als Untergrenze für den Aufwand)
+
+Ausgegeben werden Aktualisierungen pro Sekunde je Variante und Threadanzahl sowie,
+ob die Zähler exakt stimmen. Ist ``sharded`` bei einer Threadanzahl um
+mehr als ``--tolerance`` langsamer als ``global_lock`` oder stimmen seine
+Zähler nicht, endet das Skript mit Exit-Code 1.
+
+Aufruf:
+    python benchmarks/bench_statistics_contention.py
+    python benchmarks/bench_statistics_contention.py --logs 1000000 --threads 1 4 16 --json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import sys
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from agents.agent_log_scorer import AgentLogScorer, AgentStatistics, ScoreResult  # noqa: E402
+from synthetic import SyntheticLogGenerator  # noqa: E402
+
+
+class _GlobalLockScorer(AgentLogScorer):
+    """Statistik in einem Dictionary, jede Aktualisierung unter einem gemeinsamen Lock."""
+
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self._plain_stats: dict[str, AgentStatistics] = defaultdict(lambda: AgentStatistics(agent_id="unknown"))
+        self._stats_lock = threading.Lock()
+
+    def _update_statistics(self, result: ScoreResult) -> None:
+        with self._stats_lock:
+            stats = self._plain_stats[result.agent_id]
+            stats.agent_id = result.agent_id
+            stats.add(result)
+
+    def get_agent_statistics(self) -> dict[str, AgentStatistics]:
+        with self._stats_lock:
+            return dict(self._plain_stats)
+
+
+class _UnsynchronizedScorer(_GlobalLockScorer):
+    """Wie vor der Umstellung auf Shards: gemeinsames Dictionary ohne Lock."""
+
+    def _update_statistics(self, result: ScoreResult) -> None:
+        stats = self._plain_stats[result.agent_id]
+        stats.agent_id = result.agent_id
+        stats.add(result)
+
+
+VARIANTS = {
+    "sharded": AgentLogScorer,
+    "global_lock": _GlobalLockScorer,
+    "unsynchronized": _UnsynchronizedScorer,
+}
+
+
+def _total(scorer: AgentLogScorer) -> int:
+    return sum(stats.total_interactions for stats in scorer.get_agent_statistics().values())
+
+
+def _measure(scorer: AgentLogScorer, results: list[ScoreResult], threads: int) -> float:
+    """Aktualisierungen pro Sekunde mit ``threads`` Threads auf einem Scorer."""
+    barrier = threading.Barrier(threads + 1)
+
+    def work(part: list[ScoreResult]) -> None:
+        update = scorer._update_statistics
+        barrier.wait()
+        for result in part:
+            update(result)
+
+    workers = [threading.Thread(target=work, args=(results[i::threads],)) for i in range(threads)]
+    for worker in workers:
+        worker.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for worker in workers:
+        worker.join()
+    return len(results) / (time.perf_counter() - start)
+
+
+def run(logs_count: int, thread_counts: list[int], repeat: int) -> list[dict]:
+    """Misst alle Varianten; pro Kombination zählt der beste von ``repeat`` Läufen."""
+    scorer = AgentLogScorer()
+    config = scorer.config
+    # Ergebnisse mehrfach verwenden: die Messung braucht viele Aktualisierungen, kein großes Korpus
+    results = [scorer.score_log(log) for log in SyntheticLogGenerator(seed=11).logs(min(logs_count, 5000))]
+    results = (results * (logs_count // len(results) + 1))[:logs_count]
+    rows = []
+    for threads in thread_counts:
+        row: dict = {"threads": threads}
+        exact = True
+        for _ in range(repeat):
+            # Varianten abwechselnd messen, damit Rauschen alle gleich trifft
+            for name, scorer_class in VARIANTS.items():
+                scorer = scorer_class(config=config)
+                rate = _measure(scorer, results, threads)
+                row[name] = max(row.get(name, 0), round(rate))
+                if name == "sharded":
+                    exact = exact and _total(scorer) == logs_count
+        row["sharded_exact"] = exact
+        row["sharded_vs_global_lock"] = round(row["sharded"] / row["global_lock"], 3)
+        rows.append(row)
+    return rows
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark für threadsichere Agent-Statistiken")
+    parser.add_argument("--logs", type=int, default=500_000, help="Anzahl Aktualisierungen pro Lauf")
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--tolerance", type=float, default=0.05, help="Erlaubter Rückstand zu global_lock (0.05 = 5 %%)")
+    parser.add_argument("--json", action="store_true", help="Ergebnis als JSON ausgeben")
+    args = parser.parse_args()
+
+    logging.getLogger("agents.agent_log_scorer").setLevel(logging.ERROR)
+
+    rows = run(args.logs, args.threads, args.repeat)
+    if args.json:
+        print(json.dumps(rows, indent=2))
+    else:
+        print(f"{'threads':>8} {'sharded':>10} {'global_lock':>12} {'unsynchronized':>15} {'exact':>6} {'ratio':>6}")
+        for row in rows:
+            print(f"{row['threads']:>8} {row['sharded']:>10} {row['global_lock']:>12} "
+                  f"{row['unsynchronized']:>15} {row['sharded_exact']!s:>6} {row['sharded_vs_global_lock']:>6}")
+    ok = all(row["sharded_exact"] and row["sharded_vs_global_lock"] >= 1 - args.tolerance for row in rows)
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,224 @@
+"""
+Benchmark-Suite: Durchsatz der Scoring-, Report- und Dashboard-Pfade
+
+Misst mit synthetischen Logs (siehe ``synthetic.py``) pro Größenordnung:
+``score_log``, ``score_directory``, ``score_directory_async``,
+``get_summary``, jedes ``ReportGenerator``-Format und
+``DashboardGenerator.generate``. Das Ergebnis ist JSON (inkl. Commit und
+Parametern), sodass Läufe verschiedener Commits verglichen werden können;
+mit ``--compare`` endet das Skript bei einer Regression mit Exit-Code 1.
+
+Für ``score_log`` werden höchstens ``--pool`` verschiedene Logs erzeugt und
+zyklisch bewertet; Summary, Reports und Dashboard erhalten die Ergebnisse
+als Generator, damit auch 1 Mio. Zeilen ohne entsprechenden Speicher
+laufen. Verzeichnis-Benchmarks schreiben echte Dateien und werden oberhalb
+von ``--dir-max`` übersprungen.
+
+Aufruf:
+    python benchmarks/bench_suite.py --output bench.json
+    python benchmarks/bench_suite.py --scales 1000 100000 1000000 --dir-max 100000
+    python benchmarks/bench_suite.py --scales 1000 --compare bench.json --tolerance 0.2
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import asdict
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Iterator
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from agents.agent_log_scorer import (  # noqa: E402
+    AgentLogScorer,
+    DashboardGenerator,
+    ReportGenerator,
+    ScoreResult,
+)
+from synthetic import LogProfile, SyntheticLogGenerator  # noqa: E402
+
+
+def _replay(results: list[ScoreResult], count: int) -> Iterator[ScoreResult]:
+    """Liefert ``count`` Ergebnisse zyklisch aus einem kleinen Pool."""
+    for i in range(count):
+        yield results[i % len(results)]
+
+
+def _timed(func: Callable[[], object], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=Path(__file__).parent, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_scale(
+    generator: SyntheticLogGenerator,
+    scale: int,
+    pool_size: int,
+    dir_max: int,
+    repeat: int,
+    work_dir: Path
+) -> list[dict]:
+    """Führt alle Benchmarks für eine Größenordnung aus."""
+    pool = list(generator.logs(min(scale, pool_size)))
+    results = [AgentLogScorer().score_log(log) for log in pool]
+    timings: dict[str, float | None] = {}
+
+    def score_logs() -> None:
+        scorer = AgentLogScorer()
+        for i in range(scale):
+            scorer.score_log(pool[i % len(pool)])
+
+    timings["score_log"] = _timed(score_logs, repeat)
+
+    if scale <= dir_max:
+        corpus = work_dir / f"corpus_{scale}"
+        generator.write_corpus(corpus, scale)
+        timings["score_directory"] = _timed(lambda: AgentLogScorer().score_directory(corpus), repeat)
+        timings["score_directory_async"] = _timed(
+            lambda: asyncio.run(AgentLogScorer().score_directory_async(corpus)), repeat
+        )
+    else:
+        timings["score_directory"] = timings["score_directory_async"] = None
+
+    scorer = AgentLogScorer()
+    summary = scorer.get_summary(results)
+    timings["get_summary"] = _timed(lambda: scorer.get_summary(_replay(results, scale)), repeat)
+    timings["report_json"] = _timed(
+        lambda: ReportGenerator.to_json(_replay(results, scale), work_dir / "report.json"), repeat
+    )
+    timings["report_csv"] = _timed(
+        lambda: ReportGenerator.to_csv(_replay(results, scale), work_dir / "report.csv"), repeat
+    )
+    timings["report_html"] = _timed(
+        lambda: ReportGenerator.to_html(_replay(results, scale), summary, work_dir / "report.html"), repeat
+    )
+    timings["report_html_paginated"] = _timed(
+        lambda: ReportGenerator.to_html(
+            _replay(results, scale), summary, work_dir / "paged.html", page_size=5000
+        ),
+        repeat
+    )
+
+    stats_scorer = AgentLogScorer()
+    for result in _replay(results, scale):
+        stats_scorer._update_statistics(result)
+    agent_stats = stats_scorer.get_agent_statistics()
+    timings["dashboard"] = _timed(
+        lambda: DashboardGenerator.generate(_replay(results, scale), agent_stats), repeat
+    )
+
+    rows = []
+    for name, seconds in timings.items():
+        row: dict = {"benchmark": name, "scale": scale}
+        if seconds is None:
+            row["skipped"] = f"scale > --dir-max ({dir_max})"
+        else:
+            row["seconds"] = round(seconds, 4)
+            row["per_item_us"] = round(seconds / scale * 1e6, 2)
+            row["items_per_second"] = round(scale / seconds)
+        rows.append(row)
+    return rows
+
+
+def compare(rows: list[dict], baseline_path: Path, tolerance: float) -> list[dict]:
+    """Vergleicht mit einem früheren Lauf; gibt die Regressionen zurück."""
+    baseline = {
+        (row["benchmark"], row["scale"]): row
+        for row in json.loads(baseline_path.read_text(encoding="utf-8"))["results"]
+        if "seconds" in row
+    }
+    regressions = []
+    for row in rows:
+        before = baseline.get((row["benchmark"], row["scale"]))
+        if before is None or "seconds" not in row:
+            continue
+        row["baseline_seconds"] = before["seconds"]
+        row["ratio"] = round(row["seconds"] / before["seconds"], 3) if before["seconds"] else None
+        if row["ratio"] is not None and row["ratio"] > 1 + tolerance:
+            regressions.append(row)
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark-Suite für den Agent Log Scorer")
+    parser.add_argument("--scales", type=int, nargs="+", default=[1000, 100_000])
+    parser.add_argument("--dir-max", type=int, default=100_000, help="Max. Dateien für Verzeichnis-Benchmarks")
+    parser.add_argument("--pool", type=int, default=2000, help="Anzahl verschiedener Logs für score_log")
+    parser.add_argument("--repeat", type=int, default=1, help="Wiederholungen pro Messung (Minimum zählt)")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--turns", type=int, default=8)
+    parser.add_argument("--words-per-turn", type=int, default=14)
+    parser.add_argument("--keyword-density", type=float, default=0.01)
+    parser.add_argument("--agents", type=int, default=50)
+    parser.add_argument("--malformed-share", type=float, default=0.01)
+    parser.add_argument("--output", help="Ergebnis-JSON in Datei schreiben (sonst stdout)")
+    parser.add_argument("--compare", help="Früheres Ergebnis-JSON zum Vergleich")
+    parser.add_argument("--tolerance", type=float, default=0.15, help="Erlaubte Verlangsamung (0.15 = 15 %%)")
+    args = parser.parse_args()
+
+    # Logging pro Datei würde die Messung dominieren
+    logging.getLogger("agents.agent_log_scorer").setLevel(logging.CRITICAL)
+
+    profile = LogProfile(
+        turns=args.turns,
+        words_per_turn=args.words_per_turn,
+        keyword_density=args.keyword_density,
+        agents=args.agents,
+        malformed_share=args.malformed_share,
+    )
+    generator = SyntheticLogGenerator(profile, seed=args.seed)
+
+    rows: list[dict] = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for scale in args.scales:
+            print(f"Skala {scale} ...", file=sys.stderr)
+            rows.extend(run_scale(generator, scale, args.pool, args.dir_max, args.repeat, Path(tmp_dir)))
+
+    regressions = compare(rows, Path(args.compare), args.tolerance) if args.compare else []
+    report = {
+        "meta": {
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "seed": args.seed,
+            "profile": asdict(profile),
+        },
+        "results": rows,
+        "regressions": [f"{row['benchmark']}@{row['scale']}: x{row['ratio']}" for row in regressions],
+    }
+
+    output = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        Path(args.output).write_text(output + "\n", encoding="utf-8")
+    else:
+        print(output)
+    for line in report["regressions"]:
+        print(f"Regression: {line}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,100 @@
+"""
+Benchmark: Transkript-Scan fensterweise vs. Verbinden und Kleinschreiben
+
+Vergleicht für synthetische Logs den früheren Weg (alle Turns mit
+``" ".join`` verbinden, das Ergebnis komplett mit ``lower()``
+kleinschreiben und durchsuchen) mit ``KeywordMatcher.match_turns``, das
+die Turns in Fenstern von ``KeywordMatcher.CHUNK_SIZE`` Zeichen
+kleinschreibt. Gemessen werden Zeit pro Log und der höchste Spitzenwert
+der Allokationen (``tracemalloc``) über alle Logs: beim Verbinden wächst
+er mit dem Transkript, fensterweise hängt er nur von ``CHUNK_SIZE`` ab.
+Sind die Treffer nicht identisch, endet das Skript mit Exit-Code 1.
+
+Aufruf:
+    python benchmarks/bench_transcript_scan.py
+    python benchmarks/bench_transcript_scan.py --logs 100 --turns 5000 --json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import sys
+import timeit
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from agents.agent_log_scorer import ScoringConfig, _transcript_turns  # noqa: E402
+from synthetic import LogProfile, SyntheticLogGenerator  # noqa: E402
+
+
+def _peak(func, turns: list[str]) -> int:
+    tracemalloc.start()
+    try:
+        func(turns)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run(logs_count: int, turns_count: int, repeat: int) -> list[dict]:
+    """Misst beide Varianten für Latin-1- und UCS-2-Transkripte."""
+    matcher = ScoringConfig().get_keyword_matcher()
+    logs = list(SyntheticLogGenerator(LogProfile(turns=turns_count), seed=17).logs(logs_count))
+    latin1_turns = [list(_transcript_turns(log)) for log in logs]
+    # Ein Zeichen außerhalb von Latin-1 erzwingt die breitere UCS-2-Darstellung
+    ucs2_turns = [[turn + " – Grüße" for turn in turns] for turns in latin1_turns]
+
+    def joined(turns: list[str]):
+        return matcher.match(" ".join(turns))
+
+    rows = []
+    for name, corpus in (("latin1", latin1_turns), ("ucs2", ucs2_turns)):
+        identical = all(joined(turns) == matcher.match_turns(turns) for turns in corpus)
+        sizes = [sys.getsizeof(" ".join(turns)) for turns in corpus]
+        joined_peak = max(_peak(joined, turns) for turns in corpus)
+        window_peak = max(_peak(matcher.match_turns, turns) for turns in corpus)
+        # Varianten abwechselnd messen, damit Rauschen beide gleich trifft
+        joined_s = window_s = float("inf")
+        for _ in range(repeat):
+            joined_s = min(joined_s, timeit.timeit(lambda: [joined(turns) for turns in corpus], number=1))
+            window_s = min(window_s, timeit.timeit(lambda: [matcher.match_turns(turns) for turns in corpus], number=1))
+        rows.append({
+            "text": name,
+            "transcript_kb": round(max(sizes) / 1024, 1),
+            "joined_us": round(joined_s / logs_count * 1e6, 1),
+            "windowed_us": round(window_s / logs_count * 1e6, 1),
+            "joined_peak_kb": round(joined_peak / 1024, 1),
+            "windowed_peak_kb": round(window_peak / 1024, 1),
+            "identical": identical,
+        })
+    return rows
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark für den fensterweisen Transkript-Scan")
+    parser.add_argument("--logs", type=int, default=50)
+    parser.add_argument("--turns", type=int, default=2000, help="Turns pro Log")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--json", action="store_true", help="Ergebnis als JSON ausgeben")
+    args = parser.parse_args()
+
+    logging.getLogger("agents.agent_log_scorer").setLevel(logging.ERROR)
+
+    rows = run(args.logs, args.turns, args.repeat)
+    if args.json:
+        print(json.dumps(rows, indent=2))
+    else:
+        print(f"{'text':>8} {'max_kb':>8} {'joined_us':>10} {'windowed_us':>12} "
+              f"{'joined_peak_kb':>15} {'windowed_peak_kb':>17} {'identical':>10}")
+        for row in rows:
+            print(f"{row['text']:>8} {row['transcript_kb']:>8} {row['joined_us']:>10} {row['windowed_us']:>12} "
+                  f"{row['joined_peak_kb']:>15} {row['windowed_peak_kb']:>17} {row['identical']!s:>10}")
+    return 0 if all(row["identical"] for row in rows) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
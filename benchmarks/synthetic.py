@@ -0,0 +1,105 @@
+"""
+Deterministischer Generator für synthetische Call-Logs
+
+Erzeugt Logs im Format von ``agents/sample_call_log.json``. Gesteuert werden
+Anzahl der Turns, Wörter pro Turn, Keyword-Dichte, Anzahl der Agenten und
+der Anteil fehlerhafter Dateien. Gleicher Seed ergibt identische Logs.
+
+Verwendung:
+    from synthetic import LogProfile, SyntheticLogGenerator
+    generator = SyntheticLogGenerator(LogProfile(turns=12, keyword_density=0.02), seed=1)
+    log = generator.log(0)
+    generator.write_corpus(Path("corpus"), count=1000)
+"""
+
+from __future__ import annotations
+
+import json
+import random
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator
+
+PRICE_KEYWORDS = ["euro", "preis", "kostet", "kosten", "gebühr", "tarif", "chf"]
+LEGAL_KEYWORDS = ["gesetz", "rechtlich", "erlaubt", "illegal", "vorschrift", "verordnung"]
+FILLER_WORDS = (
+    "guten tag ich hätte eine frage zu ihrem angebot wie kann ihnen helfen "
+    "das hängt individuell von ihren anforderungen ab kläre intern und melde "
+    "mich bei termin vereinbaren gerne nächste woche passt montag vormittag "
+    "unterlagen zusenden adresse bestätigen vielen dank auf wiederhören"
+).split()
+
+
+@dataclass(frozen=True)
+class LogProfile:
+    """Parameter für die Form der erzeugten Logs."""
+    turns: int = 8
+    words_per_turn: int = 14
+    keyword_density: float = 0.01
+    agents: int = 50
+    malformed_share: float = 0.0
+    stop_rate: float = 0.2
+    placeholder_rate: float = 0.1
+
+
+class SyntheticLogGenerator:
+    """Erzeugt Logs deterministisch aus Seed und Index."""
+
+    def __init__(self, profile: LogProfile | None = None, seed: int = 1):
+        self.profile = profile or LogProfile()
+        self.seed = seed
+
+    def _rng(self, index: int) -> random.Random:
+        return random.Random(self.seed * 1_000_003 + index)
+
+    def _turn(self, rng: random.Random) -> str:
+        words = []
+        for _ in range(self.profile.words_per_turn):
+            if rng.random() < self.profile.keyword_density:
+                words.append(rng.choice(PRICE_KEYWORDS if rng.random() < 0.5 else LEGAL_KEYWORDS))
+            else:
+                words.append(rng.choice(FILLER_WORDS))
+        return " ".join(words).capitalize() + "."
+
+    def log(self, index: int) -> dict:
+        """Gibt das Log mit dem angegebenen Index zurück."""
+        rng = self._rng(index)
+        profile = self.profile
+        return {
+            "agent_id": f"AGENT_{rng.randrange(profile.agents):04d}",
+            "contact_name": f"Kontakt {index}",
+            "timestamp": f"2025-12-{1 + index % 28:02d}T{index % 24:02d}:{index % 60:02d}:00.000000",
+            "transcript": [
+                {"speaker": "agent" if turn % 2 else "customer", "text": self._turn(rng)}
+                for turn in range(profile.turns)
+            ],
+            "stop_triggered": rng.random() < profile.stop_rate,
+            "result": "PLACEHOLDER - Rückruf" if rng.random() < profile.placeholder_rate else "LEAD_CAPTURE",
+        }
+
+    def is_malformed(self, index: int) -> bool:
+        """Ob die Datei mit diesem Index fehlerhaft geschrieben wird."""
+        return self._rng(~index).random() < self.profile.malformed_share
+
+    def logs(self, count: int) -> Iterator[dict]:
+        """Erzeugt ``count`` gültige Logs."""
+        for index in range(count):
+            yield self.log(index)
+
+    def document(self, index: int) -> str:
+        """Dateiinhalt für den Index (fehlerhaft: abgeschnittenes JSON oder fehlende agent_id)."""
+        text = json.dumps(self.log(index), ensure_ascii=False)
+        if not self.is_malformed(index):
+            return text
+        if index % 2:
+            return text[: len(text) // 2]
+        return json.dumps({"transcript": []})
+
+    def write_corpus(self, dir_path: Path, count: int) -> int:
+        """Schreibt ``count`` Dateien nach ``dir_path`` und gibt die Anzahl fehlerhafter zurück."""
+        dir_path.mkdir(parents=True, exist_ok=True)
+        malformed = 0
+        for index in range(count):
+            malformed += self.is_malformed(index)
+            (dir_path / f"log_{index:07d}.json").write_text(self.document(index), encoding="utf-8")
+        return malformed
@@ -4,17 +4,34 @@ Unit Tests für den Agent Log Scorer
 Testet die Kernfunktionalität:
 - Input-Validierung
 - Keyword-Erkennung
+- Kompilierter Keyword-Matcher (fensterweise über die Turns)
 - Risk-Scoring
+- Batch-Bewertung mit score_logs (NumPy und reines Python)
 - Risk-Level-Zuordnung
-- Batch-Verarbeitung
+- Kompilierte Flow-Validator-Regeln
+- Threadsichere Agent-Statistiken
+- Batch-Verarbeitung (sequentiell und parallel)
+- Ergebnis-Cache
+- Neuladen der Konfiguration
+- Spaltenbasierter Ergebnisspeicher
 - Report-Generierung
 - Dashboard-Generierung
+- Zusammenführbare Teilaggregate
+- Sharding
 - Alert-System
 """
 
+import asyncio
+import hashlib
+import http.client
 import json
+import logging
 import os
+import shutil
+import subprocess
 import tempfile
+import threading
+import time
 from pathlib import Path
 
 import pytest
@@ -29,8 +46,35 @@ from agents.agent_log_scorer import (
     RiskLevel,
     AgentStatistics,
     ReportGenerator,
+    ReportWriter,
+    JsonReportWriter,
+    CsvReportWriter,
+    HtmlReportWriter,
+    PaginatedHtmlReportWriter,
     DashboardGenerator,
     AlertSystem,
+    AlertSink,
+    FileAlertSink,
+    StreamAlertSink,
+    WebhookAlertSink,
+    KeywordMatcher,
+    CompiledRules,
+    RulePredicate,
+    RULE_TYPES,
+    register_rule_type,
+    ResultCache,
+    LogWatcher,
+    ScoringService,
+    ConfigReloader,
+    StageHistogram,
+    MetricsRegistry,
+    ScorerMetrics,
+    ScoreResultBatch,
+    StatisticsAggregate,
+    ShardSpec,
+    ScoreManifest,
+    TopIssueIndex,
+    main,
     # Legacy functions
     score_agent_log,
     validate_log_structure,
@@ -136,6 +180,106 @@ class TestAgentStatistics:
         stats.stops_triggered = 8
         assert stats.stop_rate == 0.8
 
+    def test_merge(self):
+        """Teilstatistiken werden inklusive Risk-Histogramm addiert."""
+        a = AgentStatistics(agent_id="TEST", total_interactions=2, total_risk_score=3, price_claims=1)
+        a.risk_levels["HIGH"] = 2
+        b = AgentStatistics(agent_id="TEST", total_interactions=1, total_risk_score=1, stops_triggered=1)
+        b.risk_levels["MEDIUM"] = 1
+        a.merge(b)
+        assert a.total_interactions == 3
+        assert a.total_risk_score == 4
+        assert a.price_claims == 1
+        assert a.stops_triggered == 1
+        assert a.risk_levels == {"LOW": 0, "MEDIUM": 1, "HIGH": 2, "CRITICAL": 0}
+
+
+class TestShardedAgentStatistics:
+    """Tests für die threadsicheren Agent-Statistiken."""
+
+    @staticmethod
+    def _logs(count):
+        transcripts = [[], ["Das kostet 5€"], ["Laut Gesetz ist das erlaubt"], ["Preis 10 Euro", "Vertrag"]]
+        return [
+            {"agent_id": f"A{i % 7}", "transcript": transcripts[i % 4], "stop_triggered": i % 5 == 0,
+             "result": "PLACEHOLDER" if i % 3 == 0 else "ok"}
+            for i in range(count)
+        ]
+
+    def test_concurrent_scoring_counts_exactly(self):
+        """Viele Threads auf einem Scorer: alle Zähler stimmen exakt mit dem sequentiellen Lauf überein."""
+        logs = self._logs(4000)
+        sequential = AgentLogScorer()
+        for log in logs:
+            sequential.score_log(log)
+
+        threads_count = 16
+        scorer = AgentLogScorer(config=sequential.config)
+        barrier = threading.Barrier(threads_count + 1)
+        stop = threading.Event()
+        snapshots = []
+
+        def work(part):
+            barrier.wait()
+            for log in part:
+                scorer.score_log(log)
+
+        def read():
+            barrier.wait()
+            while not stop.is_set():
+                snapshots.append(sum(s.total_interactions for s in scorer.get_agent_statistics().values()))
+
+        workers = [threading.Thread(target=work, args=(logs[i::threads_count],)) for i in range(threads_count)]
+        reader = threading.Thread(target=read)
+        # Häufige Threadwechsel provozieren verlorene Updates
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            for thread in [*workers, reader]:
+                thread.start()
+            for thread in workers:
+                thread.join()
+        finally:
+            stop.set()
+            reader.join()
+            sys.setswitchinterval(switch_interval)
+
+        assert {a: s.to_state() for a, s in scorer.get_agent_statistics().items()} == {
+            a: s.to_state() for a, s in sequential.get_agent_statistics().items()
+        }
+        # Zwischenstände wachsen monoton und überschreiten nie die Gesamtzahl
+        assert snapshots == sorted(snapshots)
+        assert all(total <= len(logs) for total in snapshots)
+        # Shards beendeter Threads sind zusammengeführt und freigegeben
+        assert len(scorer._agent_stats._shards) <= 2
+
+    def test_finished_threads_retired_without_snapshot(self):
+        """Ein Thread pro Anfrage: Shards beendeter Threads werden beim nächsten Registrieren übernommen."""
+        scorer = AgentLogScorer()
+        log = self._logs(1)[0]
+        for _ in range(50):
+            thread = threading.Thread(target=scorer.score_log, args=(log,))
+            thread.start()
+            thread.join()
+            assert len(scorer._agent_stats._shards) <= 1
+        assert scorer.get_agent_statistics()["A0"].total_interactions == 50
+
+    def test_snapshot_is_copy_and_reset(self):
+        """Die Momentaufnahme ändert sich nicht nachträglich; reset_statistics leert alle Shards."""
+        scorer = AgentLogScorer()
+        scorer.score_log(self._logs(1)[0])
+        thread = threading.Thread(target=scorer.score_log, args=(self._logs(1)[0],))
+        thread.start()
+        thread.join()
+
+        snapshot = scorer.get_agent_statistics()
+        scorer.score_log(self._logs(1)[0])
+        assert snapshot["A0"].total_interactions == 2
+        assert scorer.get_agent_statistics()["A0"].total_interactions == 3
+
+        scorer.reset_statistics()
+        assert scorer.get_agent_statistics() == {}
+
 
 class TestAgentLogScorer:
     """Tests für die Hauptklasse AgentLogScorer."""
@@ -179,6 +323,66 @@ class TestAgentLogScorer:
         assert result.stop_triggered is True
         assert result.risk == 0
 
+    def test_fast_mode_matches_full_verdict(self, tmp_path):
+        """Schneller Modus: gleiche Risikobewertung und Statistiken, ohne Keyword-Listen und Verstöße."""
+        test_dir = Path(__file__).parent / "test_input_logs"
+        logs = [json.loads(p.read_text(encoding="utf-8")) for p in sorted(test_dir.glob("*.json"))]
+        logs += [
+            {"agent_id": "A1", "transcript": ["Der Preis ist 5€", "laut Gesetz"] * 50, "result": "PLACEHOLDER"},
+            {"agent_id": "A2", "transcript": [{"text": "Das kostet"}, {"text": "nichts"}], "stop_triggered": True},
+        ]
+        full = AgentLogScorer()
+        fast = AgentLogScorer(config=full.config, fast=True)
+        for log in logs:
+            expected = full.score_log(log)
+            result = fast.score_log(log)
+            assert (result.risk, result.risk_level, result.price_claim, result.legal_claim) == (
+                expected.risk, expected.risk_level, expected.price_claim, expected.legal_claim
+            )
+            assert result.price_keywords_found == result.legal_keywords_found == result.violations == []
+        assert {a: s.to_state() for a, s in fast.get_agent_statistics().items()} == {
+            a: s.to_state() for a, s in full.get_agent_statistics().items()
+        }
+
+    def test_fast_mode_per_call_and_cache(self, tmp_path):
+        """fast= überschreibt den Standard pro Aufruf; nur vollständige Ergebnisse werden gecacht."""
+        log = {"agent_id": "A1", "transcript": ["Der Preis ist 5€"]}
+        scorer = AgentLogScorer(cache=ResultCache(tmp_path / "cache.db"))
+        assert scorer.score_log(log, fast=True).price_keywords_found == []
+        assert scorer.cache.misses == 1
+        full = scorer.score_log(log)
+        assert full.price_keywords_found
+        assert scorer.cache.misses == 2
+        # Ein vorhandenes vollständiges Ergebnis bedient auch den schnellen Modus
+        assert scorer.score_log(log, fast=True) == full
+
+    @pytest.mark.parametrize("rules", [None, {"forbidden": [{"type": "forbidden_phrases", "phrases": ["typisch"]}]}])
+    def test_peak_allocation_per_log(self, rules):
+        """Ein langes Transcript wird weder verbunden noch als Ganzes kleingeschrieben."""
+        import tracemalloc
+        turn = "Guten Tag, ich erkläre Ihnen gern die Details zu unserem Angebot. " * 12
+        log = {"agent_id": "A1", "transcript": [{"text": turn}] * 600 + ["Das kostet 5€ laut Gesetz"]}
+        transcript_bytes = sys.getsizeof(AgentLogScorer()._extract_transcript(log))
+        scorer = AgentLogScorer(config=ScoringConfig(yaml_rules=rules) if rules else None)
+        expected = scorer.score_log(log)
+
+        tracemalloc.start()
+        try:
+            before = tracemalloc.get_traced_memory()[0]
+            result = scorer.score_log(log)
+            peak = tracemalloc.get_traced_memory()[1] - before
+        finally:
+            tracemalloc.stop()
+
+        assert result == expected and result.price_claim and result.legal_claim
+        if rules is None:
+            # Ohne Regel, die das Transcript liest, nur Fenster von CHUNK_SIZE Zeichen
+            # (lower() braucht für Nicht-ASCII-Text kurzzeitig 12 Byte pro Zeichen)
+            assert peak < transcript_bytes / 4
+        else:
+            # Das verbundene Transcript selbst, aber keine kleingeschriebene Kopie
+            assert peak < transcript_bytes * 1.25
+
     def test_score_directory(self, scorer):
         """Verzeichnis-Batch-Verarbeitung funktioniert."""
         test_dir = Path(__file__).parent / "test_input_logs"
@@ -186,6 +390,165 @@ class TestAgentLogScorer:
             results = scorer.score_directory(test_dir)
             assert len(results) > 0
 
+    def test_score_directory_parallel_matches_sequential(self):
+        """Prozess-Pool liefert dieselben Ergebnisse, Reihenfolge und Statistiken."""
+        test_dir = Path(__file__).parent / "test_input_logs"
+        sequential = AgentLogScorer()
+        parallel = AgentLogScorer()
+        expected = sequential.score_directory(test_dir)
+        results = parallel.score_directory(test_dir, workers=2, chunk_size=1)
+        assert [r.to_dict() for r in results] == [r.to_dict() for r in expected]
+        assert {k: v.to_dict() for k, v in parallel.get_agent_statistics().items()} == {
+            k: v.to_dict() for k, v in sequential.get_agent_statistics().items()
+        }
+
+    def test_iter_score_jsonl_skips_malformed_lines(self, scorer, tmp_path):
+        """JSONL wird zeilenweise bewertet, fehlerhafte Zeilen werden gemeldet."""
+        jsonl_path = tmp_path / "calls.jsonl"
+        jsonl_path.write_text(
+            json.dumps({"agent_id": "A1", "transcript": ["Das kostet 5€"]}) + "\n"
+            + "{kaputt\n"
+            + "\n"
+            + json.dumps({"contact_name": "ohne agent_id"}) + "\n"
+            + json.dumps({"agent_id": "A2", "transcript": ["Guten Tag"]}) + "\n",
+            encoding="utf-8"
+        )
+        errors = []
+        results = scorer.iter_score_jsonl(jsonl_path, on_error=lambda line, msg: errors.append(line))
+        assert not isinstance(results, list)
+        assert [r.agent_id for r in results] == ["A1", "A2"]
+        assert errors == [2, 4]
+
+    def test_score_directory_incremental_manifest(self, tmp_path, monkeypatch):
+        """Unveränderte Dateien werden aus dem Manifest übernommen, Änderungen neu bewertet."""
+        logs_dir = tmp_path / "logs"
+        logs_dir.mkdir()
+        source_dir = Path(__file__).parent / "test_input_logs"
+        for source in source_dir.glob("*.json"):
+            (logs_dir / source.name).write_text(source.read_text(encoding="utf-8"), encoding="utf-8")
+        (logs_dir / "broken.json").write_text("{kaputt", encoding="utf-8")
+        manifest = tmp_path / "manifest.json"
+
+        first = AgentLogScorer()
+        expected = first.score_directory(logs_dir, manifest_path=manifest)
+        assert manifest.exists()
+
+        second = AgentLogScorer()
+        scored_files = []
+        original_score_file = second.score_file
+        monkeypatch.setattr(second, "score_file", lambda path: scored_files.append(path) or original_score_file(path))
+        results = second.score_directory(logs_dir, manifest_path=manifest)
+        assert scored_files == []
+        assert [r.to_dict() for r in results] == [r.to_dict() for r in expected]
+        assert {k: v.to_dict() for k, v in second.get_agent_statistics().items()} == {
+            k: v.to_dict() for k, v in first.get_agent_statistics().items()
+        }
+
+        changed = logs_dir / "call_log_safe_conversation.json"
+        changed.write_text(json.dumps({"agent_id": "NEW", "transcript": ["Das kostet 5€"]}), encoding="utf-8")
+        second.score_directory(logs_dir, manifest_path=manifest)
+        assert scored_files == [changed]
+
+    def test_manifest_touched_file_hashed_once(self, tmp_path, monkeypatch):
+        """Nach touch wird einmal gehasht, danach genügen wieder Größe und mtime."""
+        logs_dir = tmp_path / "logs"
+        logs_dir.mkdir()
+        log_file = logs_dir / "a.json"
+        log_file.write_text(json.dumps({"agent_id": "A"}), encoding="utf-8")
+        manifest = tmp_path / "manifest.json"
+        AgentLogScorer().score_directory(logs_dir, manifest_path=manifest)
+
+        stat = log_file.stat()
+        os.utime(log_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        digests = []
+        original_digest = ScoreManifest._digest
+        monkeypatch.setattr(
+            ScoreManifest, "_digest", staticmethod(lambda path: digests.append(path) or original_digest(path))
+        )
+
+        scorer = AgentLogScorer()
+        assert [r.agent_id for r in scorer.score_directory(logs_dir, manifest_path=manifest)] == ["A"]
+        assert digests == [log_file]
+        assert [r.agent_id for r in scorer.score_directory(logs_dir, manifest_path=manifest)] == ["A"]
+        assert digests == [log_file]
+
+    def test_manifest_file_deleted_after_listing(self, tmp_path, monkeypatch):
+        """Eine zwischen Auflistung und Manifest-Abgleich gelöschte Datei bricht den Lauf nicht ab."""
+        logs_dir = tmp_path / "logs"
+        logs_dir.mkdir()
+        for name in ("a", "b"):
+            (logs_dir / f"{name}.json").write_text(json.dumps({"agent_id": name.upper()}), encoding="utf-8")
+        manifest = tmp_path / "manifest.json"
+        AgentLogScorer().score_directory(logs_dir, manifest_path=manifest)
+
+        scorer = AgentLogScorer()
+        listed = scorer._list_files(logs_dir, "*.json")
+        (logs_dir / "a.json").unlink()
+        monkeypatch.setattr(scorer, "_list_files", lambda *args, **kwargs: listed)
+        results = scorer.score_directory(logs_dir, manifest_path=manifest)
+        assert [r.agent_id for r in results] == ["B"]
+
+    def test_iter_score_directory_skips_vanished_file(self, tmp_path, monkeypatch):
+        """Eine während des Scans gelöschte Datei wird übersprungen, der Rest bewertet."""
+        for name in ("a", "b"):
+            (tmp_path / f"{name}.json").write_text(json.dumps({"agent_id": name.upper()}), encoding="utf-8")
+        scorer = AgentLogScorer()
+        listed = scorer._list_files(tmp_path, "*.json")
+        (tmp_path / "a.json").unlink()
+        monkeypatch.setattr(scorer, "_list_files", lambda *args, **kwargs: listed)
+        assert [r.agent_id for r in scorer.iter_score_directory(tmp_path)] == ["B"]
+        assert [r.agent_id for r in scorer.score_directory(tmp_path)] == ["B"]
+
+    def test_manifest_invalidated_by_config_change(self, tmp_path):
+        """Eine geänderte Konfiguration verwirft das Manifest."""
+        logs_dir = Path(__file__).parent / "test_input_logs"
+        manifest = tmp_path / "manifest.json"
+        AgentLogScorer().score_directory(logs_dir, manifest_path=manifest)
+
+        scorer = AgentLogScorer()
+        scorer.config.legal_keywords = scorer.config.legal_keywords + ["garantie"]
+        scored_files = []
+        original_score_file = scorer.score_file
+        scorer.score_file = lambda path: scored_files.append(path) or original_score_file(path)
+        scorer.score_directory(logs_dir, manifest_path=manifest)
+        assert len(scored_files) == len(list(logs_dir.glob("*.json")))
+
+    def test_score_directory_async_ordered(self, tmp_path):
+        """Async-Pipeline liefert in Fundreihenfolge dieselben Ergebnisse wie sequentiell."""
+        for i in range(25):
+            (tmp_path / f"log_{i:02d}.json").write_text(
+                json.dumps({"agent_id": f"A{i % 4}", "transcript": ["Das kostet 5€"] if i % 3 else []}),
+                encoding="utf-8"
+            )
+        (tmp_path / "broken.json").write_text("{kaputt", encoding="utf-8")
+
+        sequential = AgentLogScorer()
+        by_path = {path: sequential.score_file(path) for path in tmp_path.glob("log_*.json")}
+        expected = [by_path[p].to_dict() for p in tmp_path.glob("*.json") if p in by_path]
+
+        scorer = AgentLogScorer()
+        results = asyncio.run(scorer.score_directory_async(tmp_path, max_in_flight=3))
+        assert [r.to_dict() for r in results] == expected
+        assert sum(s.total_interactions for s in scorer.get_agent_statistics().values()) == 25
+
+    def test_iter_score_directory_async_identity_and_early_stop(self):
+        """Die Pipeline liefert Datei und Ergebnis und lässt sich vorzeitig beenden."""
+        test_dir = Path(__file__).parent / "test_input_logs"
+        scorer = AgentLogScorer()
+
+        async def collect(limit=None):
+            pairs = []
+            async for path, result in scorer.iter_score_directory_async(test_dir, max_in_flight=2):
+                pairs.append((path, result))
+                if limit and len(pairs) == limit:
+                    break
+            return pairs
+
+        pairs = asyncio.run(collect())
+        assert {p for p, _ in pairs} == set(test_dir.glob("*.json"))
+        assert all(AgentLogScorer().score_file(p).to_dict() == r.to_dict() for p, r in pairs)
+        assert len(asyncio.run(collect(limit=1))) == 1
+
     def test_get_summary(self, scorer):
         """Summary wird korrekt erstellt."""
         results = [
@@ -209,6 +572,821 @@ class TestAgentLogScorer:
         assert summary["average_risk"] == 1.0
 
 
+class TestScoreLogs:
+    """Tests für die Batch-Bewertung score_logs (mit NumPy und in reinem Python)."""
+
+    @pytest.fixture(params=["numpy", "python"])
+    def backend(self, request, monkeypatch):
+        if request.param == "numpy":
+            pytest.importorskip("numpy")
+        else:
+            monkeypatch.setattr("agents.agent_log_scorer._numpy", lambda: None)
+        return request.param
+
+    @staticmethod
+    def _logs(count: int, seed: int = 5) -> list[dict]:
+        import random
+        rng = random.Random(seed)
+        words = ["Guten", "Tag", "Preis", "kostet", "5€", "Gesetz", "erlaubt", "Termin", "danke"]
+        return [
+            {
+                "agent_id": rng.choice(["A1", "A2", "A3", None, 7]),
+                "contact_name": rng.choice([None, "Max"]),
+                "transcript": [{"text": " ".join(rng.choices(words, k=rng.randint(0, 6)))}
+                               for _ in range(rng.randint(0, 4))],
+                "stop_triggered": rng.random() < 0.3,
+                "result": rng.choice(["", "PLACEHOLDER", "STOP_REQUIRED", "END_CALL"]),
+            }
+            for _ in range(count)
+        ]
+
+    @staticmethod
+    def _states(scorer: AgentLogScorer) -> dict:
+        return {agent_id: stats.to_state() for agent_id, stats in scorer.get_agent_statistics().items()}
+
+    @pytest.mark.parametrize("fast", [False, True])
+    @pytest.mark.parametrize("config", [
+        ScoringConfig(),
+        ScoringConfig(placeholder_bonus=2),
+        # Nicht aufsteigende Schwellen: die erste passende gewinnt wie in _get_risk_level
+        ScoringConfig(placeholder_bonus=0, risk_thresholds={"low": 1, "medium": 0, "high": 3}),
+    ])
+    def test_matches_scalar_path(self, backend, config, fast):
+        """Ergebnisse und Agent-Statistiken sind identisch mit score_log pro Log."""
+        logs = self._logs(400)
+        scalar, batched = AgentLogScorer(config=config), AgentLogScorer(config=config)
+        expected = [scalar.score_log(log, fast=fast) for log in logs]
+        results = batched.score_logs(logs, fast=fast)
+
+        assert results == expected
+        assert [type(r.risk) for r in results] == [int] * len(logs)
+        assert self._states(batched) == self._states(scalar)
+        assert list(batched.get_agent_statistics()) == list(scalar.get_agent_statistics())
+
+    @pytest.mark.parametrize("bonus", [-1.5, 0.5])
+    def test_float_placeholder_bonus(self, backend, bonus):
+        """Nicht ganzzahlige Risikoscores werden in den Statistiken nicht abgeschnitten."""
+        config = ScoringConfig(placeholder_bonus=bonus)
+        logs = self._logs(400)
+        scalar, batched = AgentLogScorer(config=config), AgentLogScorer(config=config)
+        expected = [scalar.score_log(log) for log in logs]
+        results = batched.score_logs(logs)
+
+        assert results == expected
+        assert any(isinstance(r.risk, float) and not r.risk.is_integer() for r in results)
+        assert self._states(batched) == self._states(scalar)
+        assert batched.get_summary(results) == scalar.get_summary(expected)
+
+    def test_invalid_log_scores_nothing(self, backend):
+        """Ein ungültiges Log bricht den ganzen Batch vor der Bewertung ab."""
+        scorer = AgentLogScorer(metrics=ScorerMetrics())
+        with pytest.raises(ValueError, match="agent_id"):
+            scorer.score_logs([{"agent_id": "A1"}, {"transcript": []}])
+        assert scorer.get_agent_statistics() == {}
+        assert scorer.metrics.failures.labels("validation").get() == 1
+        assert scorer.score_logs([]) == []
+
+    def test_cache_and_metrics(self, backend, tmp_path):
+        """Cache-Treffer werden übernommen, jedes Log zählt in den Metriken."""
+        logs = self._logs(20)
+        scorer = AgentLogScorer(cache=ResultCache(tmp_path / "cache.db"), metrics=ScorerMetrics())
+        first = scorer.score_logs(logs[:10])
+        results = scorer.score_logs(logs)
+
+        assert results[:10] == first
+        assert results == [AgentLogScorer().score_log(log) for log in logs]
+        assert scorer.cache.hits >= 10
+        assert scorer.metrics.logs_scored.get() == 30
+        assert sum(s.total_interactions for s in scorer.get_agent_statistics().values()) == 30
+
+
+class TestResultCache:
+    """Tests für den persistenten Ergebnis-Cache."""
+
+    LOG = {"agent_id": "A1", "transcript": ["Das kostet 100€ laut Gesetz"]}
+
+    def test_hit_skips_extraction_and_updates_statistics(self, tmp_path, monkeypatch):
+        """Ein Treffer überspringt die Extraktion, zählt aber in den Statistiken."""
+        cache = ResultCache(tmp_path / "cache.db")
+        scorer = AgentLogScorer(cache=cache)
+        first = scorer.score_log(dict(self.LOG))
+
+        def fail(*args):
+            raise AssertionError("Extraktion bei Cache-Hit")
+
+        monkeypatch.setattr(scorer, "_extract_turns", fail)
+        second = scorer.score_log({"transcript": self.LOG["transcript"], "agent_id": "A1"})
+        assert second.to_dict() == first.to_dict()
+        assert cache.get_stats()["hits"] == 1
+        assert cache.get_stats()["misses"] == 1
+        assert scorer.get_agent_statistics()["A1"].total_interactions == 2
+        cache.close()
+
+    def test_persistent_and_config_sensitive(self, tmp_path):
+        """Einträge überleben einen Neustart; andere Konfiguration = anderer Schlüssel."""
+        path = tmp_path / "cache.db"
+        cache = ResultCache(path)
+        AgentLogScorer(cache=cache).score_log(self.LOG)
+        cache.close()
+
+        cache = ResultCache(path)
+        AgentLogScorer(cache=cache).score_log(self.LOG)
+        assert cache.hits == 1
+
+        scorer = AgentLogScorer(cache=cache)
+        scorer.config.risk_thresholds = {"low": 5, "medium": 6, "high": 7}
+        assert scorer.score_log(self.LOG).risk_level == RiskLevel.LOW
+        assert cache.misses == 1
+        cache.close()
+
+    def test_lru_eviction(self, tmp_path):
+        """Bei voller Größe wird der am längsten ungenutzte Eintrag verdrängt."""
+        cache = ResultCache(tmp_path / "cache.db", max_entries=2)
+        scorer = AgentLogScorer(cache=cache)
+        logs = [{"agent_id": f"A{i}"} for i in range(3)]
+        scorer.score_log(logs[0])
+        scorer.score_log(logs[1])
+        scorer.score_log(logs[0])  # A0 wird zuletzt genutzt
+        scorer.score_log(logs[2])  # verdrängt A1
+        assert len(cache) == 2
+        fingerprint = scorer.config.fingerprint()
+        assert cache.get(ResultCache.make_key(logs[0], fingerprint)) is not None
+        assert cache.get(ResultCache.make_key(logs[1], fingerprint)) is None
+        cache.close()
+
+
+class TestStageProfiler:
+    """Tests für die Laufzeitmessung pro Verarbeitungsstufe"""
+
+    def test_histogram_percentiles(self):
+        """Perzentile liegen innerhalb der Bucket-Auflösung."""
+        histogram = StageHistogram()
+        for ns in range(1, 10_001):
+            histogram.add(ns * 100)
+        assert histogram.count == 10_000
+        assert histogram.max_ns == 1_000_000
+        for p in (0.5, 0.9, 0.99):
+            assert histogram.percentile(p) == pytest.approx(p * 1_000_000, rel=0.07)
+        assert histogram.percentile(1.0) <= histogram.max_ns
+
+    def test_scorer_records_stages(self, tmp_path):
+        """Alle Stufen werden pro Log erfasst und an den Callback gemeldet."""
+        for i in range(3):
+            (tmp_path / f"log_{i}.json").write_text(
+                json.dumps({"agent_id": "P1", "transcript": ["Das kostet 5€"]}), encoding="utf-8"
+            )
+        calls = []
+        scorer = AgentLogScorer()
+        profiler = scorer.enable_profiling(callback=lambda stage, ns: calls.append((stage, ns)))
+        scorer.score_directory(tmp_path)
+
+        profile = scorer.get_profile()
+        assert list(profile) == ["load", "validate", "extract", "keywords", "risk", "violations", "statistics"]
+        assert all(row["count"] == 3 for row in profile.values())
+        assert sum(row["share"] for row in profile.values()) == pytest.approx(1.0, abs=0.01)
+        assert len(calls) == 21 and all(ns >= 0 for _, ns in calls)
+        assert "keywords" in profiler.format_report()
+
+        scorer.disable_profiling()
+        scorer.score_log({"agent_id": "P1"})
+        assert scorer.get_profile() == {}
+
+    def test_cache_lookup_and_store_are_separate_stages(self, tmp_path):
+        """Ein Cache-Miss zählt einmal als Lookup ("cache") und einmal als Eintrag ("cache_put")."""
+        scorer = AgentLogScorer(cache=ResultCache(tmp_path / "cache.db"))
+        scorer.enable_profiling()
+        log = {"agent_id": "P1", "transcript": ["Das kostet 5€"]}
+        scorer.score_log(log)
+        scorer.score_log(log)
+
+        profile = scorer.get_profile()
+        assert profile["cache"]["count"] == 2
+        assert profile["cache_put"]["count"] == 1
+        assert list(profile).index("cache_put") > list(profile).index("violations")
+        scorer.cache.close()
+
+    def test_parallel_profiles_are_merged(self):
+        """Profile der Worker-Prozesse werden zusammengeführt."""
+        test_dir = Path(__file__).parent / "test_input_logs"
+        scorer = AgentLogScorer()
+        scorer.enable_profiling()
+        results = scorer.score_directory(test_dir, workers=2, chunk_size=1)
+        assert scorer.get_profile()["validate"]["count"] == len(results)
+
+
+class TestScorerMetrics:
+    """Tests für die Betriebsmetriken"""
+
+    def test_registry_render(self):
+        """Export im Prometheus-Textformat inkl. Labels und kumulativer Buckets."""
+        registry = MetricsRegistry()
+        counter = registry.counter("demo_total", "Demo", ("kind",))
+        counter.labels('a"b').inc(2)
+        histogram = registry.histogram("demo_seconds", "Dauer", (0.1, 1.0))
+        for value in (0.05, 0.1, 0.5, 3):
+            histogram.observe(value)
+
+        text = registry.render()
+        assert '# TYPE demo_total counter\ndemo_total{kind="a\\"b"} 2\n' in text
+        assert 'demo_seconds_bucket{le="0.1"} 2\n' in text
+        assert 'demo_seconds_bucket{le="1.0"} 3\n' in text
+        assert 'demo_seconds_bucket{le="+Inf"} 4\n' in text
+        assert "demo_seconds_count 4\n" in text
+        with pytest.raises(ValueError):
+            registry.counter("demo_total", "Doppelt")
+
+    def test_scorer_and_alert_counters(self, tmp_path):
+        """Bewertete Logs, Parse-/Validierungsfehler, Alerts und Latenz werden gezählt."""
+        (tmp_path / "ok.json").write_text(
+            json.dumps({"agent_id": "M1", "transcript": ["Das ist gesetzlich erlaubt und kostet 5€"]}),
+            encoding="utf-8"
+        )
+        (tmp_path / "broken.json").write_text("{kaputt", encoding="utf-8")
+        (tmp_path / "invalid.json").write_text(json.dumps({"transcript": []}), encoding="utf-8")
+
+        metrics = ScorerMetrics()
+        scorer = AgentLogScorer(metrics=metrics)
+        alert_system = AlertSystem(metrics=metrics)
+        for result in scorer.score_directory(tmp_path):
+            alert_system.check(result)
+
+        assert metrics.logs_scored.get() == 1
+        assert metrics.failures.labels("parse").value == 1
+        assert metrics.failures.labels("validation").value == 1
+        assert metrics.alerts.labels("HIGH").value == 1
+        assert metrics.latency.count == 1
+        assert metrics.in_flight.value == 0
+
+    def test_parallel_metrics_are_merged(self):
+        """Zähler der Worker-Prozesse landen im Register des Elternprozesses."""
+        test_dir = Path(__file__).parent / "test_input_logs"
+        metrics = ScorerMetrics()
+        results = AgentLogScorer(metrics=metrics).score_directory(test_dir, workers=2, chunk_size=1)
+        assert metrics.logs_scored.get() == len(results)
+        assert metrics.latency.count == len(results)
+        assert metrics.in_flight.value == 0
+
+    def test_concurrent_updates_and_pickle(self, monkeypatch):
+        """Parallele Updates gehen nicht verloren; Metriken und Profiler bleiben pickelbar."""
+        import pickle
+        monkeypatch.setattr(logging.getLogger("agents.agent_log_scorer"), "disabled", True)
+        metrics = ScorerMetrics()
+        scorer = AgentLogScorer(metrics=metrics)
+        profiler = scorer.enable_profiling()
+        logs = [{"agent_id": f"T{i % 3}", "transcript": ["Das kostet 5€"]} for i in range(2000)]
+
+        def work(part):
+            for log in part:
+                scorer.score_log(log)
+                metrics.failures.labels(log["agent_id"]).inc()
+
+        threads = [threading.Thread(target=work, args=(logs[i::8],)) for i in range(8)]
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            sys.setswitchinterval(switch_interval)
+
+        assert metrics.latency.count == sum(metrics.latency.counts) == 2000
+        assert sum(metrics.failures.labels(f"T{i}").value for i in range(3)) == 2000
+        assert scorer.get_profile()["keywords"]["count"] == 2000
+
+        copy = pickle.loads(pickle.dumps(metrics))
+        copy.latency.observe(0.001)
+        assert copy.latency.count == 2001
+        assert pickle.loads(pickle.dumps(profiler)).get_report() == profiler.get_report()
+
+    def test_service_metrics_endpoint(self):
+        """GET /metrics liefert das Textformat des Scorers."""
+        scorer = AgentLogScorer(metrics=ScorerMetrics())
+        with ScoringService(scorer, port=0) as service:
+            conn = http.client.HTTPConnection(*service.address, timeout=5)
+            conn.request("POST", "/score", body=json.dumps({"agent_id": "M2"}))
+            conn.getresponse().read()
+            conn.request("GET", "/metrics")
+            response = conn.getresponse()
+            text = response.read().decode("utf-8")
+            conn.close()
+        assert response.status == 200
+        assert response.getheader("Content-Type").startswith("text/plain; version=0.0.4")
+        assert "agent_log_scorer_logs_scored_total 1\n" in text
+
+
+class TestLogWatcher:
+    """Tests für den Watch-Modus"""
+
+    @staticmethod
+    def _log(agent_id, text="Hallo"):
+        return json.dumps({"agent_id": agent_id, "transcript": [text]})
+
+    def test_scores_only_new_content(self, tmp_path):
+        """Neue JSON-Dateien und angehängte JSONL-Zeilen werden genau einmal bewertet."""
+        watcher = LogWatcher(AgentLogScorer(), tmp_path, use_inotify=False)
+        (tmp_path / "a.json").write_text(self._log("A1"), encoding="utf-8")
+        stream = tmp_path / "calls.jsonl"
+        stream.write_text(self._log("J1") + "\n" + self._log("J2")[:10], encoding="utf-8")
+
+        assert sorted(r.agent_id for _, r in watcher.scan()) == ["A1", "J1"]
+        assert watcher.scan() == []
+
+        # Unvollständige Zeile fertigschreiben und eine weitere anhängen
+        with open(stream, "a", encoding="utf-8") as f:
+            f.write(self._log("J2")[10:] + "\n" + self._log("J3", "Das kostet 5€") + "\n")
+        results = watcher.scan()
+        assert [r.agent_id for _, r in results] == ["J2", "J3"]
+        assert all(path == stream for path, _ in results)
+        assert results[1][1].price_claim
+
+    def test_truncated_jsonl_is_reread(self, tmp_path):
+        """Eine gekürzte JSONL-Datei wird von vorn gelesen."""
+        stream = tmp_path / "calls.jsonl"
+        stream.write_text(self._log("J1") + "\n" + self._log("J2") + "\n", encoding="utf-8")
+        watcher = LogWatcher(AgentLogScorer(), tmp_path, use_inotify=False)
+        assert len(watcher.scan()) == 2
+
+        stream.write_text(self._log("J9") + "\n", encoding="utf-8")
+        assert [r.agent_id for _, r in watcher.scan()] == ["J9"]
+
+    def test_file_vanishing_before_read_is_skipped(self, tmp_path, monkeypatch):
+        """Verschwindet eine Datei zwischen stat und open, läuft der Watcher weiter."""
+        (tmp_path / "a.json").write_text(self._log("A1"), encoding="utf-8")
+        (tmp_path / "calls.jsonl").write_text(self._log("J1") + "\n", encoding="utf-8")
+        watcher = LogWatcher(AgentLogScorer(), tmp_path, use_inotify=False)
+
+        def vanished(path, *args, **kwargs):
+            raise FileNotFoundError(2, "No such file or directory", str(path))
+
+        monkeypatch.setattr("agents.agent_log_scorer.open", vanished, raising=False)
+        assert watcher.scan() == []
+        monkeypatch.undo()
+        assert sorted(r.agent_id for _, r in watcher.scan()) == ["A1", "J1"]
+
+    def test_partial_json_is_debounced(self, tmp_path, monkeypatch, caplog):
+        """Halb geschriebenes JSON wird erst nach der Ruhezeit erneut gelesen, ohne Fehlermeldung."""
+        watcher = LogWatcher(AgentLogScorer(), tmp_path, use_inotify=False, settle=0.2)
+        parsed = []
+        original = watcher.scorer._score_file_data
+        monkeypatch.setattr(watcher.scorer, "_score_file_data", lambda *args: parsed.append(1) or original(*args))
+        log_file = tmp_path / "a.json"
+        content = self._log("A1")
+
+        with caplog.at_level("ERROR"):
+            log_file.write_text(content[:5], encoding="utf-8")
+            assert watcher.scan() == []
+            log_file.write_text(content[:15], encoding="utf-8")
+            assert watcher.scan() == []
+            assert len(parsed) == 1
+            log_file.write_text(content, encoding="utf-8")
+            time.sleep(0.25)
+            assert [r.agent_id for _, r in watcher.scan()] == ["A1"]
+            assert len(parsed) == 2
+            assert not [r for r in caplog.records if r.levelno >= logging.ERROR]
+
+            # Bleibt die Datei auch nach der Ruhezeit ungültig, wird der Fehler einmal gemeldet
+            (tmp_path / "b.json").write_text("{kaputt", encoding="utf-8")
+            assert watcher.scan() == []
+            time.sleep(0.25)
+            assert watcher.scan() == [] and watcher.scan() == []
+        errors = [r.getMessage() for r in caplog.records if r.levelno >= logging.ERROR]
+        assert len(errors) == 1 and "b.json" in errors[0]
+
+    def test_run_reports_new_files_quickly(self, tmp_path):
+        """run() liefert neue Dateien in unter einer Sekunde; bestehende werden übersprungen."""
+        (tmp_path / "old.json").write_text(self._log("OLD"), encoding="utf-8")
+        watcher = LogWatcher(AgentLogScorer(), tmp_path, poll_interval=0.05)
+        seen = []
+        arrived = threading.Event()
+        stop = threading.Event()
+
+        def on_result(path, result):
+            seen.append((result.agent_id, time.monotonic()))
+            arrived.set()
+
+        thread = threading.Thread(target=watcher.run, args=(on_result, stop))
+        thread.start()
+        try:
+            time.sleep(0.1)
+            tmp_file = tmp_path / "new.tmp"
+            tmp_file.write_text(self._log("NEW"), encoding="utf-8")
+            written_at = time.monotonic()
+            tmp_file.rename(tmp_path / "new.json")
+            assert arrived.wait(5)
+        finally:
+            stop.set()
+            thread.join(5)
+            watcher.close()
+
+        assert [agent_id for agent_id, _ in seen] == ["NEW"]
+        assert seen[0][1] - written_at < 1.0
+
+
+class TestScoringService:
+    """Tests für den lokalen HTTP-Service"""
+
+    @pytest.fixture
+    def service(self):
+        with ScoringService(AgentLogScorer(), port=0) as service:
+            yield service
+
+    @staticmethod
+    def _request(conn, method, path, body=None):
+        conn.request(method, path, body=body)
+        response = conn.getresponse()
+        return response.status, json.loads(response.read())
+
+    def test_score_and_stats(self, service):
+        """POST /score liefert dasselbe Ergebnis wie score_log, /stats die Statistiken."""
+        sample_log = {"agent_id": "S1", "transcript": ["Das ist gesetzlich erlaubt und kostet 10 Euro"]}
+        conn = http.client.HTTPConnection(*service.address, timeout=5)
+        status, payload = self._request(conn, "POST", "/score", json.dumps(sample_log))
+        assert status == 200
+        assert payload == AgentLogScorer().score_log(sample_log).to_dict()
+
+        # Dieselbe Verbindung wird wiederverwendet (Keep-Alive)
+        status, stats = self._request(conn, "GET", "/stats")
+        assert status == 200
+        assert stats[sample_log["agent_id"]]["total_interactions"] == 1
+        conn.close()
+
+    def test_batch_accepts_array_and_jsonl(self, service):
+        """Batch-Endpunkt akzeptiert JSON-Array und JSONL, ungültige Logs an ihrer Position."""
+        logs = [{"agent_id": "B1", "transcript": ["Das kostet 5€"]}, "kein log", {"agent_id": "B2"}]
+        conn = http.client.HTTPConnection(*service.address, timeout=5)
+
+        status, payload = self._request(conn, "POST", "/score/batch", json.dumps(logs))
+        assert status == 200
+        results = payload["results"]
+        assert results[0]["price_claim"] is True
+        assert "error" in results[1]
+        assert results[2]["agent_id"] == "B2"
+
+        jsonl = "\n".join(json.dumps(log) for log in logs) + "\n"
+        status, payload = self._request(conn, "POST", "/score/batch", jsonl)
+        assert status == 200
+        assert payload["results"] == results
+        conn.close()
+
+    def test_concurrent_requests_with_alerts(self, monkeypatch):
+        """Parallele Requests lösen Alerts ohne Fehler aus; jeder wird gezählt."""
+        monkeypatch.setattr(logging.getLogger("agents.agent_log_scorer"), "disabled", True)
+        metrics = ScorerMetrics()
+        alert_system = AlertSystem(metrics=metrics, window=0, max_recent=10_000)
+        log = {"agent_id": "C1", "transcript": ["Das kostet 5€ und ist laut Gesetz erlaubt"]}
+        statuses = []
+
+        def work(service):
+            conn = http.client.HTTPConnection(*service.address, timeout=10)
+            for _ in range(50):
+                statuses.append(self._request(conn, "POST", "/score", json.dumps(log))[0])
+            conn.close()
+
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            with ScoringService(AgentLogScorer(metrics=metrics), port=0, alert_system=alert_system) as service:
+                threads = [threading.Thread(target=work, args=(service,)) for _ in range(8)]
+                for thread in threads:
+                    thread.start()
+                for thread in threads:
+                    thread.join()
+        finally:
+            sys.setswitchinterval(switch_interval)
+
+        assert statuses == [200] * 400
+        assert alert_system.get_stats()["triggered"] == 400
+        assert service.scorer.get_agent_statistics()["C1"].total_interactions == 400
+        assert metrics.logs_scored.get() == 400
+        assert metrics.alerts.labels("HIGH").value == 400
+        assert metrics.in_flight.value == 0
+
+    def test_requests_scored_in_parallel(self, service, monkeypatch):
+        """Zwei Requests werden gleichzeitig bewertet, nicht nacheinander."""
+        barrier = threading.Barrier(2, timeout=5)
+        original_score_log = service.scorer.score_log
+
+        def score_log(log):
+            barrier.wait()
+            return original_score_log(log)
+
+        monkeypatch.setattr(service.scorer, "score_log", score_log)
+        statuses = []
+
+        def work(agent_id):
+            conn = http.client.HTTPConnection(*service.address, timeout=10)
+            statuses.append(self._request(conn, "POST", "/score", json.dumps({"agent_id": agent_id}))[0])
+            conn.close()
+
+        threads = [threading.Thread(target=work, args=(f"P{i}",)) for i in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert statuses == [200, 200]
+
+    def test_errors(self, service):
+        """Ungültiges JSON liefert 400, unbekannte Pfade 404."""
+        conn = http.client.HTTPConnection(*service.address, timeout=5)
+        assert self._request(conn, "POST", "/score", "{kaputt")[0] == 400
+        assert self._request(conn, "POST", "/score", json.dumps({"transcript": []}))[0] == 400
+        assert self._request(conn, "GET", "/unbekannt")[0] == 404
+        conn.close()
+
+    @pytest.mark.parametrize("length", ["-1", "zehn"])
+    def test_invalid_content_length(self, service, length):
+        """Negativer oder nicht numerischer Content-Length liefert 400 statt zu blockieren."""
+        conn = http.client.HTTPConnection(*service.address, timeout=5)
+        conn.putrequest("POST", "/score")
+        conn.putheader("Content-Length", length)
+        conn.endheaders()
+        response = conn.getresponse()
+        assert response.status == 400
+        assert "Content-Length" in json.loads(response.read())["error"]
+        conn.close()
+
+
+class TestConfigReload:
+    """Tests für das Neuladen der Konfiguration im laufenden Betrieb."""
+
+    LOG = {"agent_id": "A1", "transcript": ["Die Garantie gilt zwei Jahre, das kostet nichts"]}
+
+    @pytest.fixture
+    def config_file(self, tmp_path):
+        path = tmp_path / "config.yaml"
+        path.write_text("keywords:\n  price: [kostet]\n  legal: [gesetz]\n", encoding="utf-8")
+        return path
+
+    def test_reload_on_change_keeps_state(self, config_file, tmp_path):
+        """Geänderte Datei wird erkannt; Statistiken und Cache bleiben erhalten."""
+        cache = ResultCache(tmp_path / "cache.db")
+        scorer = AgentLogScorer(config_path=config_file, cache=cache, metrics=ScorerMetrics())
+        first = scorer.score_log(self.LOG)
+        assert first.config_version == scorer.config_version
+        assert first.legal_keywords_found == []
+        assert scorer.check_config() is False
+
+        config_file.write_text("keywords:\n  price: [kostet]\n  legal: [gesetz, garantie]\n", encoding="utf-8")
+        assert scorer.check_config() is True
+        second = scorer.score_log(self.LOG)
+        assert second.legal_keywords_found == ["garantie"]
+        assert second.config_version == scorer.config_version != first.config_version
+        assert scorer.get_agent_statistics()["A1"].total_interactions == 2
+        assert scorer.cache is cache and len(cache) == 2
+        assert scorer.metrics.config_reloads.labels("changed").value == 1
+        cache.close()
+
+    def test_broken_config_keeps_active(self, config_file):
+        """Eine fehlerhafte YAML-Datei ersetzt die aktive Konfiguration nicht."""
+        scorer = AgentLogScorer(config_path=config_file, metrics=ScorerMetrics())
+        version = scorer.config_version
+        # Unveränderte Datei kommt aus dem Konfigurations-Cache und gilt als geladen
+        assert scorer.reload_config() is False
+        assert scorer.metrics.config_reloads.labels("unchanged").value == 1
+        config_file.write_text("keywords: [unterbrochen\n", encoding="utf-8")
+        assert scorer.check_config() is False
+        assert scorer.config_version == version
+        assert scorer.config.price_keywords == ["kostet"]
+
+    def test_without_config_path(self):
+        """Ohne Konfigurationspfad gibt es nichts zu prüfen oder zu beobachten."""
+        scorer = AgentLogScorer(config=ScoringConfig())
+        assert scorer._stat_config() is None
+        assert scorer.check_config() is False
+        with pytest.raises(ValueError):
+            scorer.reload_config()
+        with pytest.raises(ValueError):
+            ConfigReloader(scorer)
+
+    def test_in_flight_log_finishes_on_old_config(self, config_file):
+        """Ein Austausch während der Bewertung wirkt erst ab dem nächsten Log."""
+        scorer = AgentLogScorer(config_path=config_file)
+        new_config = ScoringConfig(
+            price_keywords=["kostet"], legal_keywords=["garantie"], risk_thresholds={"low": 5, "medium": 6, "high": 7}
+        )
+        old_version = scorer.config_version
+        matcher = scorer.config.get_keyword_matcher()
+        original_match = matcher.match_turns
+
+        def match_and_reload(turns):
+            scorer.reload_config(new_config)
+            return original_match(turns)
+
+        matcher.match_turns = match_and_reload
+        result = scorer.score_log(self.LOG)
+        assert result.config_version == old_version
+        assert result.legal_keywords_found == [] and result.risk_level == RiskLevel.MEDIUM
+
+        result = scorer.score_log(self.LOG)
+        assert result.config_version == scorer.config_version != old_version
+        assert result.legal_keywords_found == ["garantie"] and result.risk_level == RiskLevel.LOW
+
+    def test_background_reload_never_stalls_scoring(self, config_file, monkeypatch):
+        """Langsames Laden im Hintergrund blockiert die Scoring-Schleife nicht."""
+        scorer = AgentLogScorer(config_path=config_file)
+        old_version = scorer.config_version
+        loading = threading.Event()
+        original_load = ScoringConfig.load.__func__
+
+        def slow_load(cls, path, use_cache=True):
+            loading.set()
+            time.sleep(0.5)
+            return original_load(cls, path, use_cache)
+
+        monkeypatch.setattr(ScoringConfig, "load", classmethod(slow_load))
+        config_file.write_text("keywords:\n  price: [kostet]\n  legal: [garantie]\n", encoding="utf-8")
+
+        with ConfigReloader(scorer, interval=0.01):
+            assert loading.wait(2)
+            worst = 0.0
+            versions = set()
+            deadline = time.monotonic() + 5
+            while scorer.config_version == old_version and time.monotonic() < deadline:
+                start = time.perf_counter()
+                versions.add(scorer.score_log(self.LOG).config_version)
+                worst = max(worst, time.perf_counter() - start)
+        assert scorer.config_version != old_version
+        # Während des Ladens gilt die alte Version; nur das Log, in dessen
+        # Bewertung der Austausch fällt, kann schon die neue tragen
+        assert old_version in versions
+        assert versions <= {old_version, scorer.config_version}
+        assert worst < 0.2
+
+
+class TestStartup:
+    """Tests für schnellen Start: Lazy Imports und Konfigurations-Cache"""
+
+    HEAVY_MODULES = {"yaml", "asyncio", "csv", "sqlite3", "http.server", "concurrent.futures"}
+    IMPORT_BUDGET_US = 150_000
+
+    @staticmethod
+    def _run_python(tmp_path, *args):
+        env = {k: v for k, v in os.environ.items() if k != "PYTHONDONTWRITEBYTECODE"}
+        return subprocess.run(
+            [sys.executable, "-X", f"pycache_prefix={tmp_path / 'pycache'}", *args],
+            cwd=Path(__file__).parent.parent, env=env, capture_output=True, text=True, check=True
+        )
+
+    def test_import_time_budget(self, tmp_path):
+        """Der Modul-Import bleibt im Budget und lädt keine schweren Module."""
+        args = ("-X", "importtime", "-c", "import agents.agent_log_scorer")
+        self._run_python(tmp_path, *args)  # Bytecode erzeugen
+        output = self._run_python(tmp_path, *args).stderr
+
+        imported = {}
+        for line in output.splitlines():
+            if line.startswith("import time:") and "|" in line:
+                _, cumulative, name = line.split("|")
+                if cumulative.strip().isdigit():
+                    imported[name.strip()] = int(cumulative)
+
+        assert not self.HEAVY_MODULES & imported.keys()
+        assert imported["agents.agent_log_scorer"] < self.IMPORT_BUDGET_US
+
+    def test_warm_start_skips_yaml(self, tmp_path):
+        """Beim Warmstart wird die Konfiguration ohne PyYAML aus dem Cache geladen."""
+        yaml_path = tmp_path / "config.yaml"
+        shutil.copy(Path(__file__).parent.parent / "agents" / "flow_validator_checklist.yaml", yaml_path)
+        code = (
+            "import json, sys\n"
+            "from agents.agent_log_scorer import ScoringConfig\n"
+            f"config = ScoringConfig.load({str(yaml_path)!r})\n"
+            "print(json.dumps(['yaml' in sys.modules, config.fingerprint()]))\n"
+        )
+        cold = json.loads(self._run_python(tmp_path, "-c", code).stdout)
+        warm = json.loads(self._run_python(tmp_path, "-c", code).stdout)
+
+        assert cold[0] is True
+        assert warm[0] is False
+        assert warm[1] == cold[1] == ScoringConfig.from_yaml(yaml_path).fingerprint()
+
+    def test_config_cache_invalidation(self, tmp_path):
+        """Geänderter Inhalt invalidiert den Cache, ein bloßes touch nicht."""
+        yaml_path = tmp_path / "config.yaml"
+        yaml_path.write_text("keywords:\n  price: [alt]\n", encoding="utf-8")
+        assert ScoringConfig.load(yaml_path).price_keywords == ["alt"]
+        assert ScoringConfig.load(yaml_path).price_keywords == ["alt"]
+
+        os.utime(yaml_path, ns=(0, 0))
+        assert ScoringConfig.load(yaml_path).price_keywords == ["alt"]
+
+        yaml_path.write_text("keywords:\n  price: [neu, zwei]\n", encoding="utf-8")
+        assert ScoringConfig.load(yaml_path).price_keywords == ["neu", "zwei"]
+
+    def test_config_cache_is_validated_json(self, tmp_path):
+        """Der Cache ist JSON; ein manipulierter oder fremder Eintrag wird ignoriert."""
+        import pickle
+        yaml_path = tmp_path / "config.yaml"
+        yaml_path.write_text("keywords:\n  price: [echt]\n", encoding="utf-8")
+        ScoringConfig.load(yaml_path)
+        (cache_path,) = (tmp_path / "__pycache__").iterdir()
+        entry = json.loads(cache_path.read_text(encoding="utf-8"))
+        assert entry["settings"]["price_keywords"] == ["echt"]
+
+        entry["settings"]["price_keywords"] = "kein Array"
+        cache_path.write_text(json.dumps(entry), encoding="utf-8")
+        assert ScoringConfig.load(yaml_path).price_keywords == ["echt"]
+
+        cache_path.write_bytes(pickle.dumps(entry))
+        assert ScoringConfig.load(yaml_path).price_keywords == ["echt"]
+        assert json.loads(cache_path.read_text(encoding="utf-8"))["settings"]["price_keywords"] == ["echt"]
+
+    def test_warm_start_reports_unsupported_rules(self, tmp_path, caplog, monkeypatch):
+        """Auch aus dem Cache werden nicht unterstützte Regeln beim Laden gemeldet."""
+        yaml_path = tmp_path / "config.yaml"
+        yaml_path.write_text("flow_validator:\n  forbidden:\n    - nur Freitext\n", encoding="utf-8")
+        ScoringConfig.load(yaml_path)
+        caplog.clear()
+        monkeypatch.setattr(ScoringConfig, "from_yaml", classmethod(lambda cls, path: pytest.fail("kein Cache-Treffer")))
+        with caplog.at_level("WARNING"):
+            ScoringConfig.load(yaml_path)
+        assert "Regel nicht unterstützt" in caplog.text and "nur Freitext" in caplog.text
+
+
+class TestScoreResultBatch:
+    """Tests für den spaltenbasierten Ergebnisspeicher."""
+
+    @pytest.fixture
+    def scored(self):
+        scorer = AgentLogScorer()
+        logs = [
+            {
+                "agent_id": f"AGENT_{i % 3}",
+                "contact_name": None if i % 4 == 0 else f"Kundin {i} – Müller",
+                "timestamp": None if i % 5 == 0 else f"2025-12-23T10:{i:02d}:00",
+                "transcript": [["Guten Tag", "Das kostet 100€", "Laut Gesetz ist das erlaubt"][i % 3]],
+                "stop_triggered": i % 2 == 0,
+                "result": "PLACEHOLDER" if i % 7 == 0 else ""
+            }
+            for i in range(40)
+        ]
+        return scorer, [scorer.score_log(log) for log in logs]
+
+    def test_rows_match_results(self, scored):
+        """Zeilenansichten liefern dieselben Werte wie die Original-Ergebnisse."""
+        scorer, results = scored
+        batch = ScoreResultBatch.from_results(results, scorer.config)
+        assert len(batch) == len(results)
+        assert [row.to_dict() for row in batch] == [r.to_dict() for r in results]
+        assert batch[-1].to_result() == results[-1]
+        assert [row.is_critical() for row in batch] == [r.is_critical() for r in results]
+        with pytest.raises(IndexError):
+            batch[len(results)]
+
+    def test_float_risks(self):
+        """Nicht ganzzahlige Risks (placeholder_bonus: -1.5) bleiben samt Typ erhalten."""
+        scorer = AgentLogScorer(config=ScoringConfig(placeholder_bonus=-1.5))
+        transcripts = [["Das kostet 100€"], ["Das kostet 100€ laut Gesetz"], ["Guten Tag"]]
+        results = [
+            scorer.score_log({"agent_id": "F1", "transcript": transcripts[i % 3],
+                              "result": "PLACEHOLDER" if i % 2 else ""})
+            for i in range(12)
+        ]
+        assert {type(r.risk) for r in results} == {int, float}
+
+        batch = ScoreResultBatch.from_results(results, scorer.config)
+        assert [row.to_dict() for row in batch] == [r.to_dict() for r in results]
+        assert [type(row.risk) for row in batch] == [type(r.risk) for r in results]
+        assert scorer.get_summary(batch) == scorer.get_summary(results)
+
+    def test_consumers_accept_batch(self, scored, tmp_path):
+        """Summary, Dashboard und Exporter akzeptieren den Batch direkt."""
+        scorer, results = scored
+        batch = ScoreResultBatch.from_results(results, scorer.config)
+        assert scorer.get_summary(batch) == scorer.get_summary(results)
+
+        stats = scorer.get_agent_statistics()
+        expected = DashboardGenerator.generate(results, stats)["supervisor_dashboard"]
+        actual = DashboardGenerator.generate(batch, stats)["supervisor_dashboard"]
+        expected.pop("date")
+        actual.pop("date")
+        assert actual == expected
+
+        ReportGenerator.to_json(batch, tmp_path / "batch.json")
+        ReportGenerator.to_json(results, tmp_path / "list.json")
+        assert (tmp_path / "batch.json").read_text(encoding="utf-8") == (tmp_path / "list.json").read_text(encoding="utf-8")
+
+    def test_memory_per_result(self, scored):
+        """Der Batch braucht mindestens 5x weniger Speicher als ScoreResult-Objekte."""
+        import tracemalloc
+        scorer, results = scored
+        results = results * 100
+
+        tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+        objects = [ScoreResult.from_dict(r.to_dict()) for r in results]
+        objects_size = tracemalloc.get_traced_memory()[0] - before
+        before = tracemalloc.get_traced_memory()[0]
+        batch = ScoreResultBatch.from_results(objects, scorer.config)
+        batch_size = tracemalloc.get_traced_memory()[0] - before
+        tracemalloc.stop()
+
+        assert len(batch) == len(objects)
+        assert objects_size >= 5 * batch_size
+
+
 class TestReportGenerator:
     """Tests für die Report-Generierung."""
 
@@ -244,6 +1422,92 @@ class TestReportGenerator:
             os.unlink(f.name)
 
 
+class TestReportWriters:
+    """Tests für die streamenden Report-Writer."""
+
+    @staticmethod
+    def _result(agent_id, risk=0, level=RiskLevel.LOW):
+        return ScoreResult(
+            agent_id=agent_id, contact="Jörg", timestamp=None,
+            price_claim=risk > 0, price_keywords_found=["€"] if risk else [],
+            legal_claim=False, legal_keywords_found=[],
+            stop_triggered=False, placeholder_used=False,
+            risk=risk, risk_level=level, violations=["Verstoß: x"] if risk else []
+        )
+
+    @pytest.mark.parametrize("count", [0, 1, 3])
+    def test_json_writer_matches_json_dump(self, tmp_path, count):
+        """Gestreamtes JSON ist identisch zu json.dump(..., indent=2)."""
+        results = [self._result(f"A{i}", risk=i % 3) for i in range(count)]
+        path = tmp_path / "out.json"
+        with JsonReportWriter(path) as writer:
+            for r in results:
+                writer.write(r)
+        expected = json.dumps([r.to_dict() for r in results], indent=2, ensure_ascii=False)
+        assert path.read_text(encoding="utf-8") == expected
+
+    def test_writer_without_write_result_fails_on_instantiation(self, tmp_path):
+        """Ein Writer ohne _write_result lässt sich nicht instanziieren."""
+
+        class IncompleteWriter(ReportWriter):
+            FORMAT = "Test"
+
+        with pytest.raises(TypeError):
+            IncompleteWriter(tmp_path / "out.txt")
+
+    def test_csv_writer_streams_rows(self, tmp_path):
+        """CSV-Writer schreibt Kopfzeile und eine Zeile pro Ergebnis."""
+        path = tmp_path / "out.csv"
+        writer = CsvReportWriter(path).open()
+        writer.write_all(self._result(f"A{i}", risk=1, level=RiskLevel.MEDIUM) for i in range(2))
+        writer.close()
+        lines = path.read_text(encoding="utf-8").splitlines()
+        assert lines[0].startswith("agent_id,")
+        assert len(lines) == 3
+        assert writer.count == 2
+
+    def test_html_writer_builds_summary_at_close(self, tmp_path):
+        """Ohne vorab bekannte Summary wird sie aus den Ergebnissen erstellt."""
+        path = tmp_path / "out.html"
+        with HtmlReportWriter(path) as writer:
+            writer.write(self._result("A1"))
+            writer.write(self._result("A2", risk=2, level=RiskLevel.HIGH))
+        html = path.read_text(encoding="utf-8")
+        assert html.count("<tr>") == 3  # Kopfzeile + 2 Ergebnisse
+        assert 'class="summary deferred"' in html
+        assert html.rstrip().endswith("</html>")
+
+    def test_html_writer_escapes_content(self, tmp_path):
+        """Inhalte aus den Logs werden HTML-escaped."""
+        path = tmp_path / "out.html"
+        with HtmlReportWriter(path) as writer:
+            writer.write(self._result("<script>alert(1)</script>"))
+        assert "<script>" not in path.read_text(encoding="utf-8")
+
+    def test_paginated_html_writer(self, tmp_path):
+        """Seiten mit fester Größe, verlinkt, plus Seiten nur mit kritischen Vorfällen."""
+        path = tmp_path / "report.html"
+        results = [
+            self._result(f"A{i}", risk=2, level=RiskLevel.HIGH) if i in (1, 4) else self._result(f"A{i}")
+            for i in range(5)
+        ]
+        with PaginatedHtmlReportWriter(path, page_size=2) as writer:
+            writer.write_all(results)
+
+        assert writer.page_files == ["report_page_0001.html", "report_page_0002.html", "report_page_0003.html"]
+        pages = [(tmp_path / name).read_text(encoding="utf-8") for name in writer.page_files]
+        assert [page.count("<tr>") - 1 for page in pages] == [2, 2, 1]
+        assert 'href="report_page_0002.html"' in pages[0]
+        assert 'href="report_page_0004.html"' not in pages[2]
+
+        critical = (tmp_path / "report_critical_0001.html").read_text(encoding="utf-8")
+        assert critical.count("<tr>") - 1 == 2
+        index = path.read_text(encoding="utf-8")
+        assert 'href="report_critical_0001.html"' in index
+        assert 'href="report_page_0003.html"' in index
+        assert "Kritische Vorfälle (2)" in index
+
+
 class TestDashboardGenerator:
     """Tests für die Dashboard-Generierung."""
 
@@ -264,6 +1528,282 @@ class TestDashboardGenerator:
         dashboard = DashboardGenerator.generate(results, stats)
         assert "supervisor_dashboard" in dashboard
 
+    @staticmethod
+    def _result(i, level, violations, timestamp):
+        return ScoreResult(
+            agent_id=f"A{i % 7}", contact=None, timestamp=timestamp,
+            price_claim=True, price_keywords_found=["euro"],
+            legal_claim=i % 2 == 0, legal_keywords_found=["gesetz"] if i % 2 == 0 else [],
+            stop_triggered=False, placeholder_used=False,
+            risk=3, risk_level=level, violations=[f"v{n}" for n in range(violations)]
+        )
+
+    def test_top_issues_are_worst(self):
+        """Die Top-K sind nach Risiko, Verstößen und Aktualität die schwersten Issues."""
+        levels = [RiskLevel.LOW, RiskLevel.HIGH, RiskLevel.CRITICAL]
+        results = [
+            self._result(i, levels[i % 3], i % 4, None if i % 11 == 0 else f"2025-12-{1 + i % 28:02d}T10:00:00")
+            for i in range(300)
+        ]
+        stats = {f"A{i}": AgentStatistics(agent_id=f"A{i}", total_interactions=1) for i in range(7)}
+        dashboard = DashboardGenerator.generate(iter(results), stats, top_k=5)["supervisor_dashboard"]
+
+        rank = {"HIGH": 0, "CRITICAL": 1}
+        expected = sorted(
+            (
+                (rank[r.risk_level.value], len(r.violations), r.timestamp or "", issue["agent_id"], issue["issue"])
+                for r in results for issue in DashboardGenerator.issues_for(r)
+            ),
+            reverse=True
+        )[:5]
+        top = dashboard["potential_issues"]
+        assert [(rank[i["risk"]], i["timestamp"] or "", i["agent_id"], i["issue"]) for i in top] == [
+            (e[0], e[2], e[3], e[4]) for e in expected
+        ]
+        assert all(i["risk"] == "CRITICAL" for i in top)
+        assert dashboard["summary"]["total_violations"] == sum(len(r.violations) for r in results)
+        # Empfehlung berücksichtigt alle kritischen Agenten, nicht nur die Top-K
+        critical_agents = sorted({r.agent_id for r in results if r.risk_level == RiskLevel.CRITICAL})
+        assert dashboard["supervisor_recommendation"] == f"Pause {', '.join(critical_agents)} and rebrief immediately"
+
+    def test_index_is_bounded_and_mergeable(self):
+        """Der Index hält höchstens K Einträge; Zusammenführen entspricht einem Gesamtlauf."""
+        results = [self._result(i, RiskLevel.HIGH, i % 5, f"2025-12-01T{i % 24:02d}:00:00") for i in range(200)]
+        single = TopIssueIndex(3)
+        parts = [TopIssueIndex(3) for _ in range(4)]
+        for i, result in enumerate(results):
+            single.add(result)
+            parts[i % 4].add(result)
+            assert len(single) <= 3
+        merged = TopIssueIndex(3)
+        for part in reversed(parts):
+            merged.merge(TopIssueIndex.from_state(json.loads(json.dumps(part.to_state()))))
+        assert merged.top() == single.top()
+        assert merged.to_state() == single.to_state()
+        assert single.count == sum(len(DashboardGenerator.issues_for(r)) for r in results)
+
+        empty = TopIssueIndex(0)
+        empty.add(results[0])
+        assert empty.top() == [] and empty.count == 2
+
+
+class TestStatisticsAggregate:
+    """Tests für zusammenführbare Teilaggregate."""
+
+    @pytest.fixture
+    def results(self):
+        scorer = AgentLogScorer()
+        texts = ["Guten Tag", "Das kostet 100€", "Laut Gesetz ist das erlaubt", "Preis 5 Euro, gesetzlich erlaubt"]
+        return [
+            scorer.score_log({
+                "agent_id": f"AGENT_{i % 5}",
+                "timestamp": f"2025-12-{1 + i % 28:02d}T10:00:00",
+                "transcript": [texts[i % 4]],
+                "stop_triggered": i % 3 == 0,
+                "result": "PLACEHOLDER" if i % 7 == 0 else ""
+            })
+            for i in range(60)
+        ]
+
+    @staticmethod
+    def _aggregate(results, fingerprint="cfg"):
+        aggregate = StatisticsAggregate(fingerprint)
+        for result in results:
+            aggregate.add(result)
+        return aggregate
+
+    @staticmethod
+    def _dashboard(aggregate):
+        dashboard = aggregate.get_dashboard()["supervisor_dashboard"]
+        dashboard.pop("date")
+        return dashboard
+
+    def test_merge_matches_single_node(self, results):
+        """Zusammengeführte Teilaggregate sind identisch mit einem Lauf über alle Logs."""
+        single = self._aggregate(results)
+        shards = [self._aggregate(results[i::3]) for i in range(3)]
+
+        forward = StatisticsAggregate()
+        for shard in shards:
+            forward.merge(StatisticsAggregate.from_dict(shard.to_dict()))
+        backward = StatisticsAggregate()
+        for shard in reversed(shards):
+            backward.merge(StatisticsAggregate.from_dict(shard.to_dict()))
+        nested = self._aggregate([]).merge(
+            StatisticsAggregate.from_dict(shards[2].to_dict()).merge(StatisticsAggregate.from_dict(shards[0].to_dict()))
+        ).merge(StatisticsAggregate.from_dict(shards[1].to_dict()))
+
+        for merged in (forward, backward, nested):
+            assert merged.to_dict() == single.to_dict()
+            assert merged.get_summary() == single.get_summary()
+            assert self._dashboard(merged) == self._dashboard(single)
+
+    def test_matches_scorer(self, results):
+        """Statistiken und Summary entsprechen denen des Scorers."""
+        scorer = AgentLogScorer()
+        for result in results:
+            scorer._update_statistics(result)
+        merged = self._aggregate(results[::2]).merge(self._aggregate(results[1::2]))
+
+        assert {a: s.to_dict() for a, s in merged.get_agent_statistics().items()} == {
+            a: s.to_dict() for a, s in scorer.get_agent_statistics().items()
+        }
+        expected = scorer.get_summary(results)
+        actual = merged.get_summary()
+        incidents = actual.pop("critical_incidents")
+        assert sorted(map(json.dumps, incidents)) == sorted(map(json.dumps, expected.pop("critical_incidents")))
+        assert actual == expected
+
+        dashboard = DashboardGenerator.generate(results, scorer.get_agent_statistics())["supervisor_dashboard"]
+        merged_dashboard = self._dashboard(merged)
+        assert merged_dashboard["summary"]["total_violations"] == dashboard["summary"]["total_violations"]
+        assert merged_dashboard["total_interactions"] == dashboard["total_interactions"]
+        assert merged_dashboard["supervisor_recommendation"] == dashboard["supervisor_recommendation"]
+
+    def test_rejects_mismatched_config_and_format(self, results):
+        """Unterschiedliche Konfigurationen und fremde Formate werden abgelehnt."""
+        with pytest.raises(ValueError):
+            self._aggregate(results, "a").merge(self._aggregate(results, "b"))
+        with pytest.raises(ValueError):
+            StatisticsAggregate.from_dict({"format": "other", "version": 1})
+        with pytest.raises(ValueError):
+            StatisticsAggregate.from_dict({"format": StatisticsAggregate.FORMAT, "version": 99})
+
+    def test_cli_partial_output_and_merge(self, tmp_path, capsys):
+        """--partial-output pro Verzeichnis und ``merge`` ergeben die Summary eines Gesamtlaufs."""
+        texts = ["Guten Tag", "Das kostet 100€", "Laut Gesetz ist das erlaubt"]
+        for i in range(12):
+            shard_dir = tmp_path / ("all", "a", "b")[1 + i % 2]
+            shard_dir.mkdir(exist_ok=True)
+            log = {"agent_id": f"AGENT_{i % 4}", "transcript": [texts[i % 3]], "stop_triggered": False}
+            (shard_dir / f"log_{i:02d}.json").write_text(json.dumps(log), encoding="utf-8")
+        (tmp_path / "all").mkdir()
+        for path in list((tmp_path / "a").iterdir()) + list((tmp_path / "b").iterdir()):
+            shutil.copy(path, tmp_path / "all" / path.name)
+
+        for name in ("a", "b", "all"):
+            main(["--batch", str(tmp_path / name), "--partial-output", str(tmp_path / f"{name}.json")])
+        capsys.readouterr()
+
+        exit_code = main([
+            "merge", str(tmp_path / "b.json"), str(tmp_path / "a.json"),
+            "-o", str(tmp_path / "merged.json"), "--dashboard", str(tmp_path / "dashboard.json")
+        ])
+        summary = json.loads(capsys.readouterr().out)
+
+        single = StatisticsAggregate.load(tmp_path / "all.json")
+        assert exit_code == (1 if single.summary.critical_count else 0)
+        assert summary == single.get_summary()
+        assert StatisticsAggregate.load(tmp_path / "merged.json").to_dict() == single.to_dict()
+        dashboard = json.loads((tmp_path / "dashboard.json").read_text(encoding="utf-8"))["supervisor_dashboard"]
+        assert dashboard["summary"]["total_violations"] == single.dashboard.total_violations
+
+
+class TestShardSpec:
+    """Tests für das Hash-basierte Sharding."""
+
+    @pytest.fixture
+    def logs_dir(self, tmp_path):
+        texts = ["Guten Tag", "Das kostet 100€", "Laut Gesetz ist das erlaubt"]
+        for i in range(40):
+            log = {"agent_id": f"AGENT_{i % 6}", "transcript": [texts[i % 3]], "stop_triggered": i % 4 == 0}
+            (tmp_path / f"log_{i:03d}.json").write_text(json.dumps(log), encoding="utf-8")
+        (tmp_path / "broken.json").write_text("{", encoding="utf-8")
+        return tmp_path
+
+    def test_parse(self):
+        """I/N wird gelesen und geprüft."""
+        assert ShardSpec.parse("2/5") == ShardSpec(2, 5, "path")
+        assert ShardSpec.parse("0/1", key="agent").key == "agent"
+        for spec in ("5/5", "-1/3", "1", "a/b", "1/0"):
+            with pytest.raises(ValueError):
+                ShardSpec.parse(spec)
+        with pytest.raises(ValueError):
+            ShardSpec(0, 2, "host")
+
+    def test_partition_is_complete_and_balanced(self):
+        """Jeder Schlüssel gehört genau einem Shard; Abweichung vom Mittel unter 5 %."""
+        shards = [ShardSpec(i, 4) for i in range(4)]
+        counts = [0] * 4
+        for n in range(40_000):
+            owners = [shard.index for shard in shards if shard.owns(f"logs/2025/call_{n:06d}.json")]
+            assert len(owners) == 1
+            counts[owners[0]] += 1
+        assert max(abs(count - 10_000) for count in counts) < 500
+        # Stabil über Prozesse hinweg (kein Python-hash())
+        assert ShardSpec.bucket("logs/call.json", 1000) == ShardSpec.bucket("logs/call.json", 1000)
+        assert [ShardSpec.bucket(f"k{n}", 7) for n in range(5)] == [
+            int.from_bytes(hashlib.blake2b(f"k{n}".encode(), digest_size=8).digest(), "big") % 7 for n in range(5)
+        ]
+
+    def test_output_path(self):
+        """Ausgabedateien werden pro Shard getrennt."""
+        shard = ShardSpec(1, 3)
+        assert shard.output_path("out/report.json") == str(Path("out/report.shard1of3.json"))
+        assert shard.output_path("out/{shard}/report.csv") == "out/1/report.csv"
+
+    @pytest.mark.parametrize("key", ["path", "agent"])
+    def test_shards_cover_directory(self, logs_dir, key):
+        """Die Shards zusammen ergeben genau den Gesamtlauf; nach agent_id bleiben Agenten lokal."""
+        expected = AgentLogScorer().score_directory(logs_dir)
+        shard_results = []
+        agents_per_shard = []
+        for i in range(3):
+            scorer = AgentLogScorer()
+            results = scorer.score_directory(logs_dir, shard=ShardSpec(i, 3, key))
+            assert [r.to_dict() for r in scorer.iter_score_directory(logs_dir, shard=ShardSpec(i, 3, key))] == [
+                r.to_dict() for r in results
+            ]
+            shard_results.extend(results)
+            agents_per_shard.append(set(scorer.get_agent_statistics()))
+
+        def canonical(results):
+            return sorted(json.dumps(r.to_dict(), sort_keys=True) for r in results)
+
+        assert canonical(shard_results) == canonical(expected)
+        if key == "agent":
+            assert sum(len(agents) for agents in agents_per_shard) == len(set().union(*agents_per_shard))
+
+    def test_parallel_async_and_jsonl(self, logs_dir, tmp_path):
+        """Sharding wirkt gleich im Prozess-Pool, in der asynchronen Pipeline und bei JSONL."""
+        shard = ShardSpec(1, 2, "agent")
+        expected = [r.to_dict() for r in AgentLogScorer().score_directory(logs_dir, shard=shard)]
+        assert [r.to_dict() for r in AgentLogScorer().score_directory(logs_dir, workers=2, shard=shard)] == expected
+        # Die asynchrone Pipeline liefert in Fundreihenfolge, nicht sortiert
+        async_results = asyncio.run(AgentLogScorer().score_directory_async(logs_dir, shard=shard))
+        assert sorted(json.dumps(r.to_dict(), sort_keys=True) for r in async_results) == sorted(
+            json.dumps(r, sort_keys=True) for r in expected
+        )
+
+        jsonl = tmp_path / "calls.jsonl"
+        with open(jsonl, "w", encoding="utf-8") as f:
+            for file_path in sorted(logs_dir.glob("log_*.json")):
+                f.write(file_path.read_text(encoding="utf-8") + "\n")
+        for key in ("path", "agent"):
+            shards = [list(AgentLogScorer().iter_score_jsonl(jsonl, shard=ShardSpec(i, 2, key))) for i in range(2)]
+            assert sum(len(results) for results in shards) == 40
+
+    def test_cli_shards_and_merge(self, logs_dir, tmp_path, capsys):
+        """N Shard-Läufe mit eigenen Ausgaben ergeben zusammengeführt den Gesamtlauf."""
+        out_dir = tmp_path / "out"
+        out_dir.mkdir()
+        main(["--batch", str(logs_dir), "--partial-output", str(out_dir / "all.json")])
+        for i in range(3):
+            main([
+                "--batch", str(logs_dir), "--shard", f"{i}/3", "--shard-key", "agent",
+                "--partial-output", str(out_dir / "part.json"), "-o", str(out_dir / "results.json")
+            ])
+        capsys.readouterr()
+
+        partials = sorted(out_dir.glob("part.shard*of3.json"))
+        assert len(partials) == 3 and len(list(out_dir.glob("results.shard*of3.json"))) == 3
+        main(["merge", *map(str, partials), "-o", str(out_dir / "merged.json")])
+        merged = StatisticsAggregate.load(out_dir / "merged.json")
+        assert merged.to_dict() == StatisticsAggregate.load(out_dir / "all.json").to_dict()
+
+        with pytest.raises(SystemExit):
+            main(["--batch", str(logs_dir), "--shard", "3/3"])
+
 
 class TestAlertSystem:
     """Tests für das Alert-System."""
@@ -294,6 +1834,157 @@ class TestAlertSystem:
         triggered = alert_system.check(result)
         assert triggered is False
 
+    @staticmethod
+    def _critical(agent_id="A1", violations=("Preis ohne STOP",)):
+        return ScoreResult(
+            agent_id=agent_id, contact=None, timestamp=None,
+            price_claim=True, price_keywords_found=["euro"],
+            legal_claim=True, legal_keywords_found=["gesetz"],
+            stop_triggered=False, placeholder_used=False,
+            risk=3, risk_level=RiskLevel.CRITICAL, violations=list(violations)
+        )
+
+    def test_identical_alerts_are_aggregated(self):
+        """Gleiche Alerts im Fenster werden einmal gemeldet und am Fensterende zusammengefasst."""
+        now = [0.0]
+        alert_system = AlertSystem(window=10.0, max_recent=5, clock=lambda: now[0])
+        for _ in range(10_000):
+            assert alert_system.check(self._critical())
+        alert_system.check(self._critical("A2"))
+        assert [a["agent_id"] for a in alert_system.get_alerts()] == ["A1", "A2"]
+
+        now[0] = 10.0
+        alert_system.check(self._critical("A3"))
+        alerts = alert_system.get_alerts()
+        assert [(a["agent_id"], a.get("repeats")) for a in alerts] == [
+            ("A1", None), ("A2", None), ("A1", 9999), ("A3", None)
+        ]
+        assert alert_system.get_stats()["triggered"] == 10_002
+        assert alert_system.get_stats()["aggregated"] == 9999
+
+        for i in range(20):
+            alert_system.check(self._critical(f"B{i}"))
+        assert len(alert_system.get_alerts()) == 5
+
+    def test_concurrent_checks(self, monkeypatch):
+        """check ist threadsicher: keine Ausnahmen, kein Alert geht in der Zählung verloren."""
+        # Ohne Logging-Handler (und deren Lock) laufen die Threads wirklich verschränkt
+        monkeypatch.setattr(logging.getLogger("agents.agent_log_scorer"), "disabled", True)
+        alert_system = AlertSystem(window=0, max_recent=100_000)
+        errors = []
+
+        def work(offset):
+            try:
+                for i in range(5000):
+                    alert_system.check(self._critical(f"A{(offset + i) % 4}"))
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=work, args=(n,)) for n in range(8)]
+        # Häufige Threadwechsel provozieren Wettläufe auf den offenen Fenstern
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            sys.setswitchinterval(switch_interval)
+        alert_system.flush()
+
+        assert errors == []
+        stats = alert_system.get_stats()
+        assert stats["triggered"] == 40_000
+        first_alerts = [a for a in alert_system.get_alerts() if "repeats" not in a]
+        assert len(first_alerts) + stats["aggregated"] == 40_000
+
+    def test_rate_limit(self):
+        """Gemeldete Alerts sind pro Sekunde begrenzt; unterdrückte werden gezählt."""
+        now = [0.0]
+        alert_system = AlertSystem(rate_limit=2, clock=lambda: now[0])
+        for i in range(10):
+            alert_system.check(self._critical(f"A{i}"))
+        assert alert_system.get_stats()["emitted"] == 2
+        assert alert_system.get_stats()["rate_limited"] == 8
+        now[0] = 1.0
+        alert_system.check(self._critical("late"))
+        assert alert_system.get_alerts()[-1]["agent_id"] == "late"
+
+    def test_sink_without_write_batch_fails_on_instantiation(self):
+        """Ein Sink ohne write_batch lässt sich nicht instanziieren."""
+
+        class IncompleteSink(AlertSink):
+            pass
+
+        with pytest.raises(TypeError):
+            IncompleteSink()
+
+    def test_sinks_are_batched_and_never_block(self, tmp_path):
+        """Sinks laufen gebündelt im Hintergrund; ein hängender Sink blockiert check nicht."""
+        release = threading.Event()
+
+        class BlockingSink(AlertSink):
+            def __init__(self):
+                self.batches = []
+
+            def write_batch(self, alerts):
+                release.wait(5)
+                self.batches.append(len(alerts))
+
+        sink = BlockingSink()
+        alert_system = AlertSystem(
+            sinks=[sink, FileAlertSink(tmp_path / "alerts.jsonl")], batch_size=50, flush_interval=0.05, queue_size=100
+        )
+        start = time.perf_counter()
+        for i in range(500):
+            alert_system.check(self._critical(f"A{i}"))
+        assert time.perf_counter() - start < 2
+        assert alert_system.get_stats()["dropped"] > 0
+
+        release.set()
+        alert_system.close()
+        delivered = 500 - alert_system.get_stats()["dropped"]
+        assert sum(sink.batches) == delivered
+        assert max(sink.batches) <= 50
+        lines = (tmp_path / "alerts.jsonl").read_text(encoding="utf-8").splitlines()
+        assert len(lines) == delivered and json.loads(lines[0])["risk_level"] == "CRITICAL"
+
+    def test_webhook_and_stream_sinks(self):
+        """Webhook- und Stream-Sink erhalten die Alerts als JSON."""
+        import http.server
+        import io
+
+        received = []
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            def do_POST(self):
+                received.append(json.loads(self.rfile.read(int(self.headers["Content-Length"]))))
+                self.send_response(204)
+                self.end_headers()
+
+            def log_message(self, *args):
+                pass
+
+        server = http.server.HTTPServer(("127.0.0.1", 0), Handler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        stream = io.StringIO()
+        try:
+            url = f"http://127.0.0.1:{server.server_address[1]}/alerts"
+            with AlertSystem(sinks=[WebhookAlertSink(url), StreamAlertSink(stream)], window=60) as alert_system:
+                for _ in range(3):
+                    alert_system.check(self._critical())
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        alerts = [alert for body in received for alert in body["alerts"]]
+        assert [alert.get("repeats") for alert in alerts] == [None, 2]
+        assert [json.loads(line)["agent_id"] for line in stream.getvalue().splitlines()] == ["A1", "A1"]
+        with pytest.raises(ValueError):
+            WebhookAlertSink("file:///etc/passwd")
+
 
 class TestValidateLogStructure:
     """Tests für die Input-Validierung (Legacy)."""
@@ -337,6 +2028,175 @@ class TestCheckKeywords:
         assert found is False
 
 
+class TestKeywordMatcher:
+    """Tests für den kompilierten Keyword-Matcher."""
+
+    @staticmethod
+    def _legacy(text, keywords):
+        text_lower = text.lower()
+        return [kw for kw in keywords if kw.lower() in text_lower]
+
+    @pytest.mark.parametrize("threshold", [0, 1000])
+    def test_overlapping_keywords(self, threshold):
+        """Überlappende und enthaltene Keywords werden alle gefunden."""
+        price = ["Rate", "raten", "$", "€", "euro"]
+        legal = ["recht", "rechtlich", "echt", "gesetz", "illegal", "legal"]
+        text = "Das ist RECHTLICH illegal und kostet 5$ in Raten"
+        matcher = KeywordMatcher(price, legal, trie_threshold=threshold)
+        assert matcher.uses_trie is (threshold == 0)
+        assert matcher.match(text) == (self._legacy(text, price), self._legacy(text, legal))
+
+    @pytest.mark.parametrize("threshold", [0, 1000])
+    def test_duplicates_and_empty_keyword(self, threshold):
+        """Duplikate, Groß-/Kleinschreibung und leere Keywords wie im Legacy-Verhalten."""
+        price = ["euro", "EURO", "", "euro"]
+        legal = ["euro", "vertrag"]
+        matcher = KeywordMatcher(price, legal, trie_threshold=threshold)
+        assert matcher.match("100 Euro") == (["euro", "EURO", "", "euro"], ["euro"])
+        assert matcher.match("") == ([""], [])
+
+    def test_randomized_equivalence(self):
+        """Trie- und Scan-Modus liefern dieselben Listen wie der Legacy-Test."""
+        import random
+        rng = random.Random(42)
+        alphabet = "abcäß€$ "
+        for _ in range(200):
+            price = ["".join(rng.choice(alphabet) for _ in range(rng.randint(1, 4))) for _ in range(8)]
+            legal = ["".join(rng.choice(alphabet) for _ in range(rng.randint(1, 4))) for _ in range(8)]
+            text = "".join(rng.choice(alphabet + "ABC") for _ in range(rng.randint(0, 40)))
+            expected = (self._legacy(text, price), self._legacy(text, legal))
+            claims = (bool(expected[0]), bool(expected[1]))
+            for threshold in (0, 1000):
+                matcher = KeywordMatcher(price, legal, trie_threshold=threshold)
+                assert matcher.match(text) == expected
+                assert matcher.has_claims(text) == claims
+
+    def test_turns_and_window_boundaries(self):
+        """Suche über Turns und Fenster entspricht dem verbundenen Text (Turn-Grenzen, Leerzeichen, Schluss-Sigma)."""
+        import random
+        rng = random.Random(7)
+        alphabet = "abΣσς İ"
+        for _ in range(300):
+            price = ["".join(rng.choice(alphabet) for _ in range(rng.randint(1, 5))) for _ in range(3)]
+            legal = ["".join(rng.choice(alphabet) for _ in range(rng.randint(1, 5))) for _ in range(3)]
+            turns = ["".join(rng.choice(alphabet + "AB") for _ in range(rng.randint(0, 12))) for _ in range(rng.randint(0, 6))]
+            text = " ".join(turns)
+            expected = (self._legacy(text, price), self._legacy(text, legal))
+            claims = (bool(expected[0]), bool(expected[1]))
+            for threshold in (0, 1000):
+                matcher = KeywordMatcher(price, legal, trie_threshold=threshold)
+                matcher.CHUNK_SIZE = rng.randint(1, 8)
+                assert matcher.match_turns(turns) == expected
+                assert matcher.has_claims_turns(turns) == claims
+                assert matcher.match(text) == expected
+                assert matcher.has_claims(text) == claims
+
+    @pytest.mark.parametrize("threshold", [0, 1000])
+    def test_has_claims_edge_cases(self, threshold):
+        """has_claims mit leerer Kategorie, leerem Keyword und Keywords in beiden Kategorien."""
+        assert KeywordMatcher([], ["gesetz"], trie_threshold=threshold).has_claims("Laut Gesetz") == (False, True)
+        assert KeywordMatcher(["", "euro"], [], trie_threshold=threshold).has_claims("") == (True, False)
+        shared = KeywordMatcher(["vertrag"], ["Vertrag"], trie_threshold=threshold)
+        assert shared.has_claims("Ihr VERTRAG") == (True, True)
+        assert shared.has_claims("nichts") == (False, False)
+
+    def test_config_matcher_is_cached_and_recompiled(self):
+        """Der Matcher wird pro Config gecacht und bei Keyword-Änderung neu gebaut."""
+        config = ScoringConfig()
+        matcher = config.get_keyword_matcher()
+        assert config.get_keyword_matcher() is matcher
+        config.price_keywords = config.price_keywords + ["angebot"]
+        new_matcher = config.get_keyword_matcher()
+        assert new_matcher is not matcher
+        assert "angebot" in new_matcher.match("Ein Angebot")[0]
+
+        # Änderungen an Ort und Stelle werden erst nach invalidate() wirksam
+        fingerprint, rules = config.fingerprint(), config.get_rules()
+        config.legal_keywords.append("klausel")
+        assert config.get_keyword_matcher() is new_matcher
+        assert config.fingerprint() == fingerprint and config.get_rules() is rules
+        config.invalidate()
+        assert "klausel" in config.get_keyword_matcher().match("Die Klausel")[1]
+        assert config.fingerprint() != fingerprint and config.get_rules() is not rules
+
+
+class TestCompiledRules:
+    """Tests für die vorkompilierten Flow-Validator-Regeln."""
+
+    def test_default_rules_compiled_at_load(self, caplog):
+        """Bekannte Freitext-Regeln werden kompiliert, unbekannte beim Laden gemeldet."""
+        yaml_path = Path(__file__).parent.parent / "agents" / "flow_validator_checklist.yaml"
+        with caplog.at_level("WARNING"):
+            config = ScoringConfig.from_yaml(yaml_path)
+        rules = config.get_rules()
+        assert [p.message for p in rules.predicates] == [
+            "Verstoß: price estimates without fact reference",
+            "Verstoß: legal promises without fact source",
+            "Fehlend: STOP_REQUIRED on price question",
+            "Fehlend: STOP_REQUIRED on legal question",
+            "Fehlend: Clear ending condition (END_CALL or LEAD_CAPTURE)",
+        ]
+        assert ("must_include", "PLACEHOLDER for timeline questions") in rules.unsupported
+        assert "PLACEHOLDER for timeline questions" in caplog.text
+        assert "END_CALL" not in caplog.text
+        assert rules.fields == {"price_claim", "legal_claim", "stop_triggered", "log.result"}
+
+    def test_violations_unchanged(self):
+        """Kritisches Log erzeugt dieselben Verstöße wie bisher; ein fehlendes Ende wird gemeldet."""
+        scorer = AgentLogScorer()
+        result = scorer.score_log({"agent_id": "A1", "transcript": ["Das kostet 100€ laut Gesetz"]})
+        assert result.violations == [
+            "Verstoß: price estimates without fact reference",
+            "Verstoß: legal promises without fact source",
+            "Fehlend: STOP_REQUIRED on price question",
+            "Fehlend: STOP_REQUIRED on legal question",
+            "Fehlend: Clear ending condition (END_CALL or LEAD_CAPTURE)",
+        ]
+        log = {"agent_id": "A1", "transcript": ["Guten Tag"], "result": "LEAD_CAPTURE"}
+        assert scorer.score_log(log).violations == []
+
+    def test_structured_rules(self):
+        """Strukturierte Regeln werden ohne Textvergleich über ihren Typ kompiliert."""
+        rules = CompiledRules({
+            "forbidden": [{"type": "forbidden_phrases", "phrases": ["Typically"], "description": "Annahmen"}],
+            "must_include": [
+                {"type": "result_marker", "markers": ["END_CALL", "LEAD_CAPTURE"], "description": "Abschluss"},
+                {"type": "gibt_es_nicht"},
+            ],
+        })
+        assert len(rules.predicates) == 2
+        assert rules.unsupported == [("must_include", {"type": "gibt_es_nicht"})]
+        result = AgentLogScorer().score_log({"agent_id": "A1"})
+        assert rules.check({"result": "LEAD_CAPTURE"}, "we typically do this", result) == ["Verstoß: Annahmen"]
+        assert rules.check({"result": "STOP_REQUIRED"}, "", result) == ["Fehlend: Abschluss"]
+
+    def test_rule_without_check_fails_on_instantiation(self):
+        """Eine Regelklasse ohne check lässt sich nicht instanziieren."""
+
+        class IncompleteRule(RulePredicate):
+            pass
+
+        with pytest.raises(TypeError):
+            IncompleteRule("unvollständig", "Verstoß")
+
+    def test_register_custom_rule_type(self):
+        """Neue Regeltypen lassen sich registrieren und per YAML verwenden."""
+
+        @register_rule_type("test_high_risk")
+        class HighRiskRule(RulePredicate):
+            fields = frozenset({"risk"})
+
+            def check(self, log, transcript, result):
+                return result.risk >= 2
+
+        try:
+            config = ScoringConfig(yaml_rules={"forbidden": [{"type": "test_high_risk", "description": "zu riskant"}]})
+            result = AgentLogScorer(config=config).score_log({"agent_id": "A1", "transcript": ["100€ laut Gesetz"]})
+            assert result.violations == ["Verstoß: zu riskant"]
+        finally:
+            RULE_TYPES.pop("test_high_risk", None)
+
+
 class TestGetRiskLevel:
     """Tests für die Risk-Level-Zuordnung."""
 